@@ -0,0 +1,6 @@
+"""
+Performance benchmarks of Graphene's hot paths, run with pytest-benchmark.
+
+    make benchmark-baseline  # save benchmarks/baseline.json
+    make benchmark           # compare against it, writing benchmark-results.json
+"""
@@ -0,0 +1,44 @@
+from graphql_relay import connection_from_array, offset_to_cursor
+from pytest import fixture, mark
+
+from graphene import Int
+from graphene.relay import Connection, ConnectionField
+
+ITEM_COUNT = 1_000_000
+
+
+@fixture(scope="module")
+def items():
+    return list(range(ITEM_COUNT))
+
+
+def test_connection_from_array_first_page(benchmark, items):
+    connection = benchmark(connection_from_array, items, {"first": 100})
+    assert len(connection.edges) == 100
+    assert connection.pageInfo.hasNextPage
+
+
+def test_connection_from_array_middle_page(benchmark, items):
+    args = {"first": 100, "after": offset_to_cursor(ITEM_COUNT // 2)}
+    connection = benchmark(connection_from_array, items, args)
+    assert connection.edges[0].node == ITEM_COUNT // 2 + 1
+
+
+def test_connection_from_array_last_page(benchmark, items):
+    connection = benchmark(connection_from_array, items, {"last": 100})
+    assert connection.edges[-1].node == ITEM_COUNT - 1
+
+
+@mark.parametrize("lightweight", [False, True], ids=["objecttypes", "lightweight"])
+def test_resolve_connection_1000_edges(benchmark, items, lightweight):
+    ItemConnection = type(
+        "ItemConnection",
+        (Connection,),
+        {"Meta": {"node": Int, "lightweight": lightweight}},
+    )
+
+    args = {"first": 1000, "after": offset_to_cursor(ITEM_COUNT // 2)}
+    connection = benchmark(
+        ConnectionField.resolve_connection, ItemConnection, args, items
+    )
+    assert len(connection.edges) == 1000
@@ -0,0 +1,27 @@
+from asyncio import gather, run
+
+from graphene.utils.dataloader import DataLoader
+
+KEY_COUNT = 10_000
+
+
+async def batch_load(keys):
+    return [key * 2 for key in keys]
+
+
+def test_dataloader_load_many_throughput(benchmark):
+    async def load_all():
+        loader = DataLoader(batch_load)
+        return await loader.load_many(range(KEY_COUNT))
+
+    result = benchmark(lambda: run(load_all()))
+    assert result[-1] == (KEY_COUNT - 1) * 2
+
+
+def test_dataloader_concurrent_loads_throughput(benchmark):
+    async def load_all():
+        loader = DataLoader(batch_load, max_batch_size=100)
+        return await gather(*(loader.load(key % 1000) for key in range(KEY_COUNT)))
+
+    result = benchmark(lambda: run(load_all()))
+    assert len(result) == KEY_COUNT
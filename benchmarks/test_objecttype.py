@@ -0,0 +1,43 @@
+from tracemalloc import get_traced_memory, start, stop
+
+from pytest import mark
+
+from graphene import Int, ObjectType, String
+
+INSTANCE_COUNT = 1_000_000
+
+
+class Row(ObjectType):
+    id = Int()
+    name = String()
+    value = Int()
+
+
+class SlottedRow(ObjectType):
+    id = Int()
+    name = String()
+    value = Int()
+
+    class Meta:
+        slots = True
+
+
+def create_rows(row_type):
+    return [row_type(id=index, name="row", value=index) for index in range(INSTANCE_COUNT)]
+
+
+def measure_memory(row_type):
+    start()
+    try:
+        rows = create_rows(row_type)
+        return get_traced_memory()[0], rows
+    finally:
+        stop()
+
+
+@mark.parametrize("row_type", [Row, SlottedRow], ids=["dict", "slots"])
+def test_create_1m_objecttype_instances(benchmark, row_type):
+    memory, rows = measure_memory(row_type)
+    benchmark.extra_info["memory_bytes"] = memory
+    rows = benchmark.pedantic(create_rows, args=(row_type,), rounds=3)
+    assert len(rows) == INSTANCE_COUNT
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from pytest import mark
+
+from graphene import DateTime, Float, Int, List, ObjectType, Schema, String
+
+ITEM_COUNT = 100_000
+
+values = {
+    "ints": list(range(ITEM_COUNT)),
+    "floats": [index / 3 for index in range(ITEM_COUNT)],
+    "strings": [f"item {index}" for index in range(ITEM_COUNT)],
+    "datetimes": [datetime(2020, 1, 1, index % 24) for index in range(ITEM_COUNT)],
+}
+
+
+class Query(ObjectType):
+    ints = List(Int)
+    floats = List(Float)
+    strings = List(String)
+    datetimes = List(DateTime)
+
+    def resolve_ints(root, info):
+        return values["ints"]
+
+    def resolve_floats(root, info):
+        return values["floats"]
+
+    def resolve_strings(root, info):
+        return values["strings"]
+
+    def resolve_datetimes(root, info):
+        return values["datetimes"]
+
+
+schema = Schema(query=Query)
+
+
+@mark.parametrize("field", ["ints", "floats", "strings", "datetimes"])
+def test_big_scalar_list_serialization(benchmark, field):
+    result = benchmark(schema.execute, f"{{ {field} }}")
+    assert not result.errors
+    assert len(result.data[field]) == ITEM_COUNT
+
+
+@mark.parametrize("scalar", [Int, Float, String], ids=lambda scalar: scalar.__name__)
+def test_scalar_serialize(benchmark, scalar):
+    serialize = scalar.serialize
+    result = benchmark(lambda: [serialize(value) for value in values["ints"]])
+    assert len(result) == ITEM_COUNT
@@ -0,0 +1,106 @@
+from tracemalloc import get_traced_memory, start, stop
+
+from pytest import mark
+
+from graphene import Field, Int, List, ObjectType, Schema, String
+from graphene.types.schema import TypeMap
+
+
+def build_query_type(type_count, field_count):
+    fields = {f"field{index}": String() for index in range(field_count)}
+    fields["count"] = Int()
+    types = []
+    for index in range(type_count):
+        attrs = dict(fields)
+        if types:
+            attrs["previous"] = Field(types[-1])
+            attrs["siblings"] = List(types[-1])
+        types.append(type(f"Type{index}", (ObjectType,), attrs))
+    return type(
+        "Query",
+        (ObjectType,),
+        {f"type{index}": Field(type_) for index, type_ in enumerate(types)},
+    )
+
+
+def build_type_map(query):
+    # The fields of the types are thunks, resolved (and their types added to the map) when
+    # read: read them until no type is added.
+    type_map = TypeMap(query)
+    built = 0
+    while built < len(type_map):
+        types = list(type_map.values())[built:]
+        built = len(type_map)
+        for graphql_type in types:
+            getattr(graphql_type, "fields", None)
+    return type_map
+
+
+def test_type_map_build_500_types(benchmark):
+    query = build_query_type(500, 20)
+    type_map = benchmark(build_type_map, query)
+    assert len([name for name in type_map if name.startswith("Type")]) == 500
+
+
+def test_schema_build_2000_types(benchmark):
+    query = build_query_type(2000, 10)
+    schema = benchmark(Schema, query)
+    assert schema.graphql_schema.get_type("Type1999")
+
+
+def build_leaf_query(type_count):
+    leaves = [
+        type(f"Leaf{index}", (ObjectType,), {"value": String(), "index": Int()})
+        for index in range(type_count)
+    ]
+    return type(
+        "LeafQuery",
+        (ObjectType,),
+        {f"leaf_{index}": Field(leaf) for index, leaf in enumerate(leaves)},
+    )
+
+
+LEAF_QUERY = build_leaf_query(5000)
+
+
+def build_eager(schema):
+    return schema
+
+
+def build_on_first_access(schema):
+    schema.graphql_schema
+    return schema
+
+
+def build_on_first_execute(schema):
+    assert not schema.execute("{ leaf0 { value } }").errors
+    return schema
+
+
+def measure_memory(defer_build, build):
+    start()
+    try:
+        schema = build(Schema(LEAF_QUERY, defer_build=defer_build))
+        return get_traced_memory()[0], schema
+    finally:
+        stop()
+
+
+@mark.benchmark(group="schema-5000-types")
+@mark.parametrize(
+    "defer_build,build",
+    [
+        (False, build_eager),
+        (True, build_on_first_access),
+        (True, build_on_first_execute),
+    ],
+    ids=["eager", "deferred-first-access", "deferred-first-execute"],
+)
+def test_schema_build_5000_types_deferred(benchmark, defer_build, build):
+    memory, _ = measure_memory(defer_build, build)
+    benchmark.extra_info["memory_bytes"] = memory
+    schema = benchmark.pedantic(
+        lambda: build(Schema(LEAF_QUERY, defer_build=defer_build)), rounds=5
+    )
+    assert schema.is_built
+    assert len(schema.graphql_schema.query_type.fields) == 5000
@@ -0,0 +1,74 @@
+from pytest import fixture
+
+from examples.starwars import data
+from examples.starwars.schema import Human, schema
+
+CHARACTER_COUNT = 2000
+FRIEND_COUNT = 10
+
+
+@fixture(scope="module", autouse=True)
+def scaled_data():
+    data.setup()
+    ids = [str(3000 + index) for index in range(CHARACTER_COUNT)]
+    for index, id_ in enumerate(ids):
+        data.human_data[id_] = Human(
+            id=id_,
+            name=f"Human {index}",
+            friends=[ids[(index + step) % len(ids)] for step in range(1, FRIEND_COUNT)],
+            appears_in=[4, 5, 6],
+            home_planet="Tatooine",
+        )
+    data.human_data["1000"].friends = ids[:500]
+    yield
+    data.setup()
+
+
+def test_starwars_wide_query(benchmark):
+    query = """
+    query Wide {
+      hero(episode: EMPIRE) {
+        id
+        name
+        friends {
+          id
+          name
+          appearsIn
+          ... on Human {
+            homePlanet
+          }
+          friends {
+            id
+            name
+          }
+        }
+      }
+    }
+    """
+    result = benchmark(schema.execute, query)
+    assert not result.errors
+    assert len(result.data["hero"]["friends"]) == 500
+
+
+def test_starwars_deep_query(benchmark):
+    query = """
+    query Deep {
+      human(id: "3000") {
+        friends {
+          name
+          friends {
+            name
+            friends {
+              name
+              friends {
+                name
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+    result = benchmark(schema.execute, query)
+    assert not result.errors
+    assert len(result.data["human"]["friends"]) == FRIEND_COUNT - 1
@@ -0,0 +1,72 @@
+from pytest import fixture
+
+from examples.starwars_relay import data
+from examples.starwars_relay.schema import Ship, schema
+
+SHIP_COUNT = 10_000
+
+
+@fixture(scope="module", autouse=True)
+def scaled_data():
+    data.setup()
+    rebels = data.data["Faction"]["1"]
+    for index in range(SHIP_COUNT):
+        ship = Ship(id=str(100 + index), name=f"Ship {index}")
+        data.data["Ship"][ship.id] = ship
+        rebels.ships.append(ship.id)
+    yield
+    data.setup()
+
+
+def test_starwars_relay_connection_page(benchmark):
+    query = """
+    query RebelsShips {
+      rebels {
+        name
+        ships(first: 1000) {
+          pageInfo {
+            startCursor
+            endCursor
+            hasNextPage
+          }
+          edges {
+            cursor
+            node {
+              id
+              name
+            }
+          }
+        }
+      }
+    }
+    """
+    result = benchmark(schema.execute, query)
+    assert not result.errors
+    assert len(result.data["rebels"]["ships"]["edges"]) == 1000
+
+
+def test_starwars_relay_node_query(benchmark):
+    query = """
+    query Nodes {
+      rebels {
+        ships(first: 100) {
+          edges {
+            node {
+              id
+            }
+          }
+        }
+      }
+    }
+    """
+
+    def fetch_nodes():
+        edges = schema.execute(query).data["rebels"]["ships"]["edges"]
+        ids = [edge["node"]["id"] for edge in edges]
+        return schema.execute(
+            "query Node($id: ID!) { node(id: $id) { id ... on Ship { name } } }",
+            variables={"id": ids[-1]},
+        )
+
+    result = benchmark(fetch_nodes)
+    assert not result.errors
@@ -0,0 +1,98 @@
+from functools import partial
+
+from pytest import mark
+
+from ..data import setup
+from ..schema import schema
+
+setup()
+
+NESTED_QUERY = """
+    query NestedQuery($episode: Episode, $withFriends: Boolean!) {
+      hero(episode: $episode) {
+        name
+        friends @include(if: $withFriends) {
+          name
+          appearsIn
+          friends {
+            name
+            ... on Human {
+              homePlanet
+            }
+          }
+        }
+      }
+      luke: human(id: "1000") {
+        name
+        homePlanet
+      }
+    }
+"""
+
+WIDE_QUERY = """
+    query WideQuery {
+      hero {
+        id
+        name
+        appearsIn
+        friends {
+          id
+          name
+          appearsIn
+          friends {
+            id
+            name
+            appearsIn
+            friends {
+              id
+              name
+              appearsIn
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+@mark.parametrize(
+    "variables",
+    [
+        {"episode": "NEWHOPE", "withFriends": True},
+        {"episode": "EMPIRE", "withFriends": True},
+        {"episode": "JEDI", "withFriends": False},
+    ],
+)
+def test_compiled_query_matches_execute(variables):
+    compiled = schema.compile(NESTED_QUERY)
+
+    assert compiled.execute(variables=variables) == schema.execute(
+        NESTED_QUERY, variables=variables
+    )
+
+
+def test_compiled_query_errors_match_execute():
+    compiled = schema.compile(NESTED_QUERY)
+
+    result = compiled.execute(variables={"episode": "PHANTOM"})
+
+    assert result.errors
+    assert result == schema.execute(NESTED_QUERY, variables={"episode": "PHANTOM"})
+
+
+@mark.asyncio
+async def test_compiled_query_execute_async():
+    compiled = schema.compile(WIDE_QUERY)
+
+    assert await compiled.execute_async() == schema.execute(WIDE_QUERY)
+
+
+def test_generic_execution_benchmark(benchmark):
+    result = benchmark(partial(schema.execute, WIDE_QUERY))
+    assert not result.errors
+
+
+def test_compiled_execution_benchmark(benchmark):
+    compiled = schema.compile(WIDE_QUERY)
+    result = benchmark(compiled.execute)
+    assert result == schema.execute(WIDE_QUERY)
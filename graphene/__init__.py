@@ -19,6 +19,7 @@ from .types import (
     Base64,
     BigInt,
     Boolean,
+    CacheHint,
     Context,
     Date,
     DateTime,
@@ -58,6 +59,7 @@ __all__ = [
     "BigInt",
     "BaseGlobalIDType",
     "Boolean",
+    "CacheHint",
     "ClientIDMutation",
     "Connection",
     "ConnectionField",
@@ -1,8 +1,10 @@
 import re
+from binascii import b2a_base64
+from collections import namedtuple
 from collections.abc import Iterable
 from functools import partial
 from typing import Type
-from graphql_relay import connection_from_array
+from graphql_relay import connection_from_array, get_offset_with_default
 from ..types import Boolean, Enum, Int, Interface, List, NonNull, Scalar, String, Union
 from ..types.field import Field
 from ..types.objecttype import ObjectType, ObjectTypeOptions
@@ -39,16 +41,70 @@ def page_info_adapter(startCursor, endCursor, hasPreviousPage, hasNextPage):
         has_next_page=hasNextPage
     )
 
+EdgeTuple = namedtuple('EdgeTuple', ('node', 'cursor'))
+PageInfoTuple = namedtuple('PageInfoTuple', ('start_cursor', 'end_cursor', 'has_previous_page', 'has_next_page'))
+new_edge_tuple = partial(tuple.__new__, EdgeTuple)
+
+def lightweight_connection_from_array(data, args, connection_type):
+    """
+    Same as ``connection_from_array`` from ``graphql_relay`` (same slicing and cursors), but
+    creates the edges and the page info of the connection as ``EdgeTuple`` and ``PageInfoTuple``.
+    """
+    before = args.get('before')
+    after = args.get('after')
+    first = args.get('first')
+    last = args.get('last')
+    array_length = len(data)
+    start_offset = 0
+    end_offset = array_length
+    after_offset = get_offset_with_default(after, -1)
+    if 0 <= after_offset < array_length:
+        start_offset = after_offset + 1
+    before_offset = get_offset_with_default(before, end_offset)
+    if 0 <= before_offset < array_length:
+        end_offset = min(end_offset, before_offset)
+    if isinstance(first, int):
+        if first < 0:
+            raise ValueError("Argument 'first' must be a non-negative integer.")
+        end_offset = min(end_offset, start_offset + first)
+    if isinstance(last, int):
+        if last < 0:
+            raise ValueError("Argument 'last' must be a non-negative integer.")
+        start_offset = max(start_offset, end_offset - last)
+    nodes = data[start_offset:end_offset]
+    cursors = [b2a_base64(b'arrayconnection:%d' % offset, newline=False).decode('ascii') for offset in range(start_offset, start_offset + len(nodes))]
+    edges = list(map(new_edge_tuple, zip(nodes, cursors)))
+    lower_bound = after_offset + 1 if after else 0
+    upper_bound = before_offset if before else array_length
+    page_info = PageInfoTuple(cursors[0] if cursors else None, cursors[-1] if cursors else None, isinstance(last, int) and start_offset > lower_bound, isinstance(first, int) and end_offset < upper_bound)
+    return connection_type(edges=edges, page_info=page_info)
+
 class ConnectionOptions(ObjectTypeOptions):
     node = None
+    lightweight = False
 
 class Connection(ObjectType):
+    """
+    Relay connection of nodes of the ``node`` type given in its Meta, with its ``edges`` and
+    ``page_info``.
+
+    Meta class options (optional):
+        strict_types (bool): Make the edges and their nodes non-null. Default False.
+        lightweight (bool): Represent the edges and the page info of the connections resolved
+            by a ``ConnectionField`` from iterables as named tuples (``EdgeTuple`` and
+            ``PageInfoTuple``) rather than ``Edge`` and ``PageInfo`` instances, which are much
+            cheaper to create for large pages. Their fields resolve the same way. Default False.
+
+    Connections have slots for their fields and for the ``iterable`` they are resolved from,
+    so their subclasses can use the ``slots`` option of ObjectType.
+    """
+    __slots__ = ('edges', 'page_info', 'iterable')
 
     class Meta:
         abstract = True
 
     @classmethod
-    def __init_subclass_with_meta__(cls, node=None, name=None, strict_types=False, _meta=None, **options):
+    def __init_subclass_with_meta__(cls, node=None, name=None, strict_types=False, lightweight=False, _meta=None, **options):
         if not _meta:
             _meta = ConnectionOptions(cls)
         assert node, f'You have to provide a node in {cls.__name__}.Meta'
@@ -58,6 +114,7 @@ class Connection(ObjectType):
             name = f'{base_name}Connection'
         options['name'] = name
         _meta.node = node
+        _meta.lightweight = lightweight
         if not _meta.fields:
             _meta.fields = {}
         if 'page_info' not in _meta.fields:
@@ -80,4 +137,39 @@ class IterableConnectionField(Field):
         kwargs.setdefault('first', Int())
         kwargs.setdefault('last', Int())
         super(IterableConnectionField, self).__init__(type_, *args, **kwargs)
+
+    @property
+    def type(self):
+        type_ = super(IterableConnectionField, self).type
+        connection_type = type_
+        if isinstance(type_, NonNull):
+            connection_type = type_.of_type
+        if is_node(connection_type):
+            raise Exception('ConnectionFields now need a explicit ConnectionType for Nodes.\nRead more: https://github.com/graphql-python/graphene/blob/v2.0.0/UPGRADE-v2.0.md#node-connections')
+        assert issubclass(connection_type, Connection), f'{self.__class__.__name__} type has to be a subclass of Connection. Received "{connection_type}".'
+        return type_
+
+    @classmethod
+    def resolve_connection(cls, connection_type, args, resolved):
+        if isinstance(resolved, connection_type):
+            return resolved
+        assert isinstance(resolved, Iterable), f'Resolved value from the connection field has to be an iterable or instance of {connection_type}. Received "{resolved}"'
+        if connection_type._meta.lightweight:
+            connection = lightweight_connection_from_array(resolved, args, connection_type)
+        else:
+            connection = connection_from_array(resolved, args, connection_type=partial(connection_adapter, connection_type), edge_type=connection_type.Edge, page_info_type=page_info_adapter)
+        connection.iterable = resolved
+        return connection
+
+    @classmethod
+    def connection_resolver(cls, resolver, connection_type, root, info, **args):
+        resolved = resolver(root, info, **args)
+        if isinstance(connection_type, NonNull):
+            connection_type = connection_type.of_type
+        on_resolve = partial(cls.resolve_connection, connection_type, args)
+        return maybe_thenable(resolved, on_resolve)
+
+    def wrap_resolve(self, parent_resolver):
+        resolver = super(IterableConnectionField, self).wrap_resolve(parent_resolver)
+        return partial(self.connection_resolver, resolver, self.type)
 ConnectionField = IterableConnectionField
\ No newline at end of file
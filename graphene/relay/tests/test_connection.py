@@ -1,5 +1,6 @@
 import re
 
+from graphql_relay import offset_to_cursor
 from pytest import raises
 
 from ...types import Argument, Field, Int, List, NonNull, ObjectType, Schema, String
@@ -8,6 +9,8 @@ from ..connection import (
     ConnectionField,
     PageInfo,
     ConnectionOptions,
+    EdgeTuple,
+    PageInfoTuple,
     get_edge_class,
 )
 from ..node import Node
@@ -316,3 +319,51 @@ def test_connectionfield_strict_types():
 
     node_field = edges_list_element_type.of_type._meta.fields["node"]
     assert isinstance(node_field.type, NonNull)
+
+
+def test_slotted_connection():
+    for is_lightweight in (False, True):
+
+        class SlottedConnection(Connection):
+            class Meta:
+                node = MyObject
+                lightweight = is_lightweight
+                slots = True
+
+        objects = [MyObject(field=str(index)) for index in range(3)]
+        connection = ConnectionField.resolve_connection(
+            SlottedConnection, {"first": 2}, objects
+        )
+        assert not hasattr(connection, "__dict__")
+        assert connection.iterable is objects
+        assert [edge.node for edge in connection.edges] == objects[:2]
+        assert connection.page_info.has_next_page
+
+
+def test_lightweight_connection_edges_are_tuples():
+    class MyObjectConnection(Connection):
+        class Meta:
+            node = MyObject
+            lightweight = True
+
+    class ReferenceConnection(Connection):
+        class Meta:
+            node = MyObject
+
+    objects = [MyObject(field=str(index)) for index in range(10)]
+    args = {"first": 3, "after": offset_to_cursor(4)}
+    connection = ConnectionField.resolve_connection(MyObjectConnection, args, objects)
+    assert isinstance(connection, MyObjectConnection)
+    assert connection.iterable is objects
+    assert connection.edges == [
+        EdgeTuple(objects[index], offset_to_cursor(index)) for index in range(5, 8)
+    ]
+    assert connection.page_info == PageInfoTuple(
+        offset_to_cursor(5), offset_to_cursor(7), False, True
+    )
+
+    reference = ConnectionField.resolve_connection(ReferenceConnection, args, objects)
+    assert [(edge.node, edge.cursor) for edge in reference.edges] == [
+        tuple(edge) for edge in connection.edges
+    ]
+    assert reference.page_info.end_cursor == connection.page_info.end_cursor
@@ -21,8 +21,15 @@ class LetterConnection(Connection):
         node = Letter
 
 
+class LightweightLetterConnection(Connection):
+    class Meta:
+        node = Letter
+        lightweight = True
+
+
 class Query(ObjectType):
     letters = ConnectionField(LetterConnection)
+    lightweight_letters = ConnectionField(LightweightLetterConnection)
     connection_letters = ConnectionField(LetterConnection)
     async_letters = ConnectionField(LetterConnection)
 
@@ -31,6 +38,9 @@ class Query(ObjectType):
     def resolve_letters(self, info, **args):
         return list(letters.values())
 
+    def resolve_lightweight_letters(self, info, **args):
+        return list(letters.values())
+
     async def resolve_async_letters(self, info, **args):
         return list(letters.values())
 
@@ -284,3 +294,42 @@ async def test_connection_async():
             "pageInfo": {"hasPreviousPage": False, "hasNextPage": True},
         }
     }
+
+
+@mark.parametrize(
+    "args",
+    [
+        "",
+        "first: 2",
+        "last: 2",
+        'first: 2, after: "YXJyYXljb25uZWN0aW9uOjE="',
+        'last: 2, before: "YXJyYXljb25uZWN0aW9uOjM="',
+        'first: 10, after: "invalid"',
+        'after: "YXJyYXljb25uZWN0aW9uOjM=", before: "YXJyYXljb25uZWN0aW9uOjE="',
+    ],
+)
+def test_lightweight_connection_same_output(args):
+    query = """
+    {
+        %s%s {
+            edges {
+                node {
+                    id
+                    letter
+                }
+                cursor
+            }
+            pageInfo {
+                hasPreviousPage
+                hasNextPage
+                startCursor
+                endCursor
+            }
+        }
+    }
+    """
+    args = f"({args})" if args else ""
+    result = schema.execute(query % ("letters", args))
+    lightweight_result = schema.execute(query % ("lightweightLetters", args))
+    assert not lightweight_result.errors
+    assert lightweight_result.data["lightweightLetters"] == result.data["letters"]
@@ -3,6 +3,7 @@ from graphql import GraphQLResolveInfo as ResolveInfo
 
 from .argument import Argument
 from .base64 import Base64
+from .cache_control import CacheHint
 from .context import Context
 from .datetime import Date, DateTime, Time
 from .decimal import Decimal
@@ -26,6 +27,7 @@ __all__ = [
     "Base64",
     "BigInt",
     "Boolean",
+    "CacheHint",
     "Context",
     "Date",
     "DateTime",
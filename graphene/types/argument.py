@@ -6,26 +6,30 @@ from .structures import NonNull
 from .utils import get_type
 
 def to_arguments(args, extra_args=None):
-    """
-    Convert arguments to a list of Argument instances.
-    """
     from .unmountedtype import UnmountedType
-
-    extra_args = extra_args or {}
-    arguments = []
-
-    for name, value in chain(args.items(), extra_args.items()):
-        if isinstance(value, Argument):
-            argument = value
-            if argument.name is None:
-                argument.name = name
-        elif isinstance(value, (UnmountedType, Dynamic)):
-            argument = Argument(value, name=name)
-        else:
-            raise ValueError(f'Unknown argument "{name}" of type {type(value)}')
-        arguments.append(argument)
-
-    return sorted(arguments, key=lambda x: x.creation_counter)
+    from .field import Field
+    from .inputfield import InputField
+    if extra_args:
+        extra_args = sorted(extra_args.items(), key=lambda f: f[1])
+    else:
+        extra_args = []
+    iter_arguments = chain(args.items(), extra_args)
+    arguments = {}
+    for default_name, arg in iter_arguments:
+        if isinstance(arg, Dynamic):
+            arg = arg.get_type()
+            if arg is None:
+                continue
+        if isinstance(arg, UnmountedType):
+            arg = Argument.mounted(arg)
+        if isinstance(arg, (InputField, Field)):
+            raise ValueError(f'Expected {default_name} to be Argument, but received {type(arg).__name__}. Try using Argument({arg.type}).')
+        if not isinstance(arg, Argument):
+            raise ValueError(f'Unknown argument "{default_name}".')
+        arg_name = default_name or arg.name
+        assert arg_name not in arguments, f'More than one Argument have same name "{arg_name}".'
+        arguments[arg_name] = arg
+    return arguments
 
 class Argument(MountedType):
     """
@@ -73,5 +77,9 @@ class Argument(MountedType):
         self.description = description
         self.deprecation_reason = deprecation_reason
 
+    @property
+    def type(self):
+        return get_type(self._type)
+
     def __eq__(self, other):
         return isinstance(other, Argument) and (self.name == other.name and self.type == other.type and (self.default_value == other.default_value) and (self.description == other.description) and (self.deprecation_reason == other.deprecation_reason))
\ No newline at end of file
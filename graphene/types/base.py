@@ -26,6 +26,7 @@ class BaseOptions:
 BaseTypeMeta = SubclassWithMeta_Meta
 
 class BaseType(SubclassWithMeta):
+    __slots__ = ()
 
     @classmethod
     def __init_subclass_with_meta__(cls, name=None, description=None, _meta=None, **_kwargs):
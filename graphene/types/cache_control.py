@@ -0,0 +1,152 @@
+"""
+Cache-control hints declared on fields and object types, combined into the HTTP cache policy of
+each response.
+"""
+from collections import namedtuple
+from graphql import ExecutionResult, get_named_type, is_abstract_type, is_composite_type, is_object_type
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode
+from .utils import get_graphene_field
+PUBLIC = 'PUBLIC'
+PRIVATE = 'PRIVATE'
+
+class CacheHint(namedtuple('CacheHint', 'max_age,scope')):
+    """
+    Cache-control hint of a field (``Field(cache_control=...)``) or of the fields returning an
+    object type (``cache_control`` Meta option).
+
+    Args:
+        max_age (int, optional): Number of seconds the value can be cached for. A hint without
+            ``max_age`` only sets the scope.
+        scope (str, optional): ``PUBLIC`` (default) if the value can be shared by every client,
+            ``PRIVATE`` if it depends on who is asking.
+    """
+    __slots__ = ()
+
+    def __new__(cls, max_age=None, scope=None):
+        assert scope in (None, PUBLIC, PRIVATE), f'Invalid cache scope "{scope}", expected "{PUBLIC}" or "{PRIVATE}".'
+        return super().__new__(cls, max_age, scope)
+
+class CachePolicy(namedtuple('CachePolicy', 'max_age,scope')):
+    """The cache policy of a response: the lowest ``max_age`` of its fields, ``PRIVATE`` if any of them is."""
+    __slots__ = ()
+
+    @property
+    def cacheable(self):
+        return self.max_age > 0
+
+    def http_header(self):
+        """Returns the value of the ``Cache-Control`` header of the response."""
+        if not self.cacheable:
+            return 'no-store'
+        return f'max-age={self.max_age}, {self.scope.lower()}'
+
+class CacheControlledExecutionResult(ExecutionResult):
+    """``ExecutionResult`` carrying the ``cache_policy`` of the response."""
+    __slots__ = ('cache_policy',)
+
+    def __init__(self, data=None, errors=None, extensions=None, cache_policy=None):
+        super().__init__(data, errors, extensions)
+        self.cache_policy = cache_policy
+
+def get_field_cache_hint(parent_type, field_name):
+    field = get_graphene_field(parent_type, field_name)
+    return getattr(field, 'cache_control', None)
+
+def get_type_cache_hint(graphql_schema, graphql_type):
+    """
+    Returns the hint of the fields returning ``graphql_type``: the ``cache_control`` Meta option
+    of its object type or, for interfaces and unions, the most restrictive of the hints of their
+    possible types if they all have one.
+    """
+    if is_object_type(graphql_type):
+        meta = getattr(getattr(graphql_type, 'graphene_type', None), '_meta', None)
+        return getattr(meta, 'cache_control', None)
+    if is_abstract_type(graphql_type):
+        hints = [get_type_cache_hint(graphql_schema, possible_type) for possible_type in graphql_schema.get_possible_types(graphql_type)]
+        if not hints or None in hints:
+            return None
+        return CacheHint(min((hint.max_age for hint in hints if hint.max_age is not None), default=None), PRIVATE if any((hint.scope == PRIVATE for hint in hints)) else None)
+    return None
+
+def has_cache_hints(graphql_schema):
+    """Check if any field or object type of a schema declares a cache-control hint."""
+    for graphql_type in graphql_schema.type_map.values():
+        graphene_type = getattr(graphql_type, 'graphene_type', None)
+        meta = getattr(graphene_type, '_meta', None)
+        if getattr(meta, 'cache_control', None) is not None:
+            return True
+        for field in (getattr(meta, 'fields', None) or {}).values():
+            if getattr(field, 'cache_control', None) is not None:
+                return True
+    return False
+
+class CachePolicyCalculator:
+    """
+    Computes the cache policy of an operation from the hints of the fields it selects, without
+    executing it, following the Apollo cache control rules: root fields and fields returning
+    object types get ``default_max_age`` unless their field or their type has a hint, while
+    scalar fields without hint don't restrict the policy. All the fields of abstract
+    selections and of ``@skip``/``@include`` selections are taken into account, so the policy
+    is never more permissive than the one of the executed fields.
+
+    Args:
+        graphql_schema (GraphQLSchema): Schema the operation was validated against.
+        fragments (Dict[str, FragmentDefinitionNode]): Fragments of the document.
+        default_max_age (int): Max age of the root and object fields without hint. Default 0.
+    """
+
+    def __init__(self, graphql_schema, fragments, default_max_age=0):
+        self.schema = graphql_schema
+        self.fragments = fragments
+        self.default_max_age = default_max_age
+        self.max_age = None
+        self.private = False
+        self._visited = set()
+
+    def get_policy(self, operation):
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is not None:
+            self.visit_selection_set(root_type, operation.selection_set, True)
+        return CachePolicy(self.default_max_age if self.max_age is None else self.max_age, PRIVATE if self.private else PUBLIC)
+
+    def restrict(self, hint):
+        if hint.max_age is not None and (self.max_age is None or hint.max_age < self.max_age):
+            self.max_age = hint.max_age
+        if hint.scope == PRIVATE:
+            self.private = True
+
+    def visit_selection_set(self, parent_type, selection_set, is_root=False):
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                self.visit_field(parent_type, selection, is_root)
+            elif isinstance(selection, InlineFragmentNode):
+                type_condition = self.schema.get_type(selection.type_condition.name.value) if selection.type_condition else parent_type
+                self.visit_selection_set(type_condition or parent_type, selection.selection_set, is_root)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is None or (fragment.name.value, is_root) in self._visited:
+                    continue
+                self._visited.add((fragment.name.value, is_root))
+                type_condition = self.schema.get_type(fragment.type_condition.name.value)
+                if type_condition is not None:
+                    self.visit_selection_set(type_condition, fragment.selection_set, is_root)
+
+    def visit_field(self, parent_type, node, is_root):
+        field_name = node.name.value
+        field_def = getattr(parent_type, 'fields', {}).get(field_name)
+        if field_def is None:
+            return
+        field_type = get_named_type(field_def.type)
+        hint = get_field_cache_hint(parent_type, field_name)
+        if is_composite_type(field_type):
+            type_hint = get_type_cache_hint(self.schema, field_type)
+            if hint is None:
+                hint = type_hint
+            elif hint.max_age is None and type_hint is not None:
+                hint = CacheHint(type_hint.max_age, hint.scope or type_hint.scope)
+        if hint is not None:
+            self.restrict(hint)
+        if (hint is None or hint.max_age is None) and (is_root or is_composite_type(field_type)):
+            self.restrict(CacheHint(self.default_max_age))
+        if node.selection_set is not None and is_composite_type(field_type):
+            self.visit_selection_set(field_type, node.selection_set)
@@ -0,0 +1,188 @@
+from collections import namedtuple
+from inspect import isawaitable
+from graphql import execute, execute_sync, get_operation_ast, located_error, visit, ExecutionContext, FragmentDefinitionNode, GraphQLError, OperationType, Visitor, VariableNode
+from graphql.execution.collect_fields import collect_fields, collect_sub_fields
+from graphql.execution.execute import get_field_def
+from graphql.execution.values import get_argument_values
+from graphql.pyutils import Undefined
+FieldPlan = namedtuple('FieldPlan', 'field_def,return_type,resolve_fn,args')
+
+class _VariableDependencyVisitor(Visitor):
+    """Records whether any directive of a document takes a variable as argument."""
+
+    def __init__(self):
+        super().__init__()
+        self.variable_directives = False
+
+    def enter_directive(self, node, *_args):
+        for argument in node.arguments or ():
+            if _has_variable(argument.value):
+                self.variable_directives = True
+                return self.BREAK
+
+def _has_variable(value_node):
+    """Check if a value node is or contains a variable reference."""
+    if isinstance(value_node, VariableNode):
+        return True
+    values = getattr(value_node, 'values', None)
+    if values is not None:
+        return any((_has_variable(value) for value in values))
+    fields = getattr(value_node, 'fields', None)
+    if fields is not None:
+        return any((_has_variable(field.value) for field in fields))
+    return False
+
+class CompiledQuery:
+    """
+    A validated operation compiled into a reusable execution plan, created with
+    ``Schema.compile``.
+
+    The plan memoizes, across executions, the work graphql-core's executor otherwise
+    repeats on every request:
+
+    - the field definition, return type and resolver (as built by ``Field.wrap_resolve``)
+      of every field node, per parent type;
+    - the coerced arguments of fields whose arguments are all literals, so only fields
+      receiving variables coerce arguments at execution time;
+    - the fields collected for every selection set, unless ``@skip`` or ``@include``
+      directives depend on variables.
+
+    Constant arguments are shared between executions, so resolvers must not mutate the
+    input lists or objects they receive. Executing the plan returns the same
+    ``ExecutionResult`` as ``Schema.execute`` with the same document.
+
+    Args:
+        schema (graphene.Schema): Schema the document was validated against.
+        document (DocumentNode): Validated document.
+        operation_name (str, optional): Operation of the document to compile. Can be
+            omitted if the document contains only one operation.
+    """
+
+    def __init__(self, schema, document, operation_name=None):
+        operation = get_operation_ast(document, operation_name)
+        if operation is None:
+            if operation_name:
+                raise GraphQLError(f"Unknown operation named '{operation_name}'.")
+            raise GraphQLError('Must provide an operation name if query contains multiple operations.')
+        self.schema = schema
+        self.document = document
+        self.operation = operation
+        self.operation_name = operation_name
+        self.fragments = {definition.name.value: definition for definition in document.definitions if isinstance(definition, FragmentDefinitionNode)}
+        visitor = _VariableDependencyVisitor()
+        visit(document, visitor)
+        self.static_fields = not visitor.variable_directives
+        self.field_plans = {}
+        self.collected_fields = {}
+        self.execution_context_class = type('CompiledExecutionContext', (CompiledExecutionContext,), {'compiled_query': self})
+
+    def get_field_plan(self, parent_type, field_node):
+        """Returns the ``FieldPlan`` of a field node on the given parent type."""
+        key = (parent_type, id(field_node))
+        plan = self.field_plans.get(key)
+        if plan is None:
+            field_def = get_field_def(self.schema.graphql_schema, parent_type, field_node)
+            if field_def is None:
+                return None
+            args = None
+            if not any((_has_variable(argument.value) for argument in field_node.arguments or ())):
+                try:
+                    args = get_argument_values(field_def, field_node)
+                except GraphQLError:
+                    args = None
+            plan = FieldPlan(field_def, field_def.type, field_def.resolve, args)
+            self.field_plans[key] = plan
+        return plan
+
+    def execute(self, **kwargs):
+        """
+        Execute the compiled operation synchronously. Accepts the keyword arguments of
+        ``Schema.execute`` (``root``, ``context``, ``variables``, ``middleware``...).
+        """
+        from .schema import normalize_execute_kwargs
+        return execute_sync(self.schema.graphql_schema, self.document, operation_name=self.operation_name, execution_context_class=self.execution_context_class, **normalize_execute_kwargs(kwargs))
+
+    async def execute_async(self, **kwargs):
+        """Execute the compiled operation asynchronously. Same as ``execute``."""
+        from .schema import normalize_execute_kwargs
+        result = execute(self.schema.graphql_schema, self.document, operation_name=self.operation_name, execution_context_class=self.execution_context_class, **normalize_execute_kwargs(kwargs))
+        if isawaitable(result):
+            return await result
+        return result
+
+class CompiledExecutionContext(ExecutionContext):
+    """
+    Execution context running the plan of a ``CompiledQuery``. A subclass bound to each
+    compiled query is built by ``CompiledQuery`` and used as its
+    ``execution_context_class``.
+    """
+    compiled_query = None
+
+    def execute_operation(self, operation, root_value):
+        compiled_query = self.compiled_query
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            raise GraphQLError(f'Schema is not configured to execute {operation.operation.value} operation.', operation)
+        if compiled_query.static_fields:
+            key = (root_type, id(operation))
+            root_fields = compiled_query.collected_fields.get(key)
+            if root_fields is None:
+                root_fields = collect_fields(self.schema, self.fragments, self.variable_values, root_type, operation.selection_set)
+                compiled_query.collected_fields[key] = root_fields
+        else:
+            root_fields = collect_fields(self.schema, self.fragments, self.variable_values, root_type, operation.selection_set)
+        return (self.execute_fields_serially if operation.operation == OperationType.MUTATION else self.execute_fields)(root_type, root_value, None, root_fields)
+
+    def collect_subfields(self, return_type, field_nodes):
+        compiled_query = self.compiled_query
+        if not compiled_query.static_fields:
+            return super().collect_subfields(return_type, field_nodes)
+        key = (return_type, id(field_nodes[0])) if len(field_nodes) == 1 else tuple((return_type, *map(id, field_nodes)))
+        sub_field_nodes = compiled_query.collected_fields.get(key)
+        if sub_field_nodes is None:
+            sub_field_nodes = collect_sub_fields(self.schema, self.fragments, self.variable_values, return_type, field_nodes)
+            compiled_query.collected_fields[key] = sub_field_nodes
+        return sub_field_nodes
+
+    def execute_field(self, parent_type, source, field_nodes, path):
+        plan = self.compiled_query.get_field_plan(parent_type, field_nodes[0])
+        if plan is None:
+            return Undefined
+        field_def, return_type, resolve_fn, args = plan
+        resolve_fn = resolve_fn or self.field_resolver
+        if self.middleware_manager:
+            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+        info = self.build_resolve_info(field_def, field_nodes, parent_type, path)
+        try:
+            if args is None:
+                args = get_argument_values(field_def, field_nodes[0], self.variable_values)
+            result = resolve_fn(source, info, **args)
+            if self.is_awaitable(result):
+
+                async def await_result():
+                    try:
+                        completed = self.complete_value(return_type, field_nodes, info, path, await result)
+                        if self.is_awaitable(completed):
+                            return await completed
+                        return completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+                return await_result()
+            completed = self.complete_value(return_type, field_nodes, info, path, result)
+            if self.is_awaitable(completed):
+
+                async def await_completed():
+                    try:
+                        return await completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+                return await_completed()
+            return completed
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
@@ -16,6 +16,13 @@ class GrapheneGraphQLType:
         result.__dict__.update(self.__dict__)
         return result
 
+    def __reduce__(self):
+        return (self._get_graphene_instance, (self.graphene_type, tuple(self.to_kwargs().items())))
+
+    @classmethod
+    def _get_graphene_instance(cls, graphene_type, args):
+        return cls(graphene_type=graphene_type, **dict(args))
+
 class GrapheneInterfaceType(GrapheneGraphQLType, GraphQLInterfaceType):
     pass
 
@@ -8,6 +8,8 @@ from .structures import NonNull
 from .unmountedtype import UnmountedType
 from .utils import get_type
 from ..utils.deprecated import warn_deprecation
+from ..utils.field_cache import FieldCache
+from ..utils.offload import get_process_offloader, get_thread_offloader
 base_type = type
 
 class Field(MountedType):
@@ -49,15 +51,36 @@ class Field(MountedType):
             name.
         description (optional, str): the description of the GraphQL field in the schema.
         default_value (optional, Any): Default value to resolve if none set from schema.
+        run_in_thread (optional, bool or ThreadPoolOffloader): run a synchronous resolver for this
+            field in a thread pool when executing with ``Schema.execute_async``, so it doesn't
+            block the event loop. ``True`` uses the default pool from
+            ``graphene.utils.offload``. Default False.
+        run_in_process (optional, bool or ProcessPoolOffloader): run the resolver of this field in
+            a process pool when executing with ``Schema.execute_async``, for CPU-bound work. The
+            resolver must be a picklable top-level function, called as ``resolver(root, **args)``.
+            ``True`` uses the default pool from ``graphene.utils.offload``. Default False.
+        cost (optional, int): cost of resolving this field, used by the query cost analysis
+            validator instead of its ``default_cost``.
+        cache (optional, float or FieldCache): cache the results of the resolver of this field,
+            for a number of seconds or as configured by a ``FieldCache`` (key, scope, size,
+            stampede protection). Results are keyed by the parent value and the arguments.
+        cache_control (optional, CacheHint): ``max_age`` and ``scope`` of the value of this
+            field, used to compute the cache policy of responses (``Cache-Control`` header).
+            Overrides the hint of the returned object type.
         **extra_args (optional, Dict[str, Union[graphene.Argument, graphene.UnmountedType]): any
-            additional arguments to mount on the field.
+            additional arguments to mount on the field. Arguments named ``run_in_thread``,
+            ``run_in_process``, ``cost``, ``cache`` or ``cache_control`` must be given in ``args``.
     """
 
-    def __init__(self, type_, args=None, resolver=None, source=None, deprecation_reason=None, name=None, description=None, required=False, _creation_counter=None, default_value=None, **extra_args):
+    def __init__(self, type_, args=None, resolver=None, source=None, deprecation_reason=None, name=None, description=None, required=False, _creation_counter=None, default_value=None, run_in_thread=False, run_in_process=False, cost=None, cache=None, cache_control=None, **extra_args):
         super(Field, self).__init__(_creation_counter=_creation_counter)
         assert not args or isinstance(args, Mapping), f'Arguments in a field have to be a mapping, received "{args}".'
         assert not (source and resolver), 'A Field cannot have a source and a resolver in at the same time.'
+        assert not (run_in_thread and run_in_process), 'A Field cannot run its resolver in a thread and in a process at the same time.'
         assert not callable(default_value), f'The default value can not be a function but received "{base_type(default_value)}".'
+        for option, value in (('run_in_thread', run_in_thread), ('run_in_process', run_in_process), ('cost', cost), ('cache', cache), ('cache_control', cache_control)):
+            if isinstance(value, (Argument, UnmountedType)):
+                raise ValueError(f'"{option}" is an option of Field, received {value}. To declare an argument named "{option}", use args={{"{option}": ...}}.')
         if required:
             type_ = NonNull(type_)
         if isinstance(name, (Argument, UnmountedType)):
@@ -75,6 +98,17 @@ class Field(MountedType):
         self.deprecation_reason = deprecation_reason
         self.description = description
         self.default_value = default_value
+        self.run_in_thread = run_in_thread
+        self.run_in_process = run_in_process
+        self.cost = cost
+        if cache is not None and not isinstance(cache, FieldCache):
+            cache = FieldCache(ttl=cache)
+        self.cache = cache
+        self.cache_control = cache_control
+
+    @property
+    def type(self):
+        return get_type(self._type)
     get_resolver = None
 
     def wrap_resolve(self, parent_resolver):
@@ -82,7 +116,17 @@ class Field(MountedType):
         Wraps a function resolver, using the ObjectType resolve_{FIELD_NAME}
         (parent_resolver) if the Field definition has no resolver.
         """
-        pass
+        if self.get_resolver is not None:
+            warn_deprecation('The get_resolver method is being deprecated, please rename it to wrap_resolve.')
+            return self.get_resolver(parent_resolver)
+        resolver = self.resolver or parent_resolver
+        if self.run_in_thread and resolver is not None:
+            resolver = get_thread_offloader(self.run_in_thread).wrap(resolver)
+        elif self.run_in_process and resolver is not None:
+            resolver = get_process_offloader(self.run_in_process).wrap(resolver)
+        if self.cache is not None and resolver is not None:
+            resolver = self.cache.wrap(resolver)
+        return resolver
 
     def wrap_subscribe(self, parent_subscribe):
         """
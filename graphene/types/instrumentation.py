@@ -0,0 +1,273 @@
+"""
+Hooks around the phases of the operations executed by a schema, given as
+``Schema(instrumentation=[...])``, so tracers can open and close spans.
+"""
+from contextvars import ContextVar
+from inspect import isawaitable
+from time import perf_counter_ns
+current_operation = ContextVar('current_operation', default=None)
+
+class Instrumentation:
+    """
+    Base class of the instrumentations of a schema. Every hook does nothing by default:
+    subclasses override the ones they need.
+
+    The hooks receive the ``InstrumentedOperation`` being executed, where they can keep their
+    own state (``operation.state``). The resolve hooks are only installed when a registered
+    instrumentation overrides them, as they run for every field.
+    """
+
+    def on_operation_start(self, operation):
+        """Called before anything else, with the request of the operation."""
+
+    def on_operation_end(self, operation):
+        """Called with the final ``operation.result``."""
+
+    def on_parse_start(self, operation):
+        """Called before parsing the request. Not called for cached documents."""
+
+    def on_parse_end(self, operation):
+        """Called after parsing, with ``operation.errors`` set if the request is invalid."""
+
+    def on_validate_start(self, operation):
+        """Called before validating the document. Not called for cached documents."""
+
+    def on_validate_end(self, operation):
+        """Called after validation, with the validation ``operation.errors``."""
+
+    def on_execute_start(self, operation):
+        """Called before executing the validated ``operation.document``."""
+
+    def on_execute_end(self, operation):
+        """Called after execution, with ``operation.result``."""
+
+    def on_resolve_start(self, operation, info):
+        """
+        Called before resolving a field. The returned value is given back to
+        ``on_resolve_end``, e.g. to close the span it opened.
+        """
+
+    def on_resolve_end(self, operation, info, token, error=None):
+        """Called once the field is resolved (its value awaited), or failed with ``error``."""
+
+def overrides_resolve_hooks(instrumentation):
+    return type(instrumentation).on_resolve_start is not Instrumentation.on_resolve_start or type(instrumentation).on_resolve_end is not Instrumentation.on_resolve_end
+
+class InstrumentedOperation:
+    """
+    An operation executed by an instrumented schema, handed to the hooks of its
+    instrumentations.
+
+    Attributes:
+        request_string: The request, as given to ``Schema.execute``.
+        operation_name: Name of the operation to execute, if given.
+        variable_values: Variables of the request, if given.
+        context_value: Context of the request, if given.
+        document: Parsed document, once parsed.
+        errors: Parsing or validation errors, if any.
+        result: ``ExecutionResult`` of the operation, once executed.
+        state: Dictionary where instrumentations can keep the state of the operation.
+        schema: The ``Schema`` executing the operation.
+    """
+    phase_hooks = {'parsing': ('on_parse_start', 'on_parse_end'), 'validation': ('on_validate_start', 'on_validate_end')}
+
+    def __init__(self, instrumentation, request_string, kwargs, trace=None, schema=None):
+        self.instrumentation = instrumentation
+        self.request_string = request_string
+        self.operation_name = kwargs.get('operation_name')
+        self.variable_values = kwargs.get('variable_values')
+        self.context_value = kwargs.get('context_value')
+        self.document = None
+        self.errors = None
+        self.result = None
+        self.state = {}
+        self.trace = trace
+        self.schema = schema
+        self.resolve_instrumentation = tuple((instrumentation for instrumentation in instrumentation if overrides_resolve_hooks(instrumentation)))
+
+    def start(self):
+        for instrumentation in self.instrumentation:
+            instrumentation.on_operation_start(self)
+
+    def end(self, result):
+        self.result = result
+        for instrumentation in reversed(self.instrumentation):
+            instrumentation.on_operation_end(self)
+
+    def phase_start(self, phase):
+        if self.trace is not None:
+            self.trace.phase_start(phase)
+        hook = self.phase_hooks[phase][0]
+        for instrumentation in self.instrumentation:
+            getattr(instrumentation, hook)(self)
+
+    def phase_end(self, phase, document=None, errors=None):
+        if self.trace is not None:
+            self.trace.phase_end(phase, document, errors)
+        self.document = document
+        self.errors = errors or None
+        hook = self.phase_hooks[phase][1]
+        for instrumentation in reversed(self.instrumentation):
+            getattr(instrumentation, hook)(self)
+
+    def execute_start(self, document):
+        self.document = document
+        for instrumentation in self.instrumentation:
+            instrumentation.on_execute_start(self)
+
+    def execute_end(self, result):
+        self.result = result
+        for instrumentation in reversed(self.instrumentation):
+            instrumentation.on_execute_end(self)
+
+    def get_middleware(self):
+        """
+        Returns the middleware calling the resolve hooks, or ``None`` if none is overridden.
+        The middleware is shared by all the operations: it calls the hooks of the operation
+        set as ``current_operation`` during its execution.
+        """
+        if not self.resolve_instrumentation:
+            return None
+        return resolve_hooks_middleware
+
+class ResolveHooksMiddleware:
+    """Middleware calling the resolve hooks of the instrumentations of the ``current_operation``."""
+
+    def end(self, operation, info, tokens, error=None):
+        for instrumentation, token in zip(reversed(operation.resolve_instrumentation), reversed(tokens)):
+            instrumentation.on_resolve_end(operation, info, token, error)
+
+    def resolve(self, next_, root, info, **args):
+        operation = current_operation.get()
+        if operation is None or not operation.resolve_instrumentation:
+            return next_(root, info, **args)
+        tokens = [instrumentation.on_resolve_start(operation, info) for instrumentation in operation.resolve_instrumentation]
+        try:
+            result = next_(root, info, **args)
+        except Exception as error:
+            self.end(operation, info, tokens, error)
+            raise
+        if isawaitable(result):
+            return self.end_awaited(operation, result, info, tokens)
+        self.end(operation, info, tokens)
+        return result
+
+    async def end_awaited(self, operation, result, info, tokens):
+        try:
+            value = await result
+        except Exception as error:
+            self.end(operation, info, tokens, error)
+            raise
+        self.end(operation, info, tokens)
+        return value
+resolve_hooks_middleware = ResolveHooksMiddleware()
+
+class Span:
+    """A span recorded by ``InMemoryInstrumentation``. Times are ``perf_counter_ns`` values."""
+    __slots__ = ('name', 'start', 'end', 'attributes', 'parent')
+
+    def __init__(self, name, parent=None, **attributes):
+        self.name = name
+        self.start = perf_counter_ns()
+        self.end = None
+        self.attributes = attributes
+        self.parent = parent
+
+    @property
+    def duration(self):
+        return None if self.end is None else self.end - self.start
+
+    def __repr__(self):
+        return f'<Span {self.name} {self.attributes}>'
+
+class InMemoryInstrumentation(Instrumentation):
+    """
+    Instrumentation recording a ``Span`` for every hooked phase in ``spans``, for tests and
+    local debugging. Spans are named ``operation``, ``parse``, ``validate``, ``execute`` and
+    ``resolve``; field spans have the ``path`` of the field as attribute, and the
+    ``operation`` span as parent.
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, operation, name, **attributes):
+        """Records a new span of the operation, child of its ``operation`` span."""
+        open_spans = operation.state.setdefault(self, {})
+        span = Span(name, open_spans.get('operation'), **attributes)
+        self.spans.append(span)
+        return span
+
+    def open_span(self, operation, name, **attributes):
+        """Starts the span of a phase, kept in the state of the operation until it ends."""
+        span = self.start_span(operation, name, **attributes)
+        operation.state[self][name] = span
+        return span
+
+    def end_span(self, operation, name):
+        """Ends the span of a phase of the operation, not the one of a concurrent operation."""
+        span = operation.state[self].pop(name)
+        span.end = perf_counter_ns()
+        return span
+
+    def on_operation_start(self, operation):
+        self.open_span(operation, 'operation', operation_name=operation.operation_name)
+
+    def on_operation_end(self, operation):
+        self.end_span(operation, 'operation').attributes['errors'] = len(operation.result.errors or ())
+
+    def on_parse_start(self, operation):
+        self.open_span(operation, 'parse')
+
+    def on_parse_end(self, operation):
+        self.end_span(operation, 'parse')
+
+    def on_validate_start(self, operation):
+        self.open_span(operation, 'validate')
+
+    def on_validate_end(self, operation):
+        self.end_span(operation, 'validate')
+
+    def on_execute_start(self, operation):
+        self.open_span(operation, 'execute')
+
+    def on_execute_end(self, operation):
+        self.end_span(operation, 'execute')
+
+    def on_resolve_start(self, operation, info):
+        return self.start_span(operation, 'resolve', path=info.path.as_list(), field_name=info.field_name)
+
+    def on_resolve_end(self, operation, info, span, error=None):
+        span.end = perf_counter_ns()
+        if error is not None:
+            span.attributes['error'] = error
+
+    def get_spans(self, name):
+        """Returns the recorded spans with the given name."""
+        return [span for span in self.spans if span.name == name]
+
+def get_context_dataloader_stats(context):
+    if isinstance(context, dict):
+        return context.get('dataloader_stats')
+    return getattr(context, 'dataloader_stats', None)
+
+class DataLoaderStatsInstrumentation(Instrumentation):
+    """
+    Instrumentation adding the summary of the DataLoader stats of each operation (such as a
+    ``RequestDataLoaderStats``) to the ``dataloaders`` extension of its result.
+
+    Args:
+        get_stats (Callable): Returns the stats of an operation, or ``None``, given its context.
+            Default: the ``dataloader_stats`` key or attribute of the context.
+        extension (str): Name of the extension. Default ``dataloaders``.
+    """
+
+    def __init__(self, get_stats=None, extension='dataloaders'):
+        self.get_stats = get_stats or get_context_dataloader_stats
+        self.extension = extension
+
+    def on_execute_end(self, operation):
+        stats = self.get_stats(operation.context_value)
+        if stats is not None:
+            result = operation.result
+            result.extensions = dict(result.extensions or {}, **{self.extension: stats.summary()})
@@ -0,0 +1,122 @@
+"""
+Middleware applied to a selection of the fields of a schema. Middleware can declare the fields
+they apply to with an ``applies_to(parent_type, field_name, field)`` method, evaluated once
+per field, or be wrapped in a ``SelectiveMiddleware``.
+"""
+from functools import partial, reduce
+from graphql import GraphQLObjectType, MiddlewareManager
+from graphql.execution.middleware import get_middleware_resolvers
+from .resolver import is_default_resolver
+
+class SelectiveMiddleware:
+    """
+    Applies a middleware only to the selected fields, so the other ones are resolved without
+    its overhead. Fields are selected when they match all the given conditions.
+
+    .. code:: python
+
+        schema.execute(query, middleware=[
+            SelectiveMiddleware(AuthorizationMiddleware(), custom_resolvers=True),
+        ])
+
+    Args:
+        middleware (SupportsGraphQLMiddleware): Middleware function, or object with a
+            ``resolve`` method.
+        custom_resolvers (bool): Only apply to the fields with a resolve method or function,
+            skipping the fields resolved by a default resolver. Default False.
+        types (Iterable[str or Type[ObjectType]]): Only apply to the fields of these types.
+        predicate (Callable): Only apply to the fields for which
+            ``predicate(parent_type, field_name, field)`` is true, given the ``GraphQLObjectType``
+            and the ``GraphQLField``.
+    """
+
+    def __init__(self, middleware, custom_resolvers=False, types=None, predicate=None):
+        self.middleware = middleware
+        self.custom_resolvers = custom_resolvers
+        self.types = None if types is None else frozenset((getattr(getattr(type_, '_meta', None), 'name', type_) for type_ in types))
+        self.predicate = predicate
+        (self.resolve,) = get_middleware_resolvers((middleware,))
+
+    def applies_to(self, parent_type, field_name, field):
+        if self.custom_resolvers and is_default_resolver(field.resolve):
+            return False
+        if self.types is not None and parent_type.name not in self.types:
+            return False
+        if self.predicate is not None and (not self.predicate(parent_type, field_name, field)):
+            return False
+        applies_to = getattr(self.middleware, 'applies_to', None)
+        return applies_to is None or applies_to(parent_type, field_name, field)
+
+def chain_middleware(resolver, middleware_resolvers):
+    return reduce(lambda chained_fns, next_fn: partial(next_fn, chained_fns), middleware_resolvers, resolver)
+
+class FieldMiddlewareManager(MiddlewareManager):
+    """
+    Middleware manager building the middleware chain of each field from the middleware that
+    apply to it, according to their ``applies_to`` method. Chains are cached for the lifetime
+    of the manager, so ``Schema`` reuses the managers of the middleware given to successive
+    operations.
+
+    Args:
+        schema (GraphQLSchema): Schema whose fields are resolved.
+        *middlewares (SupportsGraphQLMiddleware): Middleware, from the outermost to the innermost.
+    """
+
+    def __init__(self, schema, *middlewares):
+        super().__init__(*middlewares)
+        self.schema = schema
+        self.selective_resolvers = [(resolve, getattr(middleware, 'applies_to', None)) for middleware in middlewares for resolve in get_middleware_resolvers((middleware,))]
+        self.selective = any((applies_to is not None for _, applies_to in self.selective_resolvers))
+        self._fields_by_resolver = None
+
+    def get_fields_by_resolver(self):
+        """Returns the fields of the schema, as ``(parent_type, field_name, field)``, by resolver."""
+        if self._fields_by_resolver is None:
+            fields_by_resolver = {}
+            for type_name, type_ in self.schema.type_map.items():
+                if isinstance(type_, GraphQLObjectType) and (not type_name.startswith('__')):
+                    for field_name, field in type_.fields.items():
+                        fields_by_resolver.setdefault(field.resolve, []).append((type_, field_name, field))
+            self._fields_by_resolver = fields_by_resolver
+        return self._fields_by_resolver
+
+    def get_middleware_resolvers_for_field(self, parent_type, field_name, field):
+        return tuple((resolve for resolve, applies_to in self.selective_resolvers if applies_to is None or applies_to(parent_type, field_name, field)))
+
+    def get_field_resolver(self, field_resolver):
+        if self._middleware_resolvers is None:
+            return field_resolver
+        resolver = self._cached_resolvers.get(field_resolver)
+        if resolver is None:
+            resolver = self._cached_resolvers[field_resolver] = self.wrap_resolver(field_resolver)
+        return resolver
+
+    def wrap_resolver(self, field_resolver):
+        if not self.selective:
+            return chain_middleware(field_resolver, self._middleware_resolvers)
+        try:
+            fields = self.get_fields_by_resolver().get(field_resolver)
+        except TypeError:
+            fields = None
+        if fields:
+            selections = {self.get_middleware_resolvers_for_field(*field) for field in fields}
+            if len(selections) == 1:
+                return chain_middleware(field_resolver, *selections)
+        return self.dispatch_resolver(field_resolver)
+
+    def dispatch_resolver(self, field_resolver):
+        """
+        Wraps a resolver shared by fields with different middleware (such as the default
+        resolver of graphql-core), in a resolver calling the chain of each field.
+        """
+        chains = {}
+
+        def resolve(root, info, **args):
+            key = (info.parent_type, info.field_name)
+            chain = chains.get(key)
+            if chain is None:
+                parent_type, field_name = key
+                middleware_resolvers = self.get_middleware_resolvers_for_field(parent_type, field_name, parent_type.fields[field_name])
+                chain = chains[key] = chain_middleware(field_resolver, middleware_resolvers)
+            return chain(root, info, **args)
+        return resolve
@@ -8,4 +8,5 @@ class MountedType(OrderedType):
         """
         Mount the UnmountedType instance
         """
-        pass
\ No newline at end of file
+        assert isinstance(unmounted, UnmountedType), f"{cls.__name__} can't mount {repr(unmounted)}"
+        return cls(unmounted.get_type(), *unmounted.args, _creation_counter=unmounted.creation_counter, **unmounted.kwargs)
\ No newline at end of file
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 from .base import BaseOptions, BaseType, BaseTypeMeta
 from .field import Field
 from .interface import Interface
+from .resolver import ATTR_SHAPE, DICT_SHAPE
 from .utils import yank_fields_from_attrs
 try:
     from dataclasses import make_dataclass, field
@@ -13,13 +14,53 @@ if TYPE_CHECKING:
 class ObjectTypeOptions(BaseOptions):
     fields = None
     interfaces = ()
+    run_in_thread = False
+    cache_control = None
+    root_shape = None
+    slots = False
+
+def get_meta_option(namespace, options, name, default=None):
+    """Returns an option of the ObjectType defined by a class namespace, before its Meta is processed."""
+    if name in options:
+        return options[name]
+    meta = namespace.get('Meta')
+    if isinstance(meta, dict):
+        return meta.get(name, default)
+    return getattr(meta, name, default)
+
+def is_slotted(namespace, options):
+    """Returns whether the ObjectType defined by a class namespace has the ``slots`` option."""
+    return get_meta_option(namespace, options, 'slots', False)
+
+def get_slotted_namespace(namespace, bases, interfaces=()):
+    """
+    Returns the namespace of a slotted ObjectType, with a slot for each of its fields and of
+    the fields of its interfaces. The fields are moved from the class attributes (which would
+    shadow the slots) to ``_slot_fields``.
+    """
+    slot_fields = yank_fields_from_attrs(namespace, _as=Field)
+    field_names = {name for name, _ in slot_fields}
+    inherited_slots = set()
+    for base in bases:
+        for klass in base.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            inherited_slots.update((slots,) if isinstance(slots, str) else slots)
+    slot_names = [name for name, _ in slot_fields]
+    for interface in interfaces:
+        slot_names.extend((name for name in interface._meta.fields if name not in field_names and name not in slot_names))
+    namespace = {key: value for key, value in namespace.items() if key not in field_names}
+    namespace['__slots__'] = tuple((name for name in slot_names if name not in inherited_slots))
+    namespace['_slot_fields'] = slot_fields
+    return namespace
 
 class ObjectTypeMeta(BaseTypeMeta):
 
     def __new__(cls, name_, bases, namespace, **options):
 
         class InterObjectType:
-            pass
+            __slots__ = ()
+        if is_slotted(namespace, options):
+            namespace = get_slotted_namespace(namespace, bases, get_meta_option(namespace, options, 'interfaces', ()))
         base_cls = super().__new__(cls, name_, (InterObjectType,) + bases, namespace, **options)
         if base_cls._meta:
             fields = [(key, 'typing.Any', field(default=field_value.default_value if isinstance(field_value, Field) else None)) for key, field_value in base_cls._meta.fields.items()]
@@ -88,6 +129,18 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             key with the same name as the field.
         fields (Dict[str, graphene.Field]): Dictionary of field name to Field. Not recommended to
             use (prefer class attributes).
+        run_in_thread (bool or ThreadPoolOffloader): Run the synchronous ``resolve_<field_name>``
+            methods of this type in a thread pool when executing with ``Schema.execute_async``.
+            ``True`` uses the default pool from ``graphene.utils.offload``. Default False.
+        cache_control (CacheHint): Cache-control hint of the fields returning this type, used to
+            compute the cache policy of responses. See ``graphene.types.cache_control``.
+        root_shape (str): Shape of the parent values of this type, ``"attr"`` for objects or
+            ``"dict"`` for dictionaries, so the default resolver of its fields only looks up
+            attributes or keys. By default, they look up keys of dictionaries and attributes of
+            other values.
+        slots (bool): Store the field values of the instances of this type in ``__slots__``
+            instead of a ``__dict__``, making them smaller and faster to create. The fields are
+            then not available as class attributes. Default False.
 
     An _ObjectType_ can be used as a simple value object by creating an instance of the class.
 
@@ -100,9 +153,10 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
         *args (List[Any]): Positional values to use for Field values of value object
         **kwargs (Dict[str: Any]): Keyword arguments to use for Field values of value object
     """
+    __slots__ = ()
 
     @classmethod
-    def __init_subclass_with_meta__(cls, interfaces=(), possible_types=(), default_resolver=None, _meta=None, **options):
+    def __init_subclass_with_meta__(cls, interfaces=(), possible_types=(), default_resolver=None, run_in_thread=False, cache_control=None, root_shape=None, slots=False, _meta=None, **options):
         if not _meta:
             _meta = ObjectTypeOptions(cls)
         fields = {}
@@ -111,6 +165,8 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             fields.update(interface._meta.fields)
         for base in reversed(cls.__mro__):
             fields.update(yank_fields_from_attrs(base.__dict__, _as=Field))
+            fields.update(base.__dict__.get('_slot_fields', ()))
+        assert root_shape in (None, ATTR_SHAPE, DICT_SHAPE), f'{cls.__name__}.Meta.root_shape must be "{ATTR_SHAPE}" or "{DICT_SHAPE}". Received "{root_shape}".'
         assert not (possible_types and cls.is_type_of), f'{cls.__name__}.Meta.possible_types will cause type collision with {cls.__name__}.is_type_of. Please use one or other.'
         if _meta.fields:
             _meta.fields.update(fields)
@@ -120,5 +176,9 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             _meta.interfaces = interfaces
         _meta.possible_types = possible_types
         _meta.default_resolver = default_resolver
+        _meta.run_in_thread = run_in_thread
+        _meta.cache_control = cache_control
+        _meta.root_shape = root_shape
+        _meta.slots = slots
         super(ObjectType, cls).__init_subclass_with_meta__(_meta=_meta, **options)
     is_type_of = None
\ No newline at end of file
@@ -1,3 +1,13 @@
+from functools import partial
+ATTR_SHAPE = 'attr'
+DICT_SHAPE = 'dict'
+
+def attr_resolver(attname, default_value, root, info, **args):
+    return getattr(root, attname, default_value)
+
+def dict_resolver(attname, default_value, root, info, **args):
+    return root.get(attname, default_value)
+
 def dict_or_attr_resolver(attname, default_value, root, info, **args):
     """
     Default resolver that tries to get the value from:
@@ -8,9 +18,53 @@ def dict_or_attr_resolver(attname, default_value, root, info, **args):
     if isinstance(root, dict):
         return root.get(attname, default_value)
     return getattr(root, attname, default_value)
-
 default_resolver = dict_or_attr_resolver
 
+def set_default_resolver(resolver):
+    global default_resolver
+    assert callable(resolver), 'Received non-callable resolver.'
+    default_resolver = resolver
+
 def get_default_resolver():
     """Get the default resolver function."""
-    return default_resolver
\ No newline at end of file
+    return default_resolver
+
+shape_resolvers = {ATTR_SHAPE: attr_resolver, DICT_SHAPE: dict_resolver}
+default_resolvers = frozenset((attr_resolver, dict_resolver, dict_or_attr_resolver))
+
+def is_default_resolver(resolver):
+    """
+    Returns whether a field resolver is a default resolver (or ``None``, for the default resolver
+    of graphql-core), rather than a resolve method or function of the field.
+    """
+    if resolver is None:
+        return True
+    if isinstance(resolver, partial):
+        resolver = resolver.func
+    return resolver in default_resolvers or resolver is default_resolver
+
+def get_root_shape(graphene_type):
+    """
+    Returns the shape of the parent values resolved by the default resolver of the given
+    ObjectType, as declared by its ``Meta.root_shape``: ``ATTR_SHAPE`` for objects,
+    ``DICT_SHAPE`` for dictionaries, or ``None`` if not declared.
+    """
+    return getattr(graphene_type._meta, 'root_shape', None)
+
+def get_field_default_resolver(graphene_type, attname, default_value):
+    """
+    Returns the resolver of a field of the given ObjectType without resolve method, bound to
+    the field name and default value.
+
+    The default resolver of Graphene is specialized for the shape of the parent values declared
+    by the type (see ``get_root_shape``), so it doesn't check it for every value. Resolvers are
+    bound with a ``partial`` of a module-level function, so they can be pickled with the schema.
+    """
+    resolver = graphene_type._meta.default_resolver
+    if resolver is None:
+        resolver = get_default_resolver()
+        if resolver is dict_or_attr_resolver:
+            root_shape = get_root_shape(graphene_type)
+            if root_shape is not None:
+                resolver = shape_resolvers[root_shape]
+    return partial(resolver, attname, default_value)
@@ -1,23 +1,47 @@
+from asyncio import Semaphore, gather
 from enum import Enum as PyEnum
 import inspect
-from functools import partial
-from graphql import default_type_resolver, get_introspection_query, graphql, graphql_sync, introspection_types, parse, print_schema, subscribe, validate, ExecutionResult, GraphQLArgument, GraphQLBoolean, GraphQLError, GraphQLEnumValue, GraphQLField, GraphQLFloat, GraphQLID, GraphQLInputField, GraphQLInt, GraphQLList, GraphQLNonNull, GraphQLObjectType, GraphQLSchema, GraphQLString
+import json
+from inspect import isawaitable
+from functools import lru_cache, partial
+from threading import Lock
+from weakref import WeakKeyDictionary
+from graphql import default_type_resolver, execute, execute_sync, get_introspection_query, get_operation_ast, introspection_types, parse, print_ast, print_schema, subscribe, validate, validate_schema, DocumentNode, ExecutionResult, FragmentDefinitionNode, GraphQLArgument, GraphQLBoolean, GraphQLError, GraphQLEnumValue, GraphQLField, GraphQLFloat, GraphQLID, GraphQLInputField, GraphQLInt, GraphQLList, GraphQLNonNull, MiddlewareManager, GraphQLObjectType, GraphQLSchema, GraphQLString, OperationType, Source
 from ..utils.str_converters import to_camel_case
 from ..utils.get_unbound_function import get_unbound_function
+from ..utils.lru import LRUCache
+from ..utils.offload import get_thread_offloader
+from ..utils.persisted_queries import get_query_hash, get_query_text
+from .cache_control import CacheControlledExecutionResult, CachePolicyCalculator, has_cache_hints
+from .compiled_query import CompiledQuery
 from .definitions import GrapheneEnumType, GrapheneGraphQLType, GrapheneInputObjectType, GrapheneInterfaceType, GrapheneObjectType, GrapheneScalarType, GrapheneUnionType
 from .dynamic import Dynamic
 from .enum import Enum
 from .field import Field
 from .inputobjecttype import InputObjectType
+from .instrumentation import InstrumentedOperation, current_operation
 from .interface import Interface
+from .middleware import FieldMiddlewareManager
 from .objecttype import ObjectType
-from .resolver import get_default_resolver
+from .resolver import get_field_default_resolver
 from .scalars import ID, Boolean, Float, Int, Scalar, String
+from .snapshot import load_schema_snapshot, save_schema_snapshot
 from .structures import List, NonNull
+from .tracing import current_trace, tracing_middleware
 from .union import Union
 from .utils import get_field_as
 
 introspection_query = get_introspection_query()
+
+@lru_cache(maxsize=None)
+def get_introspection_document():
+    """The parsed form of the standard ``introspection_query``."""
+    return parse(introspection_query)
+
+@lru_cache(maxsize=None)
+def get_printed_introspection_query():
+    """The standard ``introspection_query`` in the canonical form of ``print_ast``."""
+    return print_ast(get_introspection_document())
 IntrospectionSchema = introspection_types['__Schema']
 
 def is_graphene_type(type_):
@@ -36,6 +60,40 @@ def assert_valid_root_type(type_):
     if not is_valid:
         raise Exception(f'Type "{type_}" is not a valid root type. Expected a subclass of ObjectType.')
 
+class ExecutionRequest:
+    """State of a request executed by ``Schema.execute`` or ``Schema.execute_async``."""
+    __slots__ = ('kwargs', 'trace', 'operation', 'document', 'cache_key', 'result', 'trace_token', 'operation_token')
+
+    def __init__(self, kwargs, trace=None, operation=None):
+        self.kwargs = kwargs
+        self.trace = trace
+        self.operation = operation
+        self.document = None
+        self.cache_key = None
+        self.result = None
+        self.trace_token = None
+        self.operation_token = None
+
+    def reset_context(self):
+        """Resets the context variables set for the execution of the request."""
+        if self.trace_token is not None:
+            current_trace.reset(self.trace_token)
+        if self.operation_token is not None:
+            current_operation.reset(self.operation_token)
+
+def add_execution_middleware(kwargs, middleware, innermost=False):
+    """
+    Adds a middleware to the middleware of the execution ``kwargs``, as the outermost one or,
+    with ``innermost``, the one calling the resolvers.
+    """
+    request_middleware = kwargs.get('middleware') or ()
+    if isinstance(request_middleware, MiddlewareManager):
+        request_middleware = request_middleware.middlewares
+    kwargs['middleware'] = [middleware, *request_middleware] if innermost else [*request_middleware, middleware]
+
+def identity_resolve(root, info, **arguments):
+    return root
+
 class TypeMap(dict):
 
     def __init__(self, query=None, mutation=None, subscription=None, types=None, auto_camelcase=True):
@@ -53,15 +111,65 @@ class TypeMap(dict):
         self.subscription = create_graphql_type(subscription) if subscription else None
         self.types = [create_graphql_type(graphene_type) for graphene_type in types]
 
+    def create_fields_for_type(self, graphene_type, is_input_type=False):
+        create_graphql_type = self.add_type
+        fields = {}
+        for name, field in graphene_type._meta.fields.items():
+            if isinstance(field, Dynamic):
+                field = get_field_as(field.get_type(self), _as=Field)
+                if not field:
+                    continue
+            field_type = create_graphql_type(field.type)
+            if is_input_type:
+                _field = GraphQLInputField(field_type, default_value=field.default_value, out_name=name, description=field.description, deprecation_reason=field.deprecation_reason)
+            else:
+                args = {}
+                for arg_name, arg in field.args.items():
+                    arg_type = create_graphql_type(arg.type)
+                    processed_arg_name = arg.name or self.get_name(arg_name)
+                    args[processed_arg_name] = GraphQLArgument(arg_type, out_name=arg_name, description=arg.description, default_value=arg.default_value, deprecation_reason=arg.deprecation_reason)
+                subscribe = field.wrap_subscribe(self.get_function_for_type(graphene_type, f'subscribe_{name}', name, field.default_value))
+                if subscribe:
+                    field_default_resolver = identity_resolve
+                else:
+                    field_default_resolver = self.get_default_resolver_for_type(graphene_type, name, field.default_value)
+                resolve = field.wrap_resolve(self.get_function_for_type(graphene_type, f'resolve_{name}', name, field.default_value) or field_default_resolver)
+                _field = GraphQLField(field_type, args=args, resolve=resolve, subscribe=subscribe, deprecation_reason=field.deprecation_reason, description=field.description)
+            field_name = field.name or self.get_name(name)
+            fields[field_name] = _field
+        return fields
+
     def get_function_for_type(self, graphene_type, func_name, name, default_value):
         """Gets a resolve or subscribe function for a given ObjectType"""
-        if not hasattr(graphene_type, func_name):
-            return default_value
-        func = getattr(graphene_type, func_name)
-        if func is None:
-            return default_value
+        if not issubclass(graphene_type, ObjectType):
+            return None
+        func = getattr(graphene_type, func_name, None)
+        if not func:
+            for interface in graphene_type._meta.interfaces:
+                if name not in interface._meta.fields:
+                    continue
+                func = getattr(interface, func_name, None)
+                if func:
+                    break
+        if not func:
+            return None
+        func = get_unbound_function(func)
+        run_in_thread = getattr(graphene_type._meta, 'run_in_thread', False)
+        if run_in_thread and func_name.startswith('resolve_'):
+            return get_thread_offloader(run_in_thread).wrap(func)
         return func
 
+    def get_name(self, name):
+        if self.auto_camelcase:
+            return to_camel_case(name)
+        return name
+
+    def get_default_resolver_for_type(self, graphene_type, name, default_value):
+        """Gets the resolver of a field of an ObjectType that has no resolve function"""
+        if not issubclass(graphene_type, ObjectType):
+            return None
+        return get_field_default_resolver(graphene_type, name, default_value)
+
 class Schema:
     """Schema Definition.
     A Graphene Schema can execute operations (query, mutation, subscription) against the defined
@@ -81,18 +189,181 @@ class Schema:
             and @skip) [GraphQLIncludeDirective, GraphQLSkipDirective].
         auto_camelcase (bool): Fieldnames will be transformed in Schema's TypeMap from snake_case
             to camelCase (preferred by GraphQL standard). Default True.
+        document_cache_size (Optional[int]): Maximum number of parsed and validated documents kept
+            in the schema's LRU document cache, so repeated query strings skip parsing and
+            validation. ``0`` or ``None`` disables the cache. Default 1000.
+        persisted_queries (Optional[BasePersistedQueryStore]): Store used to resolve requests
+            executed with a ``query_hash`` instead of (or along with) the query text. See
+            ``graphene.utils.persisted_queries``.
+        defer_build (bool): Defer building the TypeMap and the ``GraphQLSchema`` until
+            ``graphql_schema`` is first accessed (first execution, introspection, printing...),
+            instead of building them when the Schema is created. The whole schema is then built
+            at once, as when it isn't deferred: this moves the cost of building it, and doesn't
+            reduce it. Default False.
+        response_cache (Optional[BaseResponseCache]): Cache serving the results of repeated
+            queries without executing them. Only successful query operations are cached. See
+            ``graphene.utils.response_cache``.
+        default_max_age (int): Max age, in seconds, of the root fields and of the fields returning
+            object types that have no cache-control hint, when computing the cache policy of
+            responses. Only used if some fields or types declare a ``cache_control`` hint.
+            Default 0.
+        tracing (Optional[ApolloTracing]): Collect the timings of the resolvers of a sample of
+            the operations into the ``tracing`` extension of their result, in the Apollo
+            tracing format. See ``graphene.types.tracing``.
+        instrumentation (Optional[List[Instrumentation]]): Instrumentations whose hooks are called
+            around the parsing, validation and execution of every operation, and around every
+            field resolution if they implement the resolve hooks. See
+            ``graphene.types.instrumentation``.
     """
 
-    def __init__(self, query=None, mutation=None, subscription=None, types=None, directives=None, auto_camelcase=True):
+    def __init__(self, query=None, mutation=None, subscription=None, types=None, directives=None, auto_camelcase=True, document_cache_size=1000, persisted_queries=None, defer_build=False, response_cache=None, default_max_age=0, tracing=None, instrumentation=None):
         self.query = query
         self.mutation = mutation
         self.subscription = subscription
-        type_map = TypeMap(query, mutation, subscription, types, auto_camelcase=auto_camelcase)
-        self.graphql_schema = GraphQLSchema(type_map.query, type_map.mutation, type_map.subscription, type_map.types, directives)
+        self.types = types
+        self.directives = directives
+        self.auto_camelcase = auto_camelcase
+        self._graphql_schema = None
+        self._build_lock = Lock()
+        if defer_build:
+            assert_valid_root_type(query)
+            assert_valid_root_type(mutation)
+            assert_valid_root_type(subscription)
+        else:
+            self.build()
+        self.document_cache_size = document_cache_size
+        self.document_cache = LRUCache(document_cache_size) if document_cache_size else None
+        self.persisted_queries = persisted_queries
+        self.response_cache = response_cache
+        self.default_max_age = default_max_age
+        self.tracing = tracing
+        self.instrumentation = tuple(instrumentation or ())
+        self._introspection = None
+        self._has_cache_hints = None
+        self._cache_policies = WeakKeyDictionary()
+        self._introspection_documents = WeakKeyDictionary()
+        self.middleware_managers = LRUCache(32)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_graphql_schema'] = self.graphql_schema
+        for runtime_attribute in ('_build_lock', 'document_cache', 'persisted_queries', 'response_cache', 'instrumentation', '_introspection', '_has_cache_hints', '_cache_policies', '_introspection_documents', 'middleware_managers'):
+            state.pop(runtime_attribute, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build_lock = Lock()
+        self._introspection = None
+        self._has_cache_hints = None
+        self._cache_policies = WeakKeyDictionary()
+        self._introspection_documents = WeakKeyDictionary()
+        self.document_cache = LRUCache(self.document_cache_size) if self.document_cache_size else None
+        self.persisted_queries = None
+        self.response_cache = None
+        self.instrumentation = ()
+        self.middleware_managers = LRUCache(32)
+
+    def save_snapshot(self, path):
+        """Write a snapshot of the built schema to ``path``, to be restored with `load_snapshot`.
+        The Graphene types and resolvers of the schema must be defined at the top level of their
+        module. Runtime state (document cache, persisted query store, response cache,
+        instrumentation) is not included.
+        """
+        save_schema_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path, persisted_queries=None, response_cache=None, instrumentation=None):
+        """Restore a schema written by `save_snapshot`, much faster than building it again.
+        Returns ``None`` if ``path`` doesn't exist or if the modules defining the schema changed
+        since the snapshot was written, in which case the schema must be built and snapshotted
+        again:
+
+        .. code:: python
+
+            schema = Schema.load_snapshot(path)
+            if schema is None:
+                schema = Schema(query=Query)
+                schema.save_snapshot(path)
+        """
+        schema = load_schema_snapshot(path)
+        if schema is not None:
+            assert isinstance(schema, cls), f'Snapshot {path} does not contain a {cls.__name__}.'
+            schema.persisted_queries = persisted_queries
+            schema.response_cache = response_cache
+            schema.instrumentation = tuple(instrumentation or ())
+        return schema
+
+    def build(self):
+        """Build the TypeMap and the ``GraphQLSchema`` of the schema, if not built yet."""
+        if self._graphql_schema is None:
+            with self._build_lock:
+                if self._graphql_schema is None:
+                    type_map = TypeMap(self.query, self.mutation, self.subscription, self.types, auto_camelcase=self.auto_camelcase)
+                    self._graphql_schema = GraphQLSchema(type_map.query, type_map.mutation, type_map.subscription, type_map.types, self.directives)
+        return self._graphql_schema
+
+    @property
+    def graphql_schema(self):
+        """The ``GraphQLSchema`` built from the Graphene types, built on first access if deferred."""
+        return self._graphql_schema or self.build()
+
+    @graphql_schema.setter
+    def graphql_schema(self, graphql_schema):
+        self._graphql_schema = graphql_schema
+
+    @property
+    def is_built(self):
+        """Whether the ``GraphQLSchema`` has been built already."""
+        return self._graphql_schema is not None
 
     def __str__(self):
         return print_schema(self.graphql_schema)
 
+    def get_introspection_result(self):
+        """Returns the ``ExecutionResult`` of the standard ``introspection_query``.
+        It is computed once and cached until the ``GraphQLSchema`` is rebuilt or replaced. The
+        same result object is returned to every caller, so it must not be modified.
+        """
+        graphql_schema = self.graphql_schema
+        cached = self._introspection
+        if cached is None or cached[0] is not graphql_schema:
+            cached = self._introspection = [graphql_schema, execute_sync(graphql_schema, get_introspection_document()), None]
+        return cached[1]
+
+    def introspect(self):
+        """Returns the data of the standard introspection query, computed once."""
+        introspection = self.get_introspection_result()
+        if introspection.errors:
+            raise introspection.errors[0]
+        return introspection.data
+
+    def introspection_json(self):
+        """Returns the standard introspection response serialized to JSON bytes, computed once,
+        to be written as is in the body of an HTTP response.
+        """
+        result = self.get_introspection_result()
+        cached = self._introspection
+        if cached[2] is None:
+            cached[2] = json.dumps(result.formatted, separators=(',', ':')).encode('utf-8')
+        return cached[2]
+
+    def is_introspection_document(self, document, operation_name=None):
+        """Check if a document is the standard ``introspection_query``, whatever its formatting,
+        and if ``operation_name`` selects its operation. The check is done once per document.
+        """
+        if operation_name is not None and operation_name != 'IntrospectionQuery':
+            return False
+        is_introspection = self._introspection_documents.get(document)
+        if is_introspection is None:
+            definitions = document.definitions
+            if not definitions or definitions[0].name is None or definitions[0].name.value != 'IntrospectionQuery':
+                is_introspection = False
+            else:
+                is_introspection = document is get_introspection_document() or print_ast(document) == get_printed_introspection_query()
+            self._introspection_documents[document] = is_introspection
+        return is_introspection
+
     def __getattr__(self, type_name):
         """
         This function let the developer select a type in a given schema
@@ -106,14 +377,283 @@ class Schema:
             return _type.graphene_type
         return _type
 
-    def execute(self, *args, **kwargs):
+    @property
+    def has_cache_hints(self):
+        """Whether any field or object type of the schema declares a cache-control hint."""
+        if self._has_cache_hints is None:
+            self._has_cache_hints = has_cache_hints(self.graphql_schema)
+        return self._has_cache_hints
+
+    def get_cache_policy(self, document, operation_name=None):
+        """Returns the ``CachePolicy`` of an operation of a validated document, computed once
+        per document from the cache-control hints of the fields it selects, or ``None`` if the
+        schema declares no hints.
+        """
+        if not self.has_cache_hints:
+            return None
+        policies = self._cache_policies.get(document)
+        if policies is None:
+            policies = self._cache_policies[document] = {}
+        policy = policies.get(operation_name)
+        if policy is None:
+            operation = get_operation_ast(document, operation_name)
+            if operation is None:
+                return None
+            fragments = {definition.name.value: definition for definition in document.definitions if isinstance(definition, FragmentDefinitionNode)}
+            policy = policies[operation_name] = CachePolicyCalculator(self.graphql_schema, fragments, self.default_max_age).get_policy(operation)
+        return policy
+
+    def with_cache_policy(self, result, document, operation_name=None):
+        """Returns ``result`` with the ``cache_policy`` of the operation, if the schema declares
+        cache-control hints. Responses with errors are not cacheable.
+        """
+        policy = self.get_cache_policy(document, operation_name)
+        if policy is None:
+            return result
+        if result.errors:
+            policy = policy._replace(max_age=0)
+        return CacheControlledExecutionResult(result.data, result.errors, result.extensions, policy)
+
+    def get_document(self, request_string, validation_rules=None, document=None, observer=None):
+        """Parse and validate a GraphQL request against the schema.
+        Results for string requests are kept in the schema's document cache, keyed by the
+        request text and the validation rules in use, so repeated requests skip straight
+        to execution.
+        Args:
+            request_string (str, Source or DocumentNode): GraphQL request to parse and validate.
+            validation_rules (Collection[Type[ASTValidationRule]], optional): Rules to validate
+                the document with. Defaults to the rules defined by the GraphQL spec.
+            document (DocumentNode, optional): Already parsed form of ``request_string``, used
+                instead of parsing it on a cache miss.
+            observer (optional): Object notified through its ``phase_start(phase)`` and
+                ``phase_end(phase, document, errors)`` methods of the ``'parsing'`` and
+                ``'validation'`` phases, such as a ``Trace`` or an ``InstrumentedOperation``.
+        Returns:
+            Tuple of the parsed ``DocumentNode`` (``None`` if parsing failed) and the list of
+            ``GraphQLError`` found while validating the schema or the document.
+        """
+        schema_validation_errors = validate_schema(self.graphql_schema)
+        if schema_validation_errors:
+            return (None, schema_validation_errors)
+        if validation_rules is not None:
+            validation_rules = tuple(validation_rules)
+        cache = self.document_cache
+        key = None
+        if isinstance(request_string, DocumentNode):
+            document = request_string
+        else:
+            if cache is not None:
+                key = (request_string.body if isinstance(request_string, Source) else request_string, validation_rules)
+                cached = cache.get(key)
+                if cached is not None:
+                    return cached
+            if document is None:
+                if observer is not None:
+                    observer.phase_start('parsing')
+                try:
+                    document = parse(request_string)
+                except GraphQLError as error:
+                    if observer is not None:
+                        observer.phase_end('parsing', None, [error])
+                    return (None, [error])
+                if observer is not None:
+                    observer.phase_end('parsing', document)
+        if observer is None:
+            result = (document, validate(self.graphql_schema, document, validation_rules))
+        else:
+            observer.phase_start('validation')
+            result = (document, validate(self.graphql_schema, document, validation_rules))
+            observer.phase_end('validation', *result)
+        if key is not None:
+            cache[key] = result
+        return result
+
+    def get_persisted_document(self, query_hash, request_string=None, validation_rules=None, observer=None):
+        """Resolve a persisted query by its SHA-256 hash, then validate it like `get_document`.
+        When the request text is sent along with an unknown hash, it is checked against the hash
+        and registered in the store once it validates (automatic persisted queries).
+        Args:
+            query_hash (str): Hex SHA-256 digest of the query text.
+            request_string (str, Source or DocumentNode, optional): Query to register if the
+                hash is unknown.
+            validation_rules (Collection[Type[ASTValidationRule]], optional): Rules to validate
+                the document with. Defaults to the rules defined by the GraphQL spec.
+        Returns:
+            Tuple of the ``DocumentNode`` (``None`` if it can't be resolved) and a list of
+            ``GraphQLError``.
+        """
+        store = self.persisted_queries
+        if store is None:
+            return (None, [GraphQLError('PersistedQueryNotSupported', extensions={'code': 'PERSISTED_QUERY_NOT_SUPPORTED'})])
+        query = get_query_text(request_string) if request_string is not None else None
+        if query is not None and get_query_hash(query) != query_hash:
+            return (None, [GraphQLError('Provided sha256Hash does not match query', extensions={'code': 'PERSISTED_QUERY_HASH_MISMATCH'})])
+        persisted = store.get(query_hash)
+        if persisted is not None:
+            return self.get_document(persisted.query, validation_rules, persisted.document, observer)
+        if request_string is None or store.readonly:
+            return (None, [GraphQLError('PersistedQueryNotFound', extensions={'code': 'PERSISTED_QUERY_NOT_FOUND'})])
+        document, errors = self.get_document(request_string, validation_rules, observer=observer)
+        if not errors:
+            store.set(query_hash, query, document)
+        return (document, errors)
+
+    def compile(self, request_string, operation_name=None, validation_rules=None):
+        """Compile a GraphQL request into a reusable execution plan for a hot operation.
+        Args:
+            request_string (str or Document): GraphQL request to compile.
+            operation_name (str, optional): Operation to compile if the request defines several.
+            validation_rules (Collection[Type[ASTValidationRule]], optional): Rules to validate
+                the request with. Defaults to the rules defined by the GraphQL spec.
+        Returns:
+            :obj:`CompiledQuery`, whose ``execute`` and ``execute_async`` methods return the same
+            ``ExecutionResult`` as the schema's.
+        Raises:
+            GraphQLError: the first error found parsing or validating the request.
+        """
+        document, errors = self.get_document(request_string, validation_rules)
+        if errors:
+            raise errors[0]
+        return CompiledQuery(self, document, operation_name)
+
+    def _prepare_document(self, request_string, query_hash, validation_rules, observer=None):
+        if query_hash is not None:
+            return self.get_persisted_document(query_hash, request_string, validation_rules, observer)
+        return self.get_document(request_string, validation_rules, observer=observer)
+
+    def start_operation(self, request_string, kwargs, trace=None):
+        """Returns the ``InstrumentedOperation`` of a request, once its start hooks are called."""
+        operation = InstrumentedOperation(self.instrumentation, request_string, kwargs, trace, self)
+        operation.start()
+        return operation
+
+    def instrument_execution(self, operation, document, kwargs):
+        """
+        Calls the execute start hooks and installs the resolve hooks of an operation. Returns
+        the token resetting the ``current_operation``, set to the operation for its execution.
+        """
+        operation.execute_start(document)
+        middleware = operation.get_middleware()
+        if middleware is not None:
+            add_execution_middleware(kwargs, middleware)
+        return current_operation.set(operation)
+
+    def get_middleware_manager(self, middleware):
+        """
+        Returns the ``FieldMiddlewareManager`` of the given middleware, reused by the operations
+        executed with the same middleware so the middleware chain of each field is only built
+        once, and only with the middleware that apply to the field.
+        """
+        if isinstance(middleware, MiddlewareManager):
+            return middleware
+        middleware = tuple(middleware)
+        try:
+            manager = self.middleware_managers.get(middleware)
+        except TypeError:
+            return FieldMiddlewareManager(self.graphql_schema, *middleware)
+        if manager is None:
+            manager = self.middleware_managers[middleware] = FieldMiddlewareManager(self.graphql_schema, *middleware)
+        return manager
+
+    def finish_operation(self, result, document, kwargs, trace=None, operation=None):
+        """Completes the result of an operation with its trace and cache policy, and calls
+        the end hooks of its instrumentation.
+        """
+        if trace is not None:
+            result = self.with_trace(result, trace)
+        if document is not None and self.has_cache_hints:
+            result = self.with_cache_policy(result, document, kwargs.get('operation_name'))
+        if operation is not None:
+            operation.end(result)
+        return result
+
+    def with_trace(self, result, trace):
+        """Returns ``result`` with the finished ``trace`` in its ``tracing`` extension."""
+        trace.finish()
+        return ExecutionResult(result.data, result.errors, dict(result.extensions or {}, tracing=trace.format()))
+
+    def get_response_cache_key(self, document, kwargs, cache_scope=None):
+        """Returns the key of a request in the response cache, or ``None`` if its result can't
+        be cached: only query operations are.
+        """
+        operation_name = kwargs.get('operation_name')
+        operation = get_operation_ast(document, operation_name)
+        if operation is None or operation.operation != OperationType.QUERY:
+            return None
+        return self.response_cache.get_key(document, operation_name, kwargs.get('variable_values'), cache_scope)
+
+    def begin_execution(self, request_string, args, kwargs, query_hash=None, validation_rules=None, cache_scope=None):
+        """
+        Runs the steps of ``execute`` and ``execute_async`` preceding the execution of a request:
+        starting its trace and instrumented operation, getting its document, looking up the
+        introspection and response caches, and installing the middleware. Returns the
+        ``ExecutionRequest``, whose ``result`` is already set if it doesn't need to be executed.
+        """
+        if 'source' in kwargs:
+            if request_string is not None:
+                raise TypeError('The GraphQL request was given both as request_string and source.')
+            request_string = kwargs.pop('source')
+        if request_string is None and query_hash is None:
+            raise TypeError('No GraphQL request given: pass a request_string (or source) or a query_hash.')
+        kwargs = normalize_execute_kwargs(kwargs)
+        trace = self.tracing.start_trace() if self.tracing is not None else None
+        operation = self.start_operation(request_string, kwargs, trace) if self.instrumentation else None
+        request = ExecutionRequest(kwargs, trace, operation)
+        document, errors = self._prepare_document(request_string, query_hash, validation_rules, operation or trace)
+        if errors:
+            request.result = self.finish_operation(ExecutionResult(data=None, errors=errors), None, kwargs, trace, operation)
+            return request
+        request.document = document
+        if len(args) < 7 and not kwargs.get('middleware') and self.is_introspection_document(document, kwargs.get('operation_name')):
+            request.result = self.finish_operation(self.get_introspection_result(), document, kwargs, trace, operation)
+            return request
+        if self.response_cache is not None and not args:
+            request.cache_key = self.get_response_cache_key(document, kwargs, cache_scope)
+            if request.cache_key is not None:
+                data = self.response_cache.get(request.cache_key)
+                if data is not None:
+                    request.result = self.complete_result(request, ExecutionResult(data=data))
+                    return request
+        if trace is not None:
+            add_execution_middleware(kwargs, tracing_middleware, innermost=True)
+            request.trace_token = current_trace.set(trace)
+        if operation is not None:
+            request.operation_token = self.instrument_execution(operation, document, kwargs)
+        if kwargs.get('middleware'):
+            kwargs['middleware'] = self.get_middleware_manager(kwargs['middleware'])
+        return request
+
+    def end_execution(self, request, result):
+        """
+        Runs the steps of ``execute`` and ``execute_async`` following the execution of a request,
+        and returns its complete result.
+        """
+        if request.operation is not None:
+            request.operation.execute_end(result)
+        if request.cache_key is not None and not result.errors:
+            self.response_cache.set(request.cache_key, result.data)
+        return self.complete_result(request, result)
+
+    def complete_result(self, request, result):
+        if request.trace is None and request.operation is None and self._has_cache_hints is False:
+            return result
+        return self.finish_operation(result, request.document, request.kwargs, request.trace, request.operation)
+
+    def execute(self, request_string=None, *args, query_hash=None, validation_rules=None, cache_scope=None, **kwargs):
         """Execute a GraphQL query on the schema.
-        Use the `graphql_sync` function from `graphql-core` to provide the result
-        for a query string. Most of the time this method will be called by one of the Graphene
-        :ref:`Integrations` via a web request.
+        Use the `execute_sync` function from `graphql-core` to provide the result
+        for a query string, once parsed and validated through `get_document`. Most of the time
+        this method will be called by one of the Graphene :ref:`Integrations` via a web request.
         Args:
             request_string (str or Document): GraphQL request (query, mutation or subscription)
-                as string or parsed AST form from `graphql-core`.
+                as string or parsed AST form from `graphql-core`. Can also be given as `source`,
+                like to `graphql-core`. May be omitted when a `query_hash` is given.
+            query_hash (str, optional): SHA-256 hash of a query persisted in the schema's
+                `persisted_queries` store.
+            validation_rules (Collection[Type[ASTValidationRule]], optional): Validation rules to
+                check the request with instead of the rules defined by the GraphQL spec.
+            cache_scope (str, optional): Audience of the request (tenant, locale...) when the
+                schema has a `response_cache`: cached results are only shared within a scope.
             root_value (Any, optional): Value to use as the parent value object when resolving
                 root types.
             context_value (Any, optional): Value to be made available to all resolvers via
@@ -128,17 +668,66 @@ class Schema:
             execution_context_class (ExecutionContext, optional): The execution context class
                 to use when resolving queries and mutations.
         Returns:
-            :obj:`ExecutionResult` containing any data and errors for the operation.
+            :obj:`ExecutionResult` containing any data and errors for the operation. If the
+            schema declares cache-control hints, its ``cache_policy`` attribute holds the
+            ``CachePolicy`` of the response.
         """
-        kwargs = normalize_execute_kwargs(kwargs)
-        return graphql_sync(self.graphql_schema, *args, **kwargs)
+        request = self.begin_execution(request_string, args, kwargs, query_hash, validation_rules, cache_scope)
+        if request.result is not None:
+            return request.result
+        try:
+            result = execute_sync(self.graphql_schema, request.document, *args, **request.kwargs)
+        finally:
+            request.reset_context()
+        return self.end_execution(request, result)
 
-    async def execute_async(self, *args, **kwargs):
+    async def execute_async(self, request_string=None, *args, query_hash=None, validation_rules=None, cache_scope=None, **kwargs):
         """Execute a GraphQL query on the schema asynchronously.
-        Same as `execute`, but uses `graphql` instead of `graphql_sync`.
+        Same as `execute`, but uses `execute` instead of `execute_sync`.
         """
-        kwargs = normalize_execute_kwargs(kwargs)
-        return await graphql(self.graphql_schema, *args, **kwargs)
+        request = self.begin_execution(request_string, args, kwargs, query_hash, validation_rules, cache_scope)
+        if request.result is not None:
+            return request.result
+        try:
+            result = execute(self.graphql_schema, request.document, *args, **request.kwargs)
+            if isawaitable(result):
+                result = await result
+        finally:
+            request.reset_context()
+        return self.end_execution(request, result)
+
+    async def execute_batch(self, requests, max_concurrency=None, **kwargs):
+        """Execute a batch of GraphQL operations concurrently on the current event loop.
+        All the operations share the given keyword arguments (``context``, ``root``,
+        ``middleware``...), so the DataLoaders of a shared context batch their loads across
+        the whole batch.
+        Args:
+            requests (Iterable[Mapping]): Operations to execute. Each one is a mapping of the
+                keyword arguments of `execute_async`, where the HTTP names ``query`` and
+                ``operationName`` can be used for ``request_string`` and ``operation_name``.
+            max_concurrency (int, optional): Maximum number of operations executing at the
+                same time. Unbounded by default.
+            **kwargs: Keyword arguments of `execute_async` applied to every operation.
+        Returns:
+            List of :obj:`ExecutionResult`, in the order of ``requests``. An operation failing
+            unexpectedly gets an errored result and does not affect the others.
+        """
+        semaphore = Semaphore(max_concurrency) if max_concurrency else None
+
+        async def execute_request(request):
+            try:
+                request_kwargs = dict(kwargs, **request)
+                if 'query' in request_kwargs:
+                    request_kwargs['request_string'] = request_kwargs.pop('query')
+                if 'operationName' in request_kwargs:
+                    request_kwargs['operation_name'] = request_kwargs.pop('operationName')
+                if semaphore is None:
+                    return await self.execute_async(**request_kwargs)
+                async with semaphore:
+                    return await self.execute_async(**request_kwargs)
+            except Exception as error:
+                return ExecutionResult(data=None, errors=[GraphQLError(str(error), original_error=error)])
+        return list(await gather(*(execute_request(request) for request in requests)))
 
     async def subscribe(self, query, *args, **kwargs):
         """Execute a GraphQL subscription on the schema asynchronously."""
@@ -0,0 +1,82 @@
+"""
+Snapshots of built schemas, so pre-forked workers can restore a schema from a file instead of
+building it from the Graphene type definitions at import time.
+"""
+import json
+import pickle
+import sys
+from functools import partial
+from hashlib import sha256
+from importlib.util import find_spec
+import graphql
+from .definitions import GrapheneGraphQLType
+SNAPSHOT_MAGIC = b'GRAPHENE-SCHEMA-SNAPSHOT 1\n'
+
+def get_schema_modules(graphql_schema):
+    """Returns the names of the modules defining the Graphene types and resolvers of a schema."""
+    modules = set()
+    for graphql_type in graphql_schema.type_map.values():
+        if not isinstance(graphql_type, GrapheneGraphQLType):
+            continue
+        modules.add(graphql_type.graphene_type.__module__)
+        for field in getattr(graphql_type, 'fields', {}).values():
+            resolver = getattr(field, 'resolve', None)
+            while isinstance(resolver, partial):
+                resolver = resolver.func
+            module = getattr(resolver, '__module__', None)
+            if module:
+                modules.add(module)
+    return sorted(modules)
+
+def get_schema_fingerprint(modules):
+    """
+    Returns a fingerprint of the source of the given modules, combined with the versions of
+    Python, Graphene and graphql-core. The modules are located without being imported.
+    """
+    from .. import __version__
+    digest = sha256(f'{sys.version_info[:2]}:{__version__}:{graphql.__version__}'.encode('utf-8'))
+    for module in modules:
+        digest.update(module.encode('utf-8'))
+        try:
+            spec = find_spec(module)
+        except (ImportError, ValueError):
+            spec = None
+        origin = getattr(spec, 'origin', None)
+        if origin and spec.has_location:
+            with open(origin, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def save_schema_snapshot(schema, path):
+    """
+    Writes a snapshot of ``schema`` to ``path``: the fingerprint of the modules defining it,
+    followed by the pickled schema. The resolvers, and the Graphene types, must be picklable,
+    i.e. defined at the top level of their module.
+    """
+    modules = get_schema_modules(schema.graphql_schema)
+    header = {'fingerprint': get_schema_fingerprint(modules), 'modules': modules}
+    try:
+        payload = pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise TypeError(f'Schema can not be snapshotted, all its types and resolvers must be defined at the top level of a module: {error}') from error
+    with open(path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(json.dumps(header).encode('utf-8') + b'\n')
+        f.write(payload)
+
+def load_schema_snapshot(path):
+    """
+    Restores the schema snapshotted in ``path``. Returns ``None`` if there is no snapshot or
+    it is stale, i.e. the modules defining the schema (or the library versions) changed since
+    it was taken.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.readline() != SNAPSHOT_MAGIC:
+                return None
+            header = json.loads(f.readline())
+            if get_schema_fingerprint(header['modules']) != header['fingerprint']:
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
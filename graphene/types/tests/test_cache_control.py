@@ -0,0 +1,104 @@
+from ..cache_control import PRIVATE, CacheHint, CachePolicy
+from ..field import Field
+from ..objecttype import ObjectType
+from ..scalars import Float, String
+from ..schema import Schema
+from ..structures import List
+
+
+class User(ObjectType):
+    name = String()
+
+    class Meta:
+        cache_control = CacheHint(max_age=60, scope=PRIVATE)
+
+
+class Product(ObjectType):
+    name = String()
+    price = Float(cache_control=CacheHint(max_age=30))
+    owner = Field(User)
+
+    class Meta:
+        cache_control = CacheHint(max_age=300)
+
+
+class Query(ObjectType):
+    products = Field(List(Product), cache_control=CacheHint(max_age=120))
+    me = Field(User)
+    version = String(cache_control=CacheHint(max_age=600))
+    status = String()
+
+    def resolve_products(root, info):
+        return [Product(name="Chair", price=10.0, owner=User(name="Ana"))]
+
+    def resolve_me(root, info):
+        return User(name="Ana")
+
+    def resolve_version(root, info):
+        return "1"
+
+    def resolve_status(root, info):
+        return "ok"
+
+
+schema = Schema(query=Query)
+
+
+def test_cache_policy_field_hint():
+    result = schema.execute("{ version }")
+    assert result.data == {"version": "1"}
+    assert result.cache_policy == CachePolicy(600, "PUBLIC")
+    assert result.cache_policy.http_header() == "max-age=600, public"
+
+
+def test_cache_policy_minimum_max_age():
+    result = schema.execute("{ version products { name } }")
+    assert result.cache_policy == CachePolicy(120, "PUBLIC")
+
+    result = schema.execute("{ products { name price } }")
+    assert result.cache_policy == CachePolicy(30, "PUBLIC")
+
+
+def test_cache_policy_private_type_hint():
+    result = schema.execute("{ products { owner { name } } }")
+    assert result.cache_policy == CachePolicy(60, "PRIVATE")
+    assert result.cache_policy.http_header() == "max-age=60, private"
+
+
+def test_cache_policy_root_field_without_hint():
+    result = schema.execute("{ version status }")
+    assert result.cache_policy == CachePolicy(0, "PUBLIC")
+    assert result.cache_policy.http_header() == "no-store"
+
+
+def test_cache_policy_default_max_age():
+    schema = Schema(query=Query, default_max_age=10)
+    result = schema.execute("{ version status }")
+    assert result.cache_policy == CachePolicy(10, "PUBLIC")
+
+
+def test_cache_policy_computed_once_per_document():
+    document, _ = schema.get_document("{ version }")
+    assert schema.get_cache_policy(document) is schema.get_cache_policy(document)
+
+
+def test_cache_policy_not_cacheable_with_errors():
+    class ErrorQuery(ObjectType):
+        version = String(cache_control=CacheHint(max_age=600))
+
+        def resolve_version(root, info):
+            raise Exception("Unavailable")
+
+    result = Schema(query=ErrorQuery).execute("{ version }")
+    assert result.errors
+    assert not result.cache_policy.cacheable
+
+
+def test_no_cache_policy_without_hints():
+    class PlainQuery(ObjectType):
+        version = String()
+
+    schema = Schema(query=PlainQuery)
+    result = schema.execute("{ version }")
+    assert not schema.has_cache_hints
+    assert not hasattr(result, "cache_policy")
@@ -0,0 +1,119 @@
+from pytest import raises
+
+from graphql import GraphQLError
+
+from ..argument import Argument
+from ..compiled_query import CompiledQuery
+from ..field import Field
+from ..inputobjecttype import InputObjectType
+from ..objecttype import ObjectType
+from ..scalars import Int, String
+from ..schema import Schema
+from ..structures import List
+
+
+class Filter(InputObjectType):
+    tags = List(String)
+
+
+class Item(ObjectType):
+    id = Int()
+    label = String(prefix=String(default_value=""))
+
+    def resolve_label(root, info, prefix):
+        return f"{prefix}{root.id}"
+
+
+class Query(ObjectType):
+    items = List(Item, first=Int(), filter=Argument(Filter))
+
+    def resolve_items(root, info, first=3, filter=None):
+        return [Item(id=i) for i in range(first)]
+
+
+schema = Schema(Query)
+
+
+def test_compile_returns_compiled_query():
+    compiled = schema.compile("{ items { id } }")
+
+    assert isinstance(compiled, CompiledQuery)
+    assert compiled.static_fields
+
+
+def test_compile_raises_validation_error():
+    with raises(GraphQLError) as exc_info:
+        schema.compile("{ unknown }")
+
+    assert exc_info.value.message == "Cannot query field 'unknown' on type 'Query'."
+
+
+def test_compile_unknown_operation_name():
+    with raises(GraphQLError) as exc_info:
+        schema.compile("query A { items { id } }", operation_name="B")
+
+    assert exc_info.value.message == "Unknown operation named 'B'."
+
+
+def test_compiled_query_folds_constant_arguments():
+    compiled = schema.compile(
+        'query ($first: Int) { a: items(first: 2) { label(prefix: "#") } '
+        "b: items(first: $first) { id } }"
+    )
+
+    result = compiled.execute(variables={"first": 1})
+
+    assert not result.errors
+    assert result.data == {"a": [{"label": "#0"}, {"label": "#1"}], "b": [{"id": 0}]}
+    constant_args = [plan.args for plan in compiled.field_plans.values()]
+    assert {"first": 2} in constant_args
+    assert {"prefix": "#"} in constant_args
+    assert None in constant_args
+
+
+def test_compiled_query_with_new_variables():
+    query = "query ($first: Int) { items(first: $first) { id label } }"
+    compiled = schema.compile(query)
+
+    for first in (1, 2, 5):
+        variables = {"first": first}
+        assert compiled.execute(variables=variables) == schema.execute(
+            query, variables=variables
+        )
+
+
+def test_compiled_query_variable_directives():
+    query = "query ($skip: Boolean!) { items { id label @skip(if: $skip) } }"
+    compiled = schema.compile(query)
+    assert not compiled.static_fields
+
+    assert compiled.execute(variables={"skip": True}).data == {
+        "items": [{"id": 0}, {"id": 1}, {"id": 2}]
+    }
+    assert compiled.execute(variables={"skip": False}) == schema.execute(
+        query, variables={"skip": False}
+    )
+
+
+def test_compiled_query_middleware():
+    def upper(next, root, info, **args):
+        value = next(root, info, **args)
+        return value.upper() if isinstance(value, str) else value
+
+    query = '{ items(first: 1) { label(prefix: "a") } }'
+    compiled = schema.compile(query)
+
+    assert compiled.execute(middleware=[upper]).data == {"items": [{"label": "A0"}]}
+
+
+def test_compiled_query_resolver_error():
+    class Query(ObjectType):
+        fail = Field(String)
+
+        def resolve_fail(root, info):
+            raise Exception("Failed")
+
+    schema = Schema(Query)
+    compiled = schema.compile("{ fail }")
+
+    assert compiled.execute() == schema.execute("{ fail }")
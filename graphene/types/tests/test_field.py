@@ -126,6 +126,17 @@ def test_field_name_as_argument():
     assert field.args["name"].type == String
 
 
+def test_field_options_reject_arguments():
+    MyType = object()
+    for option in ("run_in_thread", "run_in_process", "cost", "cache", "cache_control"):
+        with raises(ValueError) as exc_info:
+            Field(MyType, **{option: String()})
+        assert f'use args={{"{option}": ...}}' in str(exc_info.value)
+
+        field = Field(MyType, args={option: String()})
+        assert field.args[option].type == String
+
+
 def test_field_source_argument_as_kw():
     MyType = object()
     deprecation_reason = "deprecated"
@@ -0,0 +1,214 @@
+from asyncio import gather, sleep
+
+from graphql import ExecutionResult
+
+from pytest import mark
+
+from ...utils.dataloader import DataLoader, RequestDataLoaderStats
+from ..instrumentation import (
+    DataLoaderStatsInstrumentation,
+    InMemoryInstrumentation,
+    Instrumentation,
+    InstrumentedOperation,
+)
+from ..objecttype import ObjectType
+from ..scalars import Int, String
+from ..schema import Schema
+from ..structures import List
+
+
+class Pet(ObjectType):
+    name = String()
+
+
+class Query(ObjectType):
+    hello = String()
+    pets = List(Pet)
+    slow = String()
+    fail = String()
+    names = List(String)
+
+    def resolve_hello(root, info):
+        return "World"
+
+    def resolve_pets(root, info):
+        return [Pet(name="Rex")]
+
+    async def resolve_slow(root, info):
+        await sleep(0.01)
+        return "Done"
+
+    def resolve_fail(root, info):
+        raise Exception("Failed")
+
+    async def resolve_names(root, info):
+        return await info.context["name_loader"].load_many(["a", "b", "a"])
+
+
+def test_instrumentation_spans():
+    recorder = InMemoryInstrumentation()
+    schema = Schema(query=Query, instrumentation=[recorder])
+    result = schema.execute("query Hello { hello pets { name } }")
+    assert not result.errors
+
+    assert [span.name for span in recorder.spans] == [
+        "operation",
+        "parse",
+        "validate",
+        "execute",
+        "resolve",
+        "resolve",
+        "resolve",
+    ]
+    (operation,) = recorder.get_spans("operation")
+    assert operation.attributes == {"operation_name": None, "errors": 0}
+    assert [span.attributes["path"] for span in recorder.get_spans("resolve")] == [
+        ["hello"],
+        ["pets"],
+        ["pets", 0, "name"],
+    ]
+    for span in recorder.spans:
+        assert span.duration >= 0
+        assert span.parent is (None if span is operation else operation)
+
+
+def test_instrumentation_cached_document_skips_parse_and_validate():
+    recorder = InMemoryInstrumentation()
+    schema = Schema(query=Query, instrumentation=[recorder])
+    schema.execute("{ hello }")
+    del recorder.spans[:]
+    schema.execute("{ hello }")
+    assert [span.name for span in recorder.spans] == ["operation", "execute", "resolve"]
+
+
+def test_instrumentation_validation_errors():
+    recorder = InMemoryInstrumentation()
+    schema = Schema(query=Query, instrumentation=[recorder])
+    result = schema.execute("{ unknown }")
+    assert result.errors
+    assert [span.name for span in recorder.spans] == ["operation", "parse", "validate"]
+    assert recorder.get_spans("operation")[0].attributes["errors"] == 1
+
+
+def test_instrumentation_resolve_error():
+    recorder = InMemoryInstrumentation()
+    schema = Schema(query=Query, instrumentation=[recorder])
+    schema.execute("{ fail }")
+    (span,) = recorder.get_spans("resolve")
+    assert str(span.attributes["error"]) == "Failed"
+
+
+@mark.asyncio
+async def test_instrumentation_async_resolve():
+    recorder = InMemoryInstrumentation()
+    schema = Schema(query=Query, instrumentation=[recorder])
+    result = await schema.execute_async("{ slow }")
+    assert result.data == {"slow": "Done"}
+    (span,) = recorder.get_spans("resolve")
+    assert span.duration >= 10_000_000
+
+
+@mark.asyncio
+async def test_instrumentation_concurrent_operations_with_same_name():
+    class WaitQuery(ObjectType):
+        wait = String(ms=Int())
+
+        async def resolve_wait(root, info, ms):
+            await sleep(ms / 1000)
+            return "Done"
+
+    recorder = InMemoryInstrumentation()
+    schema = Schema(query=WaitQuery, instrumentation=[recorder])
+    query = "query Wait($ms: Int) { wait(ms: $ms) }"
+    results = await gather(
+        schema.execute_async(query, variables={"ms": 1}),
+        schema.execute_async(query, variables={"ms": 20}),
+    )
+    assert [result.data for result in results] == [{"wait": "Done"}] * 2
+
+    operations = recorder.get_spans("operation")
+    assert len(operations) == 2
+    for span in recorder.spans:
+        if span.parent is not None:
+            assert span.parent.start <= span.start <= span.end <= span.parent.end
+    for operation in operations:
+        (execute,) = [
+            span for span in recorder.get_spans("execute") if span.parent is operation
+        ]
+        (resolve,) = [
+            span for span in recorder.get_spans("resolve") if span.parent is operation
+        ]
+        assert execute.start <= resolve.start <= resolve.end <= execute.end
+
+
+def test_instrumentation_hooks_order():
+    calls = []
+
+    class Recorder(Instrumentation):
+        def __init__(self, name):
+            self.name = name
+
+        def on_operation_start(self, operation):
+            calls.append((self.name, "start", operation.request_string))
+
+        def on_operation_end(self, operation):
+            calls.append((self.name, "end", operation.result.data))
+
+    schema = Schema(query=Query, instrumentation=[Recorder("a"), Recorder("b")])
+    schema.execute("{ hello }")
+    assert calls == [
+        ("a", "start", "{ hello }"),
+        ("b", "start", "{ hello }"),
+        ("b", "end", {"hello": "World"}),
+        ("a", "end", {"hello": "World"}),
+    ]
+
+
+def test_instrumentation_without_resolve_hooks_adds_no_middleware():
+    operation = InstrumentedOperation((Instrumentation(),), "{ hello }", {})
+    assert operation.get_middleware() is None
+    operation = InstrumentedOperation((InMemoryInstrumentation(),), "{ hello }", {})
+    assert operation.get_middleware() is not None
+
+
+@mark.asyncio
+async def test_dataloader_stats_instrumentation():
+    async def load_names(keys):
+        return [key.upper() for key in keys]
+
+    stats = RequestDataLoaderStats()
+    context = {
+        "dataloader_stats": stats,
+        "name_loader": DataLoader(load_names, stats=stats.for_loader("names")),
+    }
+    schema = Schema(query=Query, instrumentation=[DataLoaderStatsInstrumentation()])
+    result = await schema.execute_async("{ names }", context_value=context)
+    assert result.data == {"names": ["A", "B", "A"]}
+    names_stats = result.extensions["dataloaders"]["names"]
+    assert names_stats["loads"] == 3
+    assert names_stats["cache_hits"] == 1
+    assert names_stats["batches"] == 1
+    assert names_stats["batch_size"]["max"] == 2
+
+
+def test_dataloader_stats_instrumentation_without_stats():
+    operation = InstrumentedOperation((), "{ hello }", {"context_value": {}})
+    operation.result = ExecutionResult({"hello": "World"})
+    DataLoaderStatsInstrumentation().on_execute_end(operation)
+    assert operation.result.extensions is None
+
+
+def test_instrumentation_resolve_hooks_middleware_is_shared():
+    instrumentation = (InMemoryInstrumentation(),)
+    first = InstrumentedOperation(instrumentation, "{ hello }", {})
+    second = InstrumentedOperation(instrumentation, "{ pets { name } }", {})
+    assert first.get_middleware() is second.get_middleware()
+
+
+def test_instrumentation_reuses_middleware_manager():
+    instrumentation = InMemoryInstrumentation()
+    schema = Schema(query=Query, instrumentation=[instrumentation])
+    schema.execute("{ hello }")
+    schema.execute("{ hello }")
+    assert len(schema.middleware_managers) == 1
+    assert len(instrumentation.get_spans("resolve")) == 2
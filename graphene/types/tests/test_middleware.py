@@ -0,0 +1,103 @@
+from ..middleware import FieldMiddlewareManager, SelectiveMiddleware
+from ..objecttype import ObjectType
+from ..scalars import String
+from ..schema import Schema
+from ..structures import List
+
+
+class Pet(ObjectType):
+    name = String()
+    owner = String()
+
+
+class Query(ObjectType):
+    hello = String()
+    pets = List(Pet)
+
+    def resolve_hello(root, info):
+        return "World"
+
+    def resolve_pets(root, info):
+        return [Pet(name="Rex"), Pet(name="Tom")]
+
+
+schema = Schema(query=Query)
+query = "{ hello pets { name owner } }"
+
+
+def make_middleware():
+    calls = []
+
+    def middleware(next_, root, info, **args):
+        calls.append(f"{info.parent_type.name}.{info.field_name}")
+        return next_(root, info, **args)
+
+    return middleware, calls
+
+
+def test_middleware_applies_to_all_fields():
+    middleware, calls = make_middleware()
+    result = schema.execute(query, middleware=[middleware])
+    assert not result.errors
+    assert calls == [
+        "Query.hello",
+        "Query.pets",
+        "Pet.name",
+        "Pet.owner",
+        "Pet.name",
+        "Pet.owner",
+    ]
+
+
+def test_selective_middleware_custom_resolvers():
+    middleware, calls = make_middleware()
+    result = schema.execute(
+        query, middleware=[SelectiveMiddleware(middleware, custom_resolvers=True)]
+    )
+    assert result.data["pets"] == [
+        {"name": "Rex", "owner": None},
+        {"name": "Tom", "owner": None},
+    ]
+    assert calls == ["Query.hello", "Query.pets"]
+
+
+def test_selective_middleware_types():
+    middleware, calls = make_middleware()
+    schema.execute(query, middleware=[SelectiveMiddleware(middleware, types=[Pet])])
+    assert calls == ["Pet.name", "Pet.owner", "Pet.name", "Pet.owner"]
+
+
+def test_selective_middleware_predicate():
+    middleware, calls = make_middleware()
+    selective = SelectiveMiddleware(
+        middleware, predicate=lambda parent_type, field_name, field: field_name == "owner"
+    )
+    schema.execute(query, middleware=[selective])
+    assert calls == ["Pet.owner", "Pet.owner"]
+
+
+def test_middleware_applies_to_method():
+    calls = []
+
+    class PetMiddleware:
+        def applies_to(self, parent_type, field_name, field):
+            return parent_type.name == "Pet"
+
+        def resolve(self, next_, root, info, **args):
+            calls.append(info.field_name)
+            return next_(root, info, **args)
+
+    schema.execute(query, middleware=[PetMiddleware()])
+    assert calls == ["name", "owner", "name", "owner"]
+
+
+def test_middleware_manager_reused_across_operations():
+    middleware = SelectiveMiddleware(make_middleware()[0], custom_resolvers=True)
+    manager = schema.get_middleware_manager([middleware])
+    assert isinstance(manager, FieldMiddlewareManager)
+    assert schema.get_middleware_manager([middleware]) is manager
+
+    resolve_hello = schema.graphql_schema.query_type.fields["hello"].resolve
+    assert manager.get_field_resolver(resolve_hello) is manager.get_field_resolver(
+        resolve_hello
+    )
@@ -3,6 +3,7 @@ from pytest import raises
 from ..field import Field
 from ..interface import Interface
 from ..objecttype import ObjectType
+from ..resolver import dict_or_attr_resolver
 from ..scalars import String
 from ..schema import Schema
 from ..structures import NonNull
@@ -307,3 +308,71 @@ def test_objecttype_type_name():
         pass
 
     assert MyObjectType._meta.name == "FooType"
+
+
+class SlottedContainer(ObjectType):
+    field1 = String()
+    field2 = String(default_value="default")
+
+    class Meta:
+        slots = True
+
+
+def test_objecttype_slots():
+    container = SlottedContainer("1", field2="2")
+    assert not hasattr(container, "__dict__")
+    assert container.field1 == "1"
+    assert container.field2 == "2"
+    assert SlottedContainer().field2 == "default"
+    assert container == SlottedContainer("1", "2")
+    assert repr(container) == "SlottedContainer(field1='1', field2='2')"
+    assert list(SlottedContainer._meta.fields) == ["field1", "field2"]
+    assert SlottedContainer._meta.slots
+
+    with raises(AttributeError):
+        container.field3 = "3"
+
+
+def test_objecttype_slots_default_resolver():
+    container = SlottedContainer("1")
+    resolver = SlottedContainer._meta.fields["field1"]
+    assert resolver.default_value is None
+    assert dict_or_attr_resolver("field1", None, container, None) == "1"
+    del container.field1
+    assert dict_or_attr_resolver("field1", "missing", container, None) == "missing"
+
+
+def test_objecttype_slots_inheritance():
+    class SlottedChild(SlottedContainer):
+        field3 = String()
+
+        class Meta:
+            slots = True
+
+    class Child(SlottedContainer):
+        field3 = String()
+
+    for child_type in (SlottedChild, Child):
+        child = child_type("1", "2", "3")
+        assert list(child_type._meta.fields) == ["field1", "field2", "field3"]
+        assert (child.field1, child.field2, child.field3) == ("1", "2", "3")
+
+    assert not hasattr(SlottedChild("1"), "__dict__")
+    assert hasattr(Child("1"), "__dict__")
+
+
+def test_objecttype_slots_interface_fields():
+    from ...relay import Node
+
+    class SlottedNode(ObjectType):
+        name = String()
+
+        class Meta:
+            interfaces = (Node,)
+            slots = True
+
+    node = SlottedNode(id="1", name="Luke")
+    assert not hasattr(node, "__dict__")
+    assert (node.id, node.name) == ("1", "Luke")
+    assert list(SlottedNode._meta.fields) == ["id", "name"]
+    assert SlottedNode.__slots__ == ("name", "id")
@@ -1,10 +1,22 @@
+from dataclasses import dataclass
+from pickle import dumps, loads
+
+from pytest import raises
+
+from ..objecttype import ObjectType
 from ..resolver import (
+    ATTR_SHAPE,
+    DICT_SHAPE,
     attr_resolver,
     dict_resolver,
     dict_or_attr_resolver,
     get_default_resolver,
+    get_field_default_resolver,
+    get_root_shape,
+    is_default_resolver,
     set_default_resolver,
 )
+from ..scalars import String
 
 args = {}
 context = None
@@ -56,3 +68,113 @@ def test_set_default_resolver_workd():
     assert get_default_resolver() == dict_resolver
 
     set_default_resolver(default_resolver)
+
+
+class ObjectRoot(ObjectType):
+    attr = String()
+
+    class Meta:
+        root_shape = "attr"
+
+
+class DictRoot(ObjectType):
+    attr = String()
+
+    class Meta:
+        root_shape = "dict"
+
+
+@dataclass
+class DemoDataclass:
+    attr: str
+
+
+class DataclassRoot(ObjectType):
+    attr = String()
+
+    class Meta:
+        possible_types = (DemoDataclass,)
+        root_shape = "attr"
+
+
+class PossibleTypesRoot(ObjectType):
+    attr = String()
+
+    class Meta:
+        possible_types = (dict,)
+
+
+class UnknownRoot(ObjectType):
+    attr = String()
+
+
+def test_get_root_shape():
+    assert get_root_shape(ObjectRoot) == ATTR_SHAPE
+    assert get_root_shape(DictRoot) == DICT_SHAPE
+    assert get_root_shape(DataclassRoot) == ATTR_SHAPE
+    assert get_root_shape(UnknownRoot) is None
+    assert get_root_shape(PossibleTypesRoot) is None
+
+
+def test_root_shape_must_be_valid():
+    with raises(AssertionError):
+
+        class InvalidRoot(ObjectType):
+            class Meta:
+                root_shape = "list"
+
+
+def test_field_default_resolver_specialized_for_shape():
+    resolver = get_field_default_resolver(ObjectRoot, "attr", "default")
+    assert resolver.func is attr_resolver
+    assert resolver(demo_obj, info) == "value"
+    assert resolver(object(), info) == "default"
+
+    resolver = get_field_default_resolver(DictRoot, "attr", "default")
+    assert resolver.func is dict_resolver
+    assert resolver(demo_dict, info) == "value"
+    assert resolver({}, info) == "default"
+
+    resolver = get_field_default_resolver(DataclassRoot, "attr", None)
+    assert resolver(DemoDataclass(attr="value"), info) == "value"
+
+
+def test_field_default_resolver_unknown_shape():
+    for root_type in (UnknownRoot, PossibleTypesRoot):
+        resolver = get_field_default_resolver(root_type, "attr", "default")
+        assert resolver(demo_dict, info) == "value"
+        assert resolver(demo_obj, info) == "value"
+        assert resolver({}, info) == "default"
+        assert resolver(object(), info) == "default"
+
+
+def test_field_default_resolver_custom():
+    def upper_resolver(attname, default_value, root, info, **args):
+        return root.get(attname, default_value).upper()
+
+    class CustomRoot(ObjectType):
+        attr = String()
+
+        class Meta:
+            root_shape = "attr"
+            default_resolver = upper_resolver
+
+    resolver = get_field_default_resolver(CustomRoot, "attr", None)
+    assert resolver(demo_dict, info) == "VALUE"
+
+    default_resolver = get_default_resolver()
+    set_default_resolver(upper_resolver)
+    try:
+        resolver = get_field_default_resolver(ObjectRoot, "attr", None)
+        assert resolver(demo_dict, info) == "VALUE"
+    finally:
+        set_default_resolver(default_resolver)
+
+
+def test_field_default_resolver_is_picklable():
+    for root_type in (ObjectRoot, DictRoot, UnknownRoot):
+        resolver = get_field_default_resolver(root_type, "attr", "default")
+        restored = loads(dumps(resolver))
+        assert is_default_resolver(restored)
+        assert restored.func is resolver.func
+        assert restored.args == ("attr", "default")
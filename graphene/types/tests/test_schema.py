@@ -1,13 +1,19 @@
+import json
+from asyncio import sleep
 from textwrap import dedent
 
-from pytest import raises
+from pytest import mark, raises
 
+from graphql import GraphQLError
 from graphql.type import GraphQLObjectType, GraphQLSchema
+from graphql.validation import ValidationRule
 
+from ...utils.dataloader import DataLoader
+from ...validation import DisableIntrospection
 from ..field import Field
 from ..objecttype import ObjectType
-from ..scalars import String
-from ..schema import Schema
+from ..scalars import Int, String
+from ..schema import Schema, introspection_query
 
 
 class MyOtherType(ObjectType):
@@ -72,3 +78,329 @@ def test_schema_requires_query_type():
     assert len(result.errors) == 1
     error = result.errors[0]
     assert error.message == "Query root type must be provided."
+
+
+def test_schema_execute_source_keyword():
+    schema = Schema(Query)
+    root = {"inner": {"field": "a"}}
+
+    result = schema.execute(source="{ inner { field } }", root=root)
+    assert result.data == {"inner": {"field": "a"}}
+
+    with raises(TypeError):
+        schema.execute("{ inner { field } }", source="{ inner { field } }")
+    with raises(TypeError):
+        schema.execute(root=root)
+
+
+@mark.asyncio
+async def test_schema_execute_async_source_keyword():
+    schema = Schema(Query)
+
+    result = await schema.execute_async(
+        source="{ inner { field } }", root={"inner": {"field": "a"}}
+    )
+    assert result.data == {"inner": {"field": "a"}}
+
+
+def test_schema_document_cache():
+    schema = Schema(Query)
+    query = "{ inner { field } }"
+
+    first = schema.execute(query, root={"inner": {"field": "a"}})
+    second = schema.execute(query, root={"inner": {"field": "b"}})
+
+    assert first.data == {"inner": {"field": "a"}}
+    assert second.data == {"inner": {"field": "b"}}
+    info = schema.document_cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_schema_document_cache_caches_validation_errors():
+    schema = Schema(Query)
+
+    for _ in range(2):
+        result = schema.execute("{ unknown }")
+        assert len(result.errors) == 1
+        assert result.errors[0].message == "Cannot query field 'unknown' on type 'Query'."
+
+    assert schema.document_cache.info().hits == 1
+
+
+def test_schema_document_cache_keyed_by_validation_rules():
+    class NoInner(ValidationRule):
+        def enter_field(self, node, *_args):
+            if node.name.value == "inner":
+                self.report_error(GraphQLError("inner is not allowed"))
+
+    schema = Schema(Query)
+    query = "{ inner { field } }"
+
+    assert not schema.execute(query).errors
+    result = schema.execute(query, validation_rules=(NoInner,))
+    assert [error.message for error in result.errors] == ["inner is not allowed"]
+    assert not schema.execute(query).errors
+    assert len(schema.document_cache) == 2
+
+
+def test_schema_document_cache_eviction():
+    schema = Schema(Query, document_cache_size=1)
+
+    schema.execute("{ inner { field } }")
+    schema.execute("query Other { inner { field } }")
+
+    info = schema.document_cache.info()
+    assert info.evictions == 1
+    assert info.currsize == 1
+
+
+def test_schema_document_cache_disabled():
+    schema = Schema(Query, document_cache_size=0)
+    assert schema.document_cache is None
+
+    result = schema.execute("{ inner { field } }", root={"inner": {"field": "a"}})
+    assert result.data == {"inner": {"field": "a"}}
+
+
+def test_schema_document_cache_does_not_cache_syntax_errors():
+    schema = Schema(Query)
+
+    result = schema.execute("{ inner {")
+    assert len(result.errors) == 1
+    assert len(schema.document_cache) == 0
+
+
+@mark.asyncio
+async def test_schema_document_cache_async():
+    schema = Schema(Query)
+    query = "{ inner { field } }"
+
+    await schema.execute_async(query, root={"inner": {"field": "a"}})
+    result = await schema.execute_async(query, root={"inner": {"field": "b"}})
+
+    assert result.data == {"inner": {"field": "b"}}
+    assert schema.document_cache.info().hits == 1
+
+
+@mark.asyncio
+async def test_schema_execute_batch_shares_dataloader():
+    batches = []
+
+    class NameLoader(DataLoader):
+        async def batch_load_fn(self, keys):
+            batches.append(list(keys))
+            return [f"name-{key}" for key in keys]
+
+    class Query(ObjectType):
+        name = String(id=String(required=True))
+
+        async def resolve_name(root, info, id):
+            return await info.context["loader"].load(id)
+
+    schema = Schema(Query)
+    requests = [
+        {"query": "query Name($id: String!) { name(id: $id) }", "variables": {"id": key}}
+        for key in ("1", "2", "3")
+    ]
+
+    results = await schema.execute_batch(requests, context={"loader": NameLoader()})
+
+    assert [result.data for result in results] == [
+        {"name": "name-1"},
+        {"name": "name-2"},
+        {"name": "name-3"},
+    ]
+    assert batches == [["1", "2", "3"]]
+
+
+@mark.asyncio
+async def test_schema_execute_batch_keeps_input_order():
+    class Query(ObjectType):
+        wait = String(ms=Int(required=True))
+
+        async def resolve_wait(root, info, ms):
+            await sleep(ms / 1000)
+            return str(ms)
+
+    schema = Schema(Query)
+    requests = [{"query": f"{{ wait(ms: {ms}) }}"} for ms in (30, 10, 20)]
+
+    results = await schema.execute_batch(requests, max_concurrency=2)
+
+    assert [result.data for result in results] == [
+        {"wait": "30"},
+        {"wait": "10"},
+        {"wait": "20"},
+    ]
+
+
+@mark.asyncio
+async def test_schema_execute_batch_isolates_failures():
+    schema = Schema(Query)
+    requests = [
+        {"query": "{ inner { field } }"},
+        {"query": "{ unknown }"},
+        {"query": "query A { inner { field } }", "operationName": "B"},
+        {"query": "{ inner { field } }", "execution_context_class": object},
+        {"query": "{ inner { field } }"},
+    ]
+
+    results = await schema.execute_batch(
+        requests, root={"inner": {"field": "value"}}
+    )
+
+    assert results[0].data == {"inner": {"field": "value"}}
+    assert results[1].errors
+    assert [error.message for error in results[2].errors] == [
+        "Unknown operation named 'B'."
+    ]
+    assert results[3].data is None
+    assert len(results[3].errors) == 1
+    assert results[4].data == {"inner": {"field": "value"}}
+
+
+@mark.asyncio
+async def test_schema_execute_batch_isolates_malformed_requests():
+    schema = Schema(Query)
+    requests = [
+        {"query": "{ inner { field } }"},
+        "{ inner { field } }",
+        {"query": "{ inner { field } }", "unknown": True},
+        {"query": "{ inner { field } }"},
+    ]
+
+    results = await schema.execute_batch(
+        requests, root={"inner": {"field": "value"}}
+    )
+
+    assert results[0].data == {"inner": {"field": "value"}}
+    assert results[1].data is None
+    assert len(results[1].errors) == 1
+    assert results[2].data is None
+    assert len(results[2].errors) == 1
+    assert results[3].data == {"inner": {"field": "value"}}
+
+
+def test_schema_defer_build():
+    schema = Schema(Query, defer_build=True)
+    assert not schema.is_built
+
+    assert schema.Query == Query
+    assert schema.is_built
+    assert schema.graphql_schema.query_type.graphene_type is Query
+
+
+def test_schema_defer_build_str_and_execute():
+    eager_schema = Schema(Query)
+    deferred_schema = Schema(Query, defer_build=True)
+
+    assert str(deferred_schema) == str(eager_schema)
+    result = Schema(Query, defer_build=True).execute(
+        "{ inner { field } }", root={"inner": {"field": "value"}}
+    )
+    assert result.data == {"inner": {"field": "value"}}
+
+
+def test_schema_defer_build_introspection():
+    eager_schema = Schema(Query)
+    deferred_schema = Schema(Query, defer_build=True)
+
+    assert deferred_schema.execute(introspection_query).data == (
+        eager_schema.execute(introspection_query).data
+    )
+
+
+def test_schema_defer_build_validates_root_types():
+    with raises(Exception) as exc_info:
+        Schema(query=String, defer_build=True)
+
+    assert "is not a valid root type" in str(exc_info.value)
+
+
+def test_schema_introspection_is_cached():
+    schema = Schema(Query)
+
+    first = schema.execute(introspection_query)
+    second = schema.execute(dedent(introspection_query).replace("\n", " "))
+
+    assert not first.errors
+    assert first is second
+    assert schema.introspect() is first.data
+    assert schema.introspect()["__schema"]["queryType"]["name"] == "Query"
+
+
+def test_schema_introspection_cache_checks_operation_name():
+    schema = Schema(Query)
+
+    result = schema.execute(introspection_query, operation_name="IntrospectionQuery")
+    assert result is schema.get_introspection_result()
+
+    result = schema.execute(introspection_query, operation_name="Missing")
+    assert result.data is None
+    assert [error.message for error in result.errors] == [
+        "Unknown operation named 'Missing'."
+    ]
+
+
+def test_schema_introspection_document_check_is_memoized():
+    schema = Schema(Query)
+    document, _errors = schema.get_document(dedent(introspection_query))
+
+    assert schema.is_introspection_document(document)
+    assert schema._introspection_documents[document] is True
+    assert not schema.is_introspection_document(document, "Other")
+
+
+def test_schema_introspection_json():
+    schema = Schema(Query)
+
+    introspection_json = schema.introspection_json()
+
+    assert isinstance(introspection_json, bytes)
+    assert json.loads(introspection_json) == {"data": schema.introspect()}
+    assert schema.introspection_json() is introspection_json
+
+
+@mark.asyncio
+async def test_schema_introspection_is_cached_async():
+    schema = Schema(Query)
+
+    result = await schema.execute_async(introspection_query)
+
+    assert result is schema.get_introspection_result()
+
+
+def test_schema_introspection_cache_invalidated_on_rebuild():
+    schema = Schema(Query)
+    introspection = schema.get_introspection_result()
+    introspection_json = schema.introspection_json()
+
+    schema.graphql_schema = Schema(MyOtherType).graphql_schema
+
+    assert schema.get_introspection_result() is not introspection
+    assert schema.introspection_json() != introspection_json
+    assert schema.introspect()["__schema"]["queryType"]["name"] == "MyOtherType"
+
+
+def test_schema_introspection_cache_not_used_with_middleware():
+    schema = Schema(Query)
+
+    def middleware(next, root, info, **args):
+        return next(root, info, **args)
+
+    result = schema.execute(introspection_query, middleware=[middleware])
+
+    assert not result.errors
+    assert result is not schema.get_introspection_result()
+    assert result.data == schema.introspect()
+
+
+def test_schema_introspection_cache_respects_validation_rules():
+    schema = Schema(Query)
+
+    result = schema.execute(introspection_query, validation_rules=(DisableIntrospection,))
+
+    assert result.errors
+    assert result.data is None
@@ -0,0 +1,127 @@
+from pytest import raises
+
+from .. import snapshot
+from ..field import Field
+from ..objecttype import ObjectType
+from ..scalars import String
+from ..schema import Schema
+from ..structures import List
+
+
+class Pet(ObjectType):
+    name = String()
+    owner = Field(lambda: Person)
+
+
+class Person(ObjectType):
+    name = String()
+    pets = List(Pet)
+
+    def resolve_pets(root, info):
+        return [Pet(name="Rex", owner=root)]
+
+
+class Query(ObjectType):
+    person = Field(Person)
+
+    def resolve_person(root, info):
+        return Person(name="Ana")
+
+
+QUERY = "{ person { name pets { name owner { name } } } }"
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = str(tmp_path / "schema.snapshot")
+    schema = Schema(Query)
+    schema.save_snapshot(path)
+
+    restored = Schema.load_snapshot(path)
+
+    assert isinstance(restored, Schema)
+    assert restored is not schema
+    assert str(restored) == str(schema)
+    assert restored.Query is Query
+    assert restored.graphql_schema.get_type("Pet").graphene_type is Pet
+    assert restored.execute(QUERY).data == schema.execute(QUERY).data
+    assert restored.document_cache is not None
+    assert len(restored.document_cache) == 1
+
+
+def test_snapshot_with_default_resolvers(tmp_path):
+    class Shelter(ObjectType):
+        name = String()
+        city = String(default_value="Lisbon")
+
+        class Meta:
+            root_shape = "dict"
+
+    class ShelterQuery(ObjectType):
+        shelter = Field(Shelter)
+        person = Field(Person)
+
+        def resolve_shelter(root, info):
+            return {"name": "Paws"}
+
+        def resolve_person(root, info):
+            return Person(name="Ana")
+
+    path = str(tmp_path / "schema.snapshot")
+    Schema(ShelterQuery).save_snapshot(path)
+
+    restored = Schema.load_snapshot(path)
+
+    assert restored.execute("{ shelter { name city } person { name } }").data == {
+        "shelter": {"name": "Paws", "city": "Lisbon"},
+        "person": {"name": "Ana"},
+    }
+
+
+def test_snapshot_of_deferred_schema(tmp_path):
+    path = str(tmp_path / "schema.snapshot")
+    Schema(Query, defer_build=True).save_snapshot(path)
+
+    restored = Schema.load_snapshot(path)
+
+    assert restored.is_built
+    assert restored.execute(QUERY).data == {
+        "person": {"name": "Ana", "pets": [{"name": "Rex", "owner": {"name": "Ana"}}]}
+    }
+
+
+def test_snapshot_missing(tmp_path):
+    assert Schema.load_snapshot(str(tmp_path / "missing.snapshot")) is None
+
+
+def test_snapshot_stale(tmp_path, monkeypatch):
+    path = str(tmp_path / "schema.snapshot")
+    Schema(Query).save_snapshot(path)
+
+    monkeypatch.setattr(snapshot, "get_schema_fingerprint", lambda modules: "changed")
+
+    assert Schema.load_snapshot(path) is None
+
+
+def test_snapshot_fingerprint_covers_schema_modules():
+    modules = snapshot.get_schema_modules(Schema(Query).graphql_schema)
+
+    assert __name__ in modules
+    assert snapshot.get_schema_fingerprint(modules) == (
+        snapshot.get_schema_fingerprint(modules)
+    )
+    assert snapshot.get_schema_fingerprint(modules) != (
+        snapshot.get_schema_fingerprint(modules[:-1])
+    )
+
+
+def test_snapshot_unpicklable_resolver(tmp_path):
+    class LocalQuery(ObjectType):
+        value = String()
+
+        def resolve_value(root, info):
+            return "value"
+
+    with raises(TypeError) as exc_info:
+        Schema(LocalQuery).save_snapshot(str(tmp_path / "schema.snapshot"))
+
+    assert "must be defined at the top level of a module" in str(exc_info.value)
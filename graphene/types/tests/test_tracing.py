@@ -0,0 +1,129 @@
+from asyncio import sleep
+
+from graphql import ExecutionContext
+from pytest import mark
+
+from ..objecttype import ObjectType
+from ..scalars import String
+from ..schema import Schema
+from ..structures import List
+from ..tracing import ApolloTracing, Trace, TracingMiddleware
+
+
+class Pet(ObjectType):
+    name = String()
+
+
+class Query(ObjectType):
+    hello = String()
+    pets = List(Pet)
+    slow = String()
+    fail = String()
+
+    def resolve_hello(root, info):
+        return "World"
+
+    def resolve_pets(root, info):
+        return [Pet(name="Rex"), Pet(name="Tom")]
+
+    async def resolve_slow(root, info):
+        await sleep(0.01)
+        return "Done"
+
+    def resolve_fail(root, info):
+        raise Exception("Failed")
+
+
+def get_resolvers(result):
+    return result.extensions["tracing"]["execution"]["resolvers"]
+
+
+def test_tracing_extension():
+    schema = Schema(query=Query, tracing=ApolloTracing())
+    result = schema.execute("{ hello pets { name } }")
+    assert result.data == {"hello": "World", "pets": [{"name": "Rex"}, {"name": "Tom"}]}
+
+    tracing = result.extensions["tracing"]
+    assert tracing["version"] == 1
+    assert tracing["startTime"].endswith("Z")
+    assert tracing["duration"] > 0
+    assert tracing["parsing"]["duration"] > 0
+    assert tracing["validation"]["startOffset"] >= tracing["parsing"]["startOffset"]
+
+    resolvers = get_resolvers(result)
+    assert [resolver["path"] for resolver in resolvers] == [
+        ["hello"],
+        ["pets"],
+        ["pets", 0, "name"],
+        ["pets", 1, "name"],
+    ]
+    assert resolvers[1]["parentType"] == "Query"
+    assert resolvers[1]["fieldName"] == "pets"
+    assert resolvers[1]["returnType"] == "[Pet]"
+    assert resolvers[2]["parentType"] == "Pet"
+    for resolver in resolvers:
+        assert resolver["startOffset"] > 0
+        assert resolver["duration"] >= 0
+
+
+def test_tracing_records_failed_resolvers():
+    schema = Schema(query=Query, tracing=ApolloTracing())
+    result = schema.execute("{ fail }")
+    assert result.errors
+    assert [resolver["path"] for resolver in get_resolvers(result)] == [["fail"]]
+
+
+@mark.asyncio
+async def test_tracing_async_resolver_duration():
+    schema = Schema(query=Query, tracing=ApolloTracing())
+    result = await schema.execute_async("{ slow }")
+    assert result.data == {"slow": "Done"}
+    (resolver,) = get_resolvers(result)
+    assert resolver["duration"] >= 10_000_000
+
+
+def test_tracing_sample_rate():
+    schema = Schema(query=Query, tracing=ApolloTracing(sample_rate=0))
+    result = schema.execute("{ hello }")
+    assert result.extensions is None
+
+    assert isinstance(ApolloTracing(sample_rate=1).start_trace(), Trace)
+
+
+def test_unsampled_operations_skip_tracing_middleware(monkeypatch):
+    calls = []
+    resolve = TracingMiddleware.resolve
+
+    def counting_resolve(self, next_, root, info, **args):
+        calls.append(info.field_name)
+        return resolve(self, next_, root, info, **args)
+
+    monkeypatch.setattr(TracingMiddleware, "resolve", counting_resolve)
+
+    schema = Schema(query=Query, tracing=ApolloTracing(sample_rate=0))
+    assert schema.execute("{ hello pets { name } }").data == {
+        "hello": "World",
+        "pets": [{"name": "Rex"}, {"name": "Tom"}],
+    }
+    assert calls == []
+
+    schema = Schema(query=Query, tracing=ApolloTracing(sample_rate=1))
+    schema.execute("{ hello }")
+    assert calls == ["hello"]
+
+
+def test_no_tracing_by_default():
+    schema = Schema(query=Query)
+    assert schema.execute("{ hello }").extensions is None
+
+
+def test_tracing_with_execution_context_class():
+    class CustomExecutionContext(ExecutionContext):
+        pass
+
+    schema = Schema(query=Query, tracing=ApolloTracing())
+    result = schema.execute(
+        "{ hello }", execution_context_class=CustomExecutionContext
+    )
+    assert result.data == {"hello": "World"}
+    assert [resolver["path"] for resolver in get_resolvers(result)] == [["hello"]]
@@ -11,6 +11,7 @@ from graphql.type import (
     GraphQLObjectType,
     GraphQLString,
 )
+from pytest import raises
 
 from ..dynamic import Dynamic
 from ..enum import Enum
@@ -303,6 +304,28 @@ def test_objecttype_with_possible_types():
     assert graphql_type.is_type_of(MyObjectType(), None) is False
 
 
+def test_objecttype_root_shape_default_resolver():
+    class DictType(ObjectType):
+        class Meta:
+            root_shape = "dict"
+
+        foo_bar = String(default_value="default")
+
+    class AnyType(ObjectType):
+        foo_bar = String(default_value="default")
+
+    type_map = create_type_map([DictType, AnyType])
+    resolve = type_map["DictType"].fields["fooBar"].resolve
+    assert resolve({"foo_bar": "value"}, None) == "value"
+    assert resolve({}, None) == "default"
+    with raises(AttributeError):
+        resolve(DictType(foo_bar="value"), None)
+
+    resolve = type_map["AnyType"].fields["fooBar"].resolve
+    assert resolve({"foo_bar": "value"}, None) == "value"
+    assert resolve(AnyType(foo_bar="value"), None) == "value"
+
+
 def test_interface_with_interfaces():
     class FooInterface(Interface):
         foo = String()
@@ -0,0 +1,104 @@
+"""
+Per-resolver timings of sampled operations, reported in the ``tracing`` extension of the result
+in the Apollo tracing format.
+"""
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from inspect import isawaitable
+from random import random
+from time import perf_counter_ns
+current_trace = ContextVar('current_trace', default=None)
+
+class Trace:
+    """
+    Timings of one operation. Times are ``perf_counter_ns`` values, turned into offsets from
+    the start of the operation when formatted.
+    """
+    __slots__ = ('start_time', 'start', 'end', 'parsing', 'validation', 'resolvers')
+
+    def __init__(self):
+        self.start_time = datetime.now(timezone.utc)
+        self.start = perf_counter_ns()
+        self.end = None
+        self.parsing = None
+        self.validation = None
+        self.resolvers = []
+
+    def phase_start(self, phase):
+        setattr(self, phase, (perf_counter_ns(), None))
+
+    def phase_end(self, phase, document=None, errors=None):
+        setattr(self, phase, (getattr(self, phase)[0], perf_counter_ns()))
+
+    def add_resolver(self, info, started):
+        """Records the timing of the resolver of a field, started at ``started``."""
+        self.resolvers.append((info.path, info.parent_type, info.field_name, info.return_type, started, perf_counter_ns()))
+
+    def finish(self):
+        self.end = perf_counter_ns()
+
+    def format_phase(self, phase):
+        if phase is None:
+            return {'startOffset': 0, 'duration': 0}
+        return {'startOffset': phase[0] - self.start, 'duration': phase[1] - phase[0]}
+
+    def format(self):
+        """Returns the trace in the Apollo tracing format."""
+        end = self.end if self.end is not None else perf_counter_ns()
+        start = self.start
+        duration = end - start
+        resolvers = [{'path': path.as_list(), 'parentType': parent_type.name, 'fieldName': field_name, 'returnType': str(return_type), 'startOffset': started - start, 'duration': ended - started} for path, parent_type, field_name, return_type, started, ended in self.resolvers]
+        end_time = self.start_time + timedelta(microseconds=duration // 1000)
+        return {'version': 1, 'startTime': format_time(self.start_time), 'endTime': format_time(end_time), 'duration': duration, 'parsing': self.format_phase(self.parsing), 'validation': self.format_phase(self.validation), 'execution': {'resolvers': resolvers}}
+
+def format_time(time):
+    return time.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+class ApolloTracing:
+    """
+    Collects per-resolver timings of a sample of the operations executed by a schema, given
+    as ``Schema(tracing=ApolloTracing(...))``, into the ``tracing`` extension of their result.
+
+    Args:
+        sample_rate (float): Fraction of the operations to trace, between 0 and 1. Default 1.
+    """
+
+    def __init__(self, sample_rate=1.0):
+        assert 0 <= sample_rate <= 1, f'Tracing sample rate must be between 0 and 1, received "{sample_rate}".'
+        self.sample_rate = sample_rate
+
+    def start_trace(self):
+        """Returns a new ``Trace`` if the operation is sampled, ``None`` otherwise."""
+        if self.sample_rate < 1 and random() >= self.sample_rate:
+            return None
+        return Trace()
+
+class TracingMiddleware:
+    """
+    Middleware recording the time spent in each resolver (until the value it returns is
+    awaited, for async resolvers) into the ``Trace`` of the current operation. It is shared by
+    all the operations, and installed by the schema for the sampled ones only: the resolvers of
+    the other operations are called without going through it.
+    """
+
+    def resolve(self, next_, root, info, **args):
+        trace = current_trace.get()
+        if trace is None:
+            return next_(root, info, **args)
+        started = perf_counter_ns()
+        try:
+            result = next_(root, info, **args)
+        except Exception:
+            trace.add_resolver(info, started)
+            raise
+        if isawaitable(result):
+            return self.end_awaited(trace, result, info, started)
+        trace.add_resolver(info, started)
+        return result
+
+    async def end_awaited(self, trace, result, info, started):
+        try:
+            return await result
+        finally:
+            trace.add_resolver(info, started)
+tracing_middleware = TracingMiddleware()
@@ -1,26 +1,16 @@
 import inspect
 from functools import partial
 from ..utils.module_loading import import_string
+from ..utils.str_converters import to_camel_case
 from .mountedtype import MountedType
 from .unmountedtype import UnmountedType
 
-def get_type(type_):
-    """
-    Returns the type for the given type. It can be:
-    - A MountedType (which will be returned as is)
-    - A UnmountedType (which will be mounted)
-    - A Type string (which will be imported and mounted)
-    - A callable (which will be called and mounted)
-    """
-    if isinstance(type_, MountedType):
-        return type_
-    elif isinstance(type_, UnmountedType):
-        return type_.mount()
-    elif isinstance(type_, str):
-        return import_string(type_)
-    elif callable(type_):
-        return get_type(type_())
-    return type_
+def get_type(_type):
+    if isinstance(_type, str):
+        return import_string(_type)
+    if inspect.isfunction(_type) or isinstance(_type, partial):
+        return _type()
+    return _type
 
 def get_field_as(value, _as=None):
     """
@@ -49,4 +39,15 @@ def get_underlying_type(_type):
     """Get the underlying type even if it is wrapped in structures like NonNull"""
     while hasattr(_type, 'of_type'):
         _type = _type.of_type
-    return _type
\ No newline at end of file
+    return _type
+
+def get_graphene_field(graphql_type, field_name):
+    """Returns the Graphene ``Field`` mounted as ``field_name`` on a GraphQL type, if any."""
+    graphene_type = getattr(graphql_type, 'graphene_type', None)
+    fields = getattr(getattr(graphene_type, '_meta', None), 'fields', None)
+    if not fields:
+        return None
+    for name, field in fields.items():
+        if field_name == (getattr(field, 'name', None) or name) or field_name == to_camel_case(name):
+            return field
+    return None
\ No newline at end of file
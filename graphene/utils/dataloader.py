@@ -1,16 +1,293 @@
-from asyncio import gather, ensure_future, get_event_loop, iscoroutine, iscoroutinefunction
-from collections import namedtuple
+from asyncio import Semaphore, gather, ensure_future, get_event_loop, get_running_loop, iscoroutine, iscoroutinefunction, new_event_loop
+from collections import OrderedDict, deque, namedtuple
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 from functools import partial
+from time import monotonic, perf_counter
 from typing import List
+from graphql import ExecutionContext
+from graphql.pyutils import is_awaitable
 Loader = namedtuple('Loader', 'key,future')
+CacheMapInfo = namedtuple('CacheMapInfo', 'hits,misses,evictions,expirations,maxsize,currsize,pending')
+_missing = object()
+current_batching_context = ContextVar('current_batching_context', default=None)
+
+def iscoroutinefunctionorpartial(fn):
+    return iscoroutinefunction(fn.func if isinstance(fn, partial) else fn)
+
+class Histogram:
+    """
+    Distribution of the values observed by a DataLoader (batch latencies, sizes...): their
+    count, total, minimum and maximum, and percentiles over the last ``maxlen`` values.
+    """
+
+    def __init__(self, maxlen=1000):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.samples = deque(maxlen=maxlen)
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.samples.append(value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent):
+        """Returns the given percentile (between 0 and 100) of the last observed values."""
+        if not self.samples:
+            return None
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    def summary(self):
+        """Returns the count, mean, min, max, and 50th, 90th and 99th percentiles."""
+        return {'count': self.count, 'mean': self.mean, 'min': self.min, 'max': self.max, 'p50': self.percentile(50), 'p90': self.percentile(90), 'p99': self.percentile(99)}
+
+class DataLoaderStats:
+    """
+    Activity of the DataLoaders given it as ``stats``: the number of ``loads`` and of
+    ``cache_hits``, the number of keys of each batch (``batch_size``), the seconds between the
+    load of the first key of a batch and its dispatch (``wait``), the seconds spent in each
+    ``batch_load_fn`` call (``batch_duration``), and the number of keys whose load failed
+    (``errors``). A stats object shared by several loaders records the activity of all of them.
+
+    Loaders and their schedulers record no metrics by themselves: without stats, nothing is
+    counted nor timed.
+    """
+
+    def __init__(self):
+        self.loads = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.batch_size = Histogram()
+        self.wait = Histogram()
+        self.batch_duration = Histogram()
+
+    @property
+    def hit_rate(self):
+        return self.cache_hits / self.loads if self.loads else None
+
+    def summary(self):
+        """Returns the counters and the summaries of the histograms."""
+        return {'loads': self.loads, 'cache_hits': self.cache_hits, 'hit_rate': self.hit_rate, 'errors': self.errors, 'batches': self.batch_size.count, 'batch_size': self.batch_size.summary(), 'wait': self.wait.summary(), 'batch_duration': self.batch_duration.summary()}
+
+class RequestDataLoaderStats:
+    """
+    The ``DataLoaderStats`` of the loaders of a request, by name, to be summarized in the
+    extensions of its result (see ``DataLoaderStatsInstrumentation``).
+
+    >>> stats = RequestDataLoaderStats()
+    >>> user_loader = UserLoader(stats=stats.for_loader('users'))
+    """
+
+    def __init__(self):
+        self.loaders = {}
+
+    def for_loader(self, name):
+        """Returns the stats of the loaders with the given name, created on first use."""
+        stats = self.loaders.get(name)
+        if stats is None:
+            stats = self.loaders[name] = DataLoaderStats()
+        return stats
+
+    def summary(self):
+        """Returns the summaries of the stats of the loaders, by name."""
+        return {name: stats.summary() for name, stats in self.loaders.items()}
+
+class NextTickScheduler:
+    """
+    Scheduling strategy of a DataLoader dispatching its queue of keys on the next iteration of
+    the event loop after the first key is loaded (the default).
+
+    Schedulers record nothing: the size of the batches and the wait before their dispatch are
+    recorded by the ``stats`` of the loader, if it has one (see ``DataLoaderStats``).
+    """
+
+    def enqueued(self, loop, loader):
+        """Called when a key is added to the queue of the loader."""
+        if len(loader._queue) == 1:
+            if loader.stats is not None:
+                loader._queued_at = perf_counter()
+            loader._dispatch_handle = self.schedule(loop, loader)
+
+    def schedule(self, loop, loader):
+        """Schedules the dispatch of a new queue, returning its handle if it can be cancelled."""
+        enqueue_post_future_job(loop, loader)
+
+    def dispatched(self, loader, queue):
+        """Called when the queue of the loader is dispatched."""
+        handle = loader._dispatch_handle
+        if handle is not None:
+            handle.cancel()
+            loader._dispatch_handle = None
+
+class DelayScheduler(NextTickScheduler):
+    """
+    Scheduling strategy dispatching the queue of keys of a DataLoader ``delay_us`` microseconds
+    after its first key is loaded, so the keys loaded over several iterations of the event loop
+    (by nested awaits) are loaded in the same batch.
+
+    Args:
+        delay_us (float): Microseconds between the load of the first key and the dispatch.
+    """
+
+    def __init__(self, delay_us):
+        assert delay_us >= 0, f'DelayScheduler delay_us must be a non-negative number, received "{delay_us}".'
+        self.delay_us = delay_us
+
+    def schedule(self, loop, loader):
+        return loop.call_later(self.delay_us / 1000000.0, dispatch_queue, loader)
+
+class KeysOrDeadlineScheduler(DelayScheduler):
+    """
+    Scheduling strategy dispatching the queue of keys of a DataLoader once it holds ``max_keys``
+    keys, or ``deadline_us`` microseconds after its first key is loaded, whichever comes first.
+
+    Args:
+        max_keys (int): Number of keys dispatched as soon as they are queued.
+        deadline_us (float): Maximum microseconds between the load of the first key and the
+            dispatch.
+    """
+
+    def __init__(self, max_keys, deadline_us):
+        assert max_keys > 0, f'KeysOrDeadlineScheduler max_keys must be a positive integer, received "{max_keys}".'
+        super().__init__(deadline_us)
+        self.max_keys = max_keys
+
+    def enqueued(self, loop, loader):
+        super().enqueued(loop, loader)
+        if len(loader._queue) >= self.max_keys:
+            dispatch_queue(loader)
+
+class LRUCacheMap:
+    """
+    A bounded ``cache_map`` for long-lived DataLoaders, evicting the least recently used values
+    once it holds ``maxsize`` of them, and expiring them ``ttl`` seconds after they are loaded.
+
+    Futures that are still pending are never evicted nor expired: they are kept apart until
+    they are done, so every load of a key being fetched shares the same batch.
+
+    >>> loader = UserLoader(cache_map=LRUCacheMap(maxsize=10000, ttl=60))
+    >>> loader._cache.info()
+    CacheMapInfo(hits=0, misses=0, evictions=0, expirations=0, maxsize=10000, currsize=0, pending=0)
+
+    Args:
+        maxsize (int): Maximum number of loaded values kept. Default 1000.
+        ttl (Optional[float]): Seconds after which a loaded value expires. Default None (never).
+    """
+
+    def __init__(self, maxsize=1000, ttl=None):
+        assert maxsize is None or maxsize > 0, f'LRUCacheMap maxsize must be a positive integer or None, received "{maxsize}".'
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data = OrderedDict()
+        self._pending = {}
+
+    def _get(self, key):
+        future = self._pending.get(key, _missing)
+        if future is not _missing:
+            return future
+        entry = self._data.get(key)
+        if entry is None:
+            return _missing
+        future, expires = entry
+        if expires is not None and expires <= monotonic():
+            del self._data[key]
+            self.expirations += 1
+            return _missing
+        self._data.move_to_end(key)
+        return future
+
+    def get(self, key, default=None):
+        future = self._get(key)
+        if future is _missing:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return future
+
+    def __getitem__(self, key):
+        future = self._get(key)
+        if future is _missing:
+            raise KeyError(key)
+        return future
+
+    def __contains__(self, key):
+        return self._get(key) is not _missing
+
+    def __setitem__(self, key, future):
+        self.pop(key)
+        if getattr(future, 'done', None) is not None and (not future.done()):
+            self._pending[key] = future
+            future.add_done_callback(partial(self._settle, key))
+        else:
+            self._store(key, future)
+
+    def _settle(self, key, future):
+        if self._pending.get(key) is future:
+            del self._pending[key]
+            self._store(key, future)
+
+    def _store(self, key, future):
+        data = self._data
+        data[key] = (future, monotonic() + self.ttl if self.ttl is not None else None)
+        if self.maxsize is not None:
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        future = self._pending.pop(key, _missing)
+        if future is not _missing:
+            return future
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        self._data.clear()
+        self._pending.clear()
+
+    def __len__(self):
+        return len(self._data) + len(self._pending)
+
+    def info(self):
+        """Returns the hit, miss, eviction and expiration counters and the size of the cache."""
+        return CacheMapInfo(self.hits, self.misses, self.evictions, self.expirations, self.maxsize, len(self), len(self._pending))
 
 class DataLoader(object):
+    """
+    Batches and caches the loads of keys with ``batch_load_fn``.
+
+    The queue of keys loaded during an iteration of the event loop, or as scheduled by the
+    ``scheduler`` strategy (see ``NextTickScheduler``), is split in batches of
+    ``max_batch_size`` keys, if given, which are all loaded concurrently, or at most
+    ``max_concurrent_batches`` at a time.
+
+    The activity of the loader is only recorded when it is given a ``stats`` object (see
+    ``DataLoaderStats``).
+    """
     batch = True
     max_batch_size = None
+    max_concurrent_batches = None
     cache = True
+    scheduler = None
+    stats = None
 
-    def __init__(self, batch_load_fn=None, batch=None, max_batch_size=None, cache=None, get_cache_key=None, cache_map=None, loop=None):
+    def __init__(self, batch_load_fn=None, batch=None, max_batch_size=None, cache=None, get_cache_key=None, cache_map=None, loop=None, max_concurrent_batches=None, scheduler=None, stats=None):
         self._loop = loop
         if batch_load_fn is not None:
             self.batch_load_fn = batch_load_fn
@@ -21,17 +298,58 @@ class DataLoader(object):
             self.batch = batch
         if max_batch_size is not None:
             self.max_batch_size = max_batch_size
+        if max_concurrent_batches is not None:
+            self.max_concurrent_batches = max_concurrent_batches
+        assert self.max_concurrent_batches is None or self.max_concurrent_batches > 0, 'max_concurrent_batches must be a positive integer. Received: {}'.format(self.max_concurrent_batches)
         if cache is not None:
             self.cache = cache
         self.get_cache_key = get_cache_key or (lambda x: x)
         self._cache = cache_map if cache_map is not None else {}
         self._queue = []
+        self._batch_semaphore = None
+        if scheduler is not None:
+            self.scheduler = scheduler
+        elif self.scheduler is None:
+            self.scheduler = NextTickScheduler()
+        self._queued_at = None
+        self._dispatch_handle = None
+        if stats is not None:
+            self.stats = stats
+
+    @property
+    def loop(self):
+        if not self._loop:
+            self._loop = get_event_loop()
+        return self._loop
 
     def load(self, key=None):
         """
         Loads a key, returning a `Future` for the value represented by that key.
         """
-        pass
+        if key is None:
+            raise TypeError('The loader.load() function must be called with a value, but got: {}.'.format(key))
+        stats = self.stats
+        if stats is not None:
+            stats.loads += 1
+        cache_key = self.get_cache_key(key)
+        if self.cache:
+            cached_result = self._cache.get(cache_key)
+            if cached_result:
+                if stats is not None:
+                    stats.cache_hits += 1
+                return cached_result
+        future = self.loop.create_future()
+        if self.cache:
+            self._cache[cache_key] = future
+        self.do_resolve_reject(key, future)
+        return future
+
+    def do_resolve_reject(self, key, future):
+        self._queue.append(Loader(key=key, future=future))
+        if self.batch:
+            self.scheduler.enqueued(self.loop, self)
+        elif len(self._queue) == 1:
+            dispatch_queue(self)
 
     def load_many(self, keys):
         """
@@ -46,14 +364,18 @@ class DataLoader(object):
         >>>    my_loader.load('b')
         >>> )
         """
-        pass
+        if not isinstance(keys, Iterable):
+            raise TypeError('The loader.load_many() function must be called with Iterable<key> but got: {}.'.format(keys))
+        return gather(*[self.load(key) for key in keys])
 
     def clear(self, key):
         """
         Clears the value at `key` from the cache, if it exists. Returns itself for
         method chaining.
         """
-        pass
+        cache_key = self.get_cache_key(key)
+        self._cache.pop(cache_key, None)
+        return self
 
     def clear_all(self):
         """
@@ -61,25 +383,181 @@ class DataLoader(object):
         invalidations across this particular `DataLoader`. Returns itself for
         method chaining.
         """
-        pass
+        self._cache.clear()
+        return self
 
     def prime(self, key, value):
         """
         Adds the provied key and value to the cache. If the key already exists, no
         change is made. Returns itself for method chaining.
         """
-        pass
+        cache_key = self.get_cache_key(key)
+        if cache_key not in self._cache:
+            future = self.loop.create_future()
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+            self._cache[cache_key] = future
+        return self
+
+class SyncDataLoader(DataLoader):
+    """
+    DataLoader whose ``batch_load_fn`` is a regular function, so loaders can batch the loads
+    of operations executed synchronously, with ``Schema.execute``.
+
+    ``load`` and ``load_many`` return futures, resolved once the keys loaded by all the fields
+    of the current level of the operation are loaded in one batch. Resolvers return them as
+    is (or await them in ``async def`` resolvers), and the operation must be executed with
+    ``execution_context_class=BatchingExecutionContext``. Under ``Schema.execute_async``, the
+    loader batches the keys loaded during an iteration of the event loop, like ``DataLoader``.
+    """
+
+    def __init__(self, batch_load_fn=None, **options):
+        if batch_load_fn is None:
+            batch_load_fn = self.batch_load_fn
+        if not callable(batch_load_fn):
+            raise TypeError('SyncDataLoader must be have a batch_load_fn which accepts Iterable<key> and returns Iterable<value>, but got: {}.'.format(batch_load_fn))
+
+        async def load_batch(keys):
+            return batch_load_fn(keys)
+        super(SyncDataLoader, self).__init__(load_batch, **options)
+
+    @property
+    def loop(self):
+        context = current_batching_context.get()
+        if context is not None:
+            return context.loop
+        return super(SyncDataLoader, self).loop
+
+class BatchingExecutionContext(ExecutionContext):
+    """
+    Execution context running the loads of ``SyncDataLoader``\\ s in a private event loop, for
+    operations executed synchronously. The fields of each level are resolved first, then
+    the loaders dispatch a single batch for all the keys they loaded, and the next level is
+    resolved with the loaded values.
+
+    When the operation is executed from a thread already running an event loop (a sync view
+    of an ASGI application...), the private loop runs on a worker thread, as two loops can't
+    run on the same thread. The calling thread waits for it, blocking its own loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_awaitable = is_awaitable
+        self._loop = None
+
+    @property
+    def loop(self):
+        if self._loop is None:
+            self._loop = new_event_loop()
+        return self._loop
+
+    def execute_operation(self, operation, root_value):
+        token = current_batching_context.set(self)
+        try:
+            result = super().execute_operation(operation, root_value)
+            if self.is_awaitable(result):
+                result = self.run_until_complete(result)
+            return result
+        finally:
+            current_batching_context.reset(token)
+            if self._loop is not None:
+                self._loop.close()
+                self._loop = None
+
+    def run_until_complete(self, awaitable):
+        """Runs the private loop until ``awaitable`` is done, on a worker thread if needed."""
+        try:
+            get_running_loop()
+        except RuntimeError:
+            return self.loop.run_until_complete(awaitable)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(copy_context().run, self.loop.run_until_complete, awaitable).result()
+
+def enqueue_post_future_job(loop, loader):
+
+    async def dispatch():
+        dispatch_queue(loader)
+    loop.call_soon(ensure_future, dispatch())
+
+def get_chunks(iterable_obj, chunk_size=1):
+    chunk_size = max(1, chunk_size)
+    return (iterable_obj[i:i + chunk_size] for i in range(0, len(iterable_obj), chunk_size))
 
 def dispatch_queue(loader):
     """
     Given the current state of a Loader instance, perform a batch load
     from its current queue.
     """
-    pass
+    queue = loader._queue
+    if not queue:
+        return
+    loader._queue = []
+    if loader.batch:
+        loader.scheduler.dispatched(loader, queue)
+    if loader.stats is not None:
+        loader.stats.wait.observe(perf_counter() - loader._queued_at if loader.batch else 0.0)
+    max_batch_size = loader.max_batch_size
+    if max_batch_size and max_batch_size < len(queue):
+        semaphore = get_batch_semaphore(loader) if loader.max_concurrent_batches else None
+        chunks = get_chunks(queue, max_batch_size)
+        for chunk in chunks:
+            ensure_future(dispatch_queue_batch(loader, chunk, semaphore), loop=loader.loop)
+    else:
+        ensure_future(dispatch_queue_batch(loader, queue), loop=loader.loop)
+
+def get_batch_semaphore(loader):
+    """
+    Returns the semaphore limiting the concurrent batches of the loader on its current loop. It
+    is created again when the loader is used on another loop, as a semaphore can only be used
+    on one (``BatchingExecutionContext`` runs each operation on a new loop).
+    """
+    loop = loader.loop
+    semaphore = loader._batch_semaphore
+    if semaphore is None or semaphore[0] is not loop:
+        semaphore = loader._batch_semaphore = (loop, Semaphore(loader.max_concurrent_batches))
+    return semaphore[1]
+
+async def dispatch_queue_batch(loader, queue, semaphore=None):
+    if semaphore is not None:
+        async with semaphore:
+            return await dispatch_queue_batch(loader, queue)
+    keys = [loaded.key for loaded in queue]
+    stats = loader.stats
+    started = perf_counter() if stats is not None else None
+    batch_future = loader.batch_load_fn(keys)
+    if not batch_future or not iscoroutine(batch_future):
+        return failed_dispatch(loader, queue, TypeError('DataLoader must be constructed with a function which accepts Iterable<key> and returns Future<Iterable<value>>, but the function did not return a Coroutine: {}.'.format(batch_future)))
+    try:
+        try:
+            values = await batch_future
+        finally:
+            if stats is not None:
+                stats.batch_size.observe(len(keys))
+                stats.batch_duration.observe(perf_counter() - started)
+        if not isinstance(values, Iterable):
+            raise TypeError('DataLoader must be constructed with a function which accepts Iterable<key> and returns Future<Iterable<value>>, but the function did not return a Future of a Iterable: {}.'.format(values))
+        values = list(values)
+        if len(values) != len(keys):
+            raise TypeError('DataLoader must be constructed with a function which accepts Iterable<key> and returns Future<Iterable<value>>, but the function did not return a Future of a Iterable with the same length as the Iterable of keys.\n\nKeys:\n{}\n\nValues:\n{}'.format(keys, values))
+        for loaded, value in zip(queue, values):
+            if isinstance(value, Exception):
+                loaded.future.set_exception(value)
+                if stats is not None:
+                    stats.errors += 1
+            else:
+                loaded.future.set_result(value)
+    except Exception as e:
+        return failed_dispatch(loader, queue, e)
 
 def failed_dispatch(loader, queue, error):
     """
     Do not cache individual loads if the entire batch dispatch fails,
     but still reject each request so they do not hang.
     """
-    pass
\ No newline at end of file
+    if loader.stats is not None:
+        loader.stats.errors += len(queue)
+    for loaded in queue:
+        loader.clear(loaded.key)
+        loaded.future.set_exception(error)
@@ -0,0 +1,188 @@
+"""
+Caching of the results of slow-changing fields, declared with ``Field(cache=...)``.
+"""
+import json
+from asyncio import CancelledError, get_running_loop, shield
+from functools import wraps
+from inspect import isawaitable, iscoroutinefunction
+from threading import Lock
+from time import monotonic
+from .lru import LRUCache
+from .offload import is_sync_execution
+_missing = object()
+
+def get_parent_key(root):
+    """
+    Returns the identity of a parent value in field cache keys: ``None`` for root fields, the
+    type and ``id`` attribute of objects having one, or the value itself if it is hashable.
+    """
+    if root is None:
+        return None
+    root_id = getattr(root, 'id', None)
+    if root_id is not None and (not callable(root_id)):
+        return (type(root).__name__, root_id)
+    if isinstance(root, (str, bytes, int, float, tuple, frozenset)):
+        return root
+    raise TypeError(f'Can not build a field cache key for parent value {root!r}, give the FieldCache a key function.')
+
+def get_args_key(args):
+    """Returns a hashable representation of the arguments of a field."""
+    if not args:
+        return ''
+    return json.dumps(args, sort_keys=True, separators=(',', ':'), default=repr)
+
+class FieldCache:
+    """
+    A bounded, expiring cache of the results of a field's resolver, used with
+    ``Field(cache=FieldCache(...))``. Can be shared by several fields.
+
+    Entries are keyed by the field (``"ParentType.fieldName"``), the scope, the identity of the
+    parent value and the arguments. Resolvers raising an error aren't cached. Both sync
+    resolvers and resolvers returning awaitables are supported.
+
+    Args:
+        ttl (float): Number of seconds a result stays cached.
+        maxsize (int): Maximum number of cached results. Default 1000.
+        key (Callable, optional): Called as ``key(root, info, **args)`` to return the hashable
+            key of a result, instead of combining ``get_parent_key(root)`` and the arguments.
+        scope (Callable, optional): Called as ``scope(info)`` to return who the result is
+            cached for (user, tenant...). Results are shared by all requests by default.
+        lock (bool): Stampede protection. When an entry is missing or expired, only one caller
+            resolves it while the concurrent callers for the same key wait for its result.
+            Default False.
+    """
+
+    def __init__(self, ttl, maxsize=1000, key=None, scope=None, lock=False):
+        assert ttl > 0, f'Field cache ttl must be positive, received "{ttl}".'
+        self.ttl = ttl
+        self.key = key
+        self.scope = scope
+        self.lock = lock
+        self.entries = LRUCache(maxsize)
+        self._locks = {}
+        self._pending = {}
+        self._lock = Lock()
+
+    def get_key(self, root, info, args):
+        """Returns the cache key of a field resolution."""
+        key = self.key(root, info, **args) if self.key is not None else (get_parent_key(root), get_args_key(args))
+        scope = self.scope(info) if self.scope is not None else None
+        return (info.parent_type.name, info.field_name, scope, key)
+
+    def get(self, key, default=None):
+        """Returns the result cached for ``key`` if it hasn't expired, or ``default``."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= monotonic():
+            self.entries.pop(key)
+            return default
+        return value
+
+    def set(self, key, value):
+        self.entries[key] = (monotonic() + self.ttl, value)
+
+    def clear(self):
+        self.entries.clear()
+
+    def info(self):
+        """Returns the ``CacheInfo`` of the underlying LRU cache."""
+        return self.entries.info()
+
+    def wrap(self, resolver):
+        """Returns a resolver serving the results of ``resolver`` from the cache."""
+        if iscoroutinefunction(resolver):
+
+            @wraps(resolver)
+            async def cached_async_resolver(root, info, **args):
+                key = self.get_key(root, info, args)
+                value = self.get(key, _missing)
+                if value is not _missing:
+                    return value
+                if self.lock:
+                    return await self.resolve_pending(key, resolver, root, info, args)
+                return await self.store_awaited(key, resolver(root, info, **args))
+            return cached_async_resolver
+
+        @wraps(resolver)
+        def cached_resolver(root, info, **args):
+            key = self.get_key(root, info, args)
+            value = self.get(key, _missing)
+            if value is not _missing:
+                return value
+            if self.lock:
+                if is_sync_execution(info) or not _has_running_loop():
+                    return self.resolve_locked(key, resolver, root, info, args)
+                return self.resolve_pending(key, resolver, root, info, args)
+            value = resolver(root, info, **args)
+            if isawaitable(value):
+                return self.store_awaited(key, value)
+            self.set(key, value)
+            return value
+        return cached_resolver
+
+    def resolve_locked(self, key, resolver, root, info, args):
+        """Resolves a missing entry in a thread, holding a lock for its key."""
+        with self._lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = [Lock(), 0]
+            lock[1] += 1
+        try:
+            with lock[0]:
+                value = self.get(key, _missing)
+                if value is _missing:
+                    value = resolver(root, info, **args)
+                    self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                lock[1] -= 1
+                if not lock[1]:
+                    del self._locks[key]
+
+    async def store_awaited(self, key, awaitable):
+        value = await awaitable
+        self.set(key, value)
+        return value
+
+    async def resolve_pending(self, key, resolver, root, info, args):
+        """
+        Resolves a missing entry on the event loop. Callers for a key being resolved await the
+        same future instead of calling the resolver. If the caller resolving it is cancelled, the
+        waiting callers resolve the entry again.
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                return await shield(pending)
+            except CancelledError:
+                if not pending.cancelled():
+                    raise
+            return await self.resolve_pending(key, resolver, root, info, args)
+        future = self._pending[key] = get_running_loop().create_future()
+        try:
+            value = resolver(root, info, **args)
+            if isawaitable(value):
+                value = await value
+        except CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._pending[key]
+
+def _has_running_loop():
+    try:
+        get_running_loop()
+    except RuntimeError:
+        return False
+    return True
@@ -0,0 +1,81 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+CacheInfo = namedtuple('CacheInfo', 'hits,misses,evictions,maxsize,currsize')
+_missing = object()
+
+class LRUCache:
+    """
+    A bounded mapping that evicts the least recently used entry once it holds
+    ``maxsize`` entries, keeping hit, miss and eviction counters.
+
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache['a'] = 1
+    >>> cache.get('a')
+    1
+    >>> cache.info()
+    CacheInfo(hits=1, misses=0, evictions=0, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize=128):
+        assert maxsize is None or maxsize > 0, f'LRUCache maxsize must be a positive integer or None, received "{maxsize}".'
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for ``key`` and marks it as most recently used,
+        or ``default`` if it isn't cached.
+        """
+        with self._lock:
+            value = self._data.get(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __getitem__(self, key):
+        value = self.get(key, _missing)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            data = self._data
+            data[key] = value
+            data.move_to_end(key)
+            if self.maxsize is not None and len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def clear(self):
+        """Removes every entry, keeping the counters."""
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        """Returns a ``CacheInfo`` snapshot of the counters."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
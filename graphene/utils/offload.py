@@ -0,0 +1,213 @@
+"""
+Offloading of blocking resolvers to executor pools, so they don't block the event loop
+under ``Schema.execute_async``.
+"""
+import pickle
+from asyncio import get_running_loop
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import wraps
+from inspect import isawaitable, iscoroutinefunction
+from threading import Lock
+from time import perf_counter
+try:
+    from graphql.execution.execute import assume_not_awaitable
+except ImportError:
+    assume_not_awaitable = None
+OffloadStats = namedtuple('OffloadStats', 'calls,total_queue_wait,max_queue_wait,total_run_time')
+
+def is_sync_execution(info):
+    """Check if the field is being resolved by ``Schema.execute`` rather than ``execute_async``."""
+    return assume_not_awaitable is not None and getattr(info, 'is_awaitable', None) is assume_not_awaitable
+
+class BaseOffloader:
+    """
+    Base class of the offloaders running resolvers in an executor pool. The pool is created
+    on first use by ``create_executor``.
+
+    Per field (``"ParentType.fieldName"``) statistics are kept in ``stats``: the number of
+    calls, the total and maximum time spent waiting for a worker and the total time spent
+    running, all in seconds.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.stats = {}
+        self._executor = None
+        self._lock = Lock()
+
+    def create_executor(self):
+        raise NotImplementedError
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self.create_executor()
+        return self._executor
+
+    def shutdown(self, wait=True):
+        """Shuts the pool down. It is recreated on the next offloaded call."""
+        with self._lock:
+            executor, self._executor = (self._executor, None)
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def record(self, key, queue_wait, run_time):
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                self.stats[key] = OffloadStats(1, queue_wait, queue_wait, run_time)
+            else:
+                self.stats[key] = OffloadStats(stats.calls + 1, stats.total_queue_wait + queue_wait, max(stats.max_queue_wait, queue_wait), stats.total_run_time + run_time)
+
+    def wrap(self, resolver):
+        """
+        Returns a resolver running ``resolver`` in the pool. Coroutine functions and
+        resolvers that are already offloaded are returned unchanged.
+        """
+        if iscoroutinefunction(resolver) or getattr(resolver, '_offloaded', False):
+            return resolver
+
+        @wraps(resolver)
+        def offloaded_resolver(root, info, **args):
+            if is_sync_execution(info):
+                return self.call(resolver, root, info, args)
+            try:
+                loop = get_running_loop()
+            except RuntimeError:
+                return self.call(resolver, root, info, args)
+            return self.run(loop, f'{info.parent_type.name}.{info.field_name}', resolver, root, info, args)
+        offloaded_resolver._offloaded = True
+        return offloaded_resolver
+
+    def call(self, resolver, root, info, args):
+        """Calls ``resolver`` inline, when no event loop is available to offload it from."""
+        return resolver(root, info, **args)
+
+    async def run(self, loop, key, resolver, root, info, args):
+        raise NotImplementedError
+
+class ThreadPoolOffloader(BaseOffloader):
+    """
+    Runs synchronous resolvers in a bounded ``ThreadPoolExecutor`` when the operation is
+    executed with ``Schema.execute_async``, so blocking resolvers of sibling fields overlap
+    instead of blocking the event loop one after another. The resolvers run in a copy of the
+    caller's ``contextvars`` context. Under ``Schema.execute`` they are called inline.
+
+    Args:
+        max_workers (int, optional): Size of the pool. Defaults to the ``ThreadPoolExecutor``
+            default.
+        thread_name_prefix (str): Prefix of the names of the worker threads.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='graphene-resolver'):
+        super().__init__(max_workers)
+        self.thread_name_prefix = thread_name_prefix
+
+    def create_executor(self):
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix)
+
+    async def run(self, loop, key, resolver, root, info, args):
+        submitted = perf_counter()
+        context = copy_context()
+        started = None
+
+        def call():
+            nonlocal started
+            started = perf_counter()
+            return context.run(resolver, root, info, **args)
+        try:
+            result = await loop.run_in_executor(self.executor, call)
+        finally:
+            if started is not None:
+                self.record(key, started - submitted, perf_counter() - started)
+        if isawaitable(result):
+            return await result
+        return result
+
+def _run_in_process(payload):
+    resolver, root, args = pickle.loads(payload)
+    started = perf_counter()
+    result = resolver(root, **args)
+    return (result, perf_counter() - started)
+
+class ProcessPoolOffloader(BaseOffloader):
+    """
+    Runs CPU-bound resolvers in a shared ``ProcessPoolExecutor`` when the operation is
+    executed with ``Schema.execute_async``, so they don't hold the GIL of the worker serving
+    other requests. Under ``Schema.execute`` they are called inline.
+
+    Process resolvers are picklable top-level functions called as ``resolver(root, **args)``:
+    ``info`` can't be sent to another process. The parent value, the arguments and the
+    returned value must be picklable too.
+
+    Args:
+        max_workers (int, optional): Number of worker processes. Defaults to the number of
+            CPUs.
+        mp_context (multiprocessing context, optional): Context used to start the workers.
+    """
+
+    def __init__(self, max_workers=None, mp_context=None):
+        super().__init__(max_workers)
+        self.mp_context = mp_context
+
+    def create_executor(self):
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context)
+
+    def wrap(self, resolver):
+        try:
+            pickle.dumps(resolver)
+        except Exception as error:
+            raise TypeError(f'Resolver {resolver!r} must be picklable to run in a process, like a function defined at the top level of a module: {error}') from error
+        return super().wrap(resolver)
+
+    def call(self, resolver, root, info, args):
+        return resolver(root, **args)
+
+    async def run(self, loop, key, resolver, root, info, args):
+        try:
+            payload = pickle.dumps((resolver, root, args))
+        except Exception as error:
+            raise TypeError(f'The parent value and arguments of {key} must be picklable to run in a process: {error}') from error
+        submitted = perf_counter()
+        result, run_time = await loop.run_in_executor(self.executor, _run_in_process, payload)
+        self.record(key, max(perf_counter() - submitted - run_time, 0.0), run_time)
+        return result
+
+default_thread_offloader = ThreadPoolOffloader()
+
+def get_default_thread_offloader():
+    """Get the offloader used by fields and types declared with ``run_in_thread=True``."""
+    return default_thread_offloader
+
+def set_default_thread_offloader(offloader):
+    """Set the offloader used by fields and types declared with ``run_in_thread=True``."""
+    global default_thread_offloader
+    assert isinstance(offloader, ThreadPoolOffloader), f'Received incompatible thread offloader "{offloader}".'
+    default_thread_offloader = offloader
+
+def get_thread_offloader(run_in_thread):
+    """Returns the offloader selected by a ``run_in_thread`` option: ``True`` or an offloader."""
+    if isinstance(run_in_thread, ThreadPoolOffloader):
+        return run_in_thread
+    return default_thread_offloader
+default_process_offloader = ProcessPoolOffloader()
+
+def get_default_process_offloader():
+    """Get the offloader used by fields declared with ``run_in_process=True``."""
+    return default_process_offloader
+
+def set_default_process_offloader(offloader):
+    """Set the offloader used by fields declared with ``run_in_process=True``."""
+    global default_process_offloader
+    assert isinstance(offloader, ProcessPoolOffloader), f'Received incompatible process offloader "{offloader}".'
+    default_process_offloader = offloader
+
+def get_process_offloader(run_in_process):
+    """Returns the offloader selected by a ``run_in_process`` option: ``True`` or an offloader."""
+    if isinstance(run_in_process, ProcessPoolOffloader):
+        return run_in_process
+    return default_process_offloader
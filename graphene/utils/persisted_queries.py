@@ -0,0 +1,164 @@
+import json
+import sqlite3
+from collections import namedtuple
+from hashlib import sha256
+from threading import Lock
+from graphql import DocumentNode, Source, parse
+from .lru import LRUCache
+PersistedQuery = namedtuple('PersistedQuery', 'query,document')
+
+def get_query_text(query):
+    """
+    Returns the text of a query given as a string, a ``Source``, or a ``DocumentNode`` parsed
+    with its location.
+    """
+    if isinstance(query, str):
+        return query
+    if isinstance(query, Source):
+        return query.body
+    if isinstance(query, DocumentNode) and query.loc is not None:
+        return query.loc.source.body
+    raise TypeError(f'Can not get the text of query {query!r}, expected a string, a Source or a DocumentNode parsed with its location.')
+
+def get_query_hash(query):
+    """Returns the hex SHA-256 digest that identifies a persisted query."""
+    return sha256(get_query_text(query).encode('utf-8')).hexdigest()
+
+class BasePersistedQueryStore:
+    """
+    Maps SHA-256 query hashes to persisted queries for ``Schema(persisted_queries=...)``.
+
+    Stores hand out ``PersistedQuery(query, document)`` pairs so the schema can skip
+    parsing persisted requests. Subclasses implement ``get_query`` and, unless they are
+    ``readonly``, ``set_query``.
+    """
+    readonly = False
+
+    def get_query(self, query_hash):
+        """Returns the query text persisted for ``query_hash``, or ``None``."""
+        raise NotImplementedError
+
+    def set_query(self, query_hash, query):
+        """Persists ``query`` under ``query_hash``."""
+        raise NotImplementedError
+
+    def get(self, query_hash):
+        """Returns the ``PersistedQuery`` for ``query_hash``, or ``None`` if unknown."""
+        query = self.get_query(query_hash)
+        if query is None:
+            return None
+        return PersistedQuery(query, parse(query))
+
+    def set(self, query_hash, query, document=None):
+        """
+        Registers ``query`` under ``query_hash``. ``document`` is the already parsed
+        query, if the caller has one.
+        """
+        assert not self.readonly, f'{self.__class__.__name__} is read-only.'
+        self.set_query(query_hash, query)
+
+class InMemoryPersistedQueryStore(BasePersistedQueryStore):
+    """
+    Keeps persisted queries, already parsed, in memory. Once it holds ``maxsize`` queries, the
+    least recently used one is evicted to register a new one, so clients registering arbitrary
+    queries can't grow it without limit.
+
+    Args:
+        queries (Optional[Iterable[str]]): Queries to register up front.
+        maxsize (Optional[int]): Maximum number of queries kept. Default 1000, ``None`` for no
+            limit.
+    """
+
+    def __init__(self, queries=None, maxsize=1000):
+        self._queries = LRUCache(maxsize)
+        for query in queries or ():
+            self.set(get_query_hash(query), query)
+
+    def get_query(self, query_hash):
+        persisted = self._queries.get(query_hash)
+        return persisted.query if persisted else None
+
+    def get(self, query_hash):
+        return self._queries.get(query_hash)
+
+    def set(self, query_hash, query, document=None):
+        assert not self.readonly, f'{self.__class__.__name__} is read-only.'
+        self._queries[query_hash] = PersistedQuery(query, document or parse(query))
+
+    def __len__(self):
+        return len(self._queries)
+
+class ManifestPersistedQueryStore(InMemoryPersistedQueryStore):
+    """
+    Read-only store built from a persisted query manifest, parsed once at startup.
+    Unknown hashes are rejected instead of being registered, which turns the manifest
+    into a safelist.
+
+    Args:
+        manifest (str or Mapping): Path to a JSON manifest, or the loaded manifest. Both the
+            ``{hash: query}`` format and Apollo's ``{"operations": [{"id", "body"}]}`` format
+            are accepted.
+    """
+    readonly = True
+
+    def __init__(self, manifest):
+        super().__init__(maxsize=None)
+        if isinstance(manifest, str):
+            with open(manifest, encoding='utf-8') as f:
+                manifest = json.load(f)
+        if 'operations' in manifest:
+            manifest = {operation['id']: operation['body'] for operation in manifest['operations']}
+        for query_hash, query in manifest.items():
+            self._queries[query_hash] = PersistedQuery(query, parse(query))
+
+class SQLitePersistedQueryStore(BasePersistedQueryStore):
+    """
+    Persists queries in a SQLite database file, so they survive restarts and can be
+    shared by the workers of a host. Parsed documents are kept in a bounded in-process
+    cache. Once the table holds ``maxsize`` queries, the oldest registered ones are deleted
+    to register new ones.
+
+    Args:
+        path (str): Path of the SQLite database file.
+        table (str): Name of the table holding the queries. Created if missing.
+        document_cache_size (int): Number of parsed documents kept in memory.
+        maxsize (Optional[int]): Maximum number of queries kept in the table. Default 10000,
+            ``None`` for no limit.
+    """
+
+    def __init__(self, path, table='persisted_queries', document_cache_size=1000, maxsize=10000):
+        assert table.isidentifier(), f'Invalid table name "{table}".'
+        assert maxsize is None or maxsize > 0, f'SQLitePersistedQueryStore maxsize must be a positive integer or None, received "{maxsize}".'
+        self.table = table
+        self.maxsize = maxsize
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        self._documents = LRUCache(document_cache_size)
+        with self._lock, self._connection:
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS {table} (hash TEXT PRIMARY KEY, query TEXT NOT NULL)')
+
+    def get_query(self, query_hash):
+        with self._lock:
+            row = self._connection.execute(f'SELECT query FROM {self.table} WHERE hash = ?', (query_hash,)).fetchone()
+        return row[0] if row else None
+
+    def set_query(self, query_hash, query):
+        with self._lock, self._connection:
+            inserted = self._connection.execute(f'INSERT OR IGNORE INTO {self.table} (hash, query) VALUES (?, ?)', (query_hash, query)).rowcount
+            if inserted and self.maxsize is not None:
+                self._connection.execute(f'DELETE FROM {self.table} WHERE rowid IN (SELECT rowid FROM {self.table} ORDER BY rowid DESC LIMIT -1 OFFSET ?)', (self.maxsize,))
+
+    def get(self, query_hash):
+        persisted = self._documents.get(query_hash)
+        if persisted is None:
+            persisted = super().get(query_hash)
+            if persisted is not None:
+                self._documents[query_hash] = persisted
+        return persisted
+
+    def set(self, query_hash, query, document=None):
+        self.set_query(query_hash, query)
+        self._documents[query_hash] = PersistedQuery(query, document or parse(query))
+
+    def close(self):
+        self._connection.close()
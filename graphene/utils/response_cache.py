@@ -0,0 +1,200 @@
+"""
+Whole-response caches for ``Schema(response_cache=...)``, serving repeated queries without
+executing their resolvers.
+"""
+import json
+import sqlite3
+from collections import OrderedDict, namedtuple
+from hashlib import sha256
+from threading import Lock
+from time import monotonic, time
+from weakref import WeakKeyDictionary
+from graphql import print_ast
+ResponseCacheStats = namedtuple('ResponseCacheStats', 'hits,misses,stores,evictions,currsize')
+
+class BaseResponseCache:
+    """
+    Maps request keys to the JSON encoded ``data`` of successful query results, for ``ttl``
+    seconds. Subclasses implement ``get_payload``, ``set_payload``, ``clear`` and ``__len__``.
+
+    Keys combine a fingerprint of the normalized document (as printed by graphql-core, so
+    whitespace and comments don't matter), the operation name, the variables and a
+    caller-provided ``scope`` (tenant, locale...) isolating the cached responses of
+    different audiences.
+
+    Args:
+        ttl (float): Number of seconds a response stays cached. Default 60.
+    """
+
+    def __init__(self, ttl=60):
+        assert ttl > 0, f'Response cache ttl must be positive, received "{ttl}".'
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._fingerprints = WeakKeyDictionary()
+
+    def get_payload(self, key):
+        """Returns the payload cached for ``key`` if it hasn't expired, or ``None``."""
+        raise NotImplementedError
+
+    def set_payload(self, key, payload, ttl):
+        """Caches ``payload`` under ``key`` for ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Removes every cached response, keeping the counters."""
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def get_fingerprint(self, document):
+        """Returns the SHA-256 digest of the normalized ``document``, computed once per document."""
+        fingerprint = self._fingerprints.get(document)
+        if fingerprint is None:
+            fingerprint = sha256(print_ast(document).encode('utf-8')).hexdigest()
+            self._fingerprints[document] = fingerprint
+        return fingerprint
+
+    def get_key(self, document, operation_name=None, variables=None, scope=None):
+        """Returns the cache key of a request."""
+        variables = json.dumps(variables, sort_keys=True, separators=(',', ':'), default=str) if variables else ''
+        return sha256(f'{self.get_fingerprint(document)}:{operation_name or ""}:{scope or ""}:{variables}'.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Returns the ``data`` cached for ``key``, or ``None`` on a miss."""
+        payload = self.get_payload(key)
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(payload)
+
+    def set(self, key, data, ttl=None):
+        """
+        Caches the ``data`` of a successful result under ``key``, for ``ttl`` seconds
+        (defaults to the cache's ``ttl``). Data that can't be JSON encoded is not cached.
+        """
+        try:
+            payload = json.dumps(data, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return
+        self.set_payload(key, payload, self.ttl if ttl is None else ttl)
+        self.stores += 1
+
+    def info(self):
+        """Returns a ``ResponseCacheStats`` snapshot of the counters."""
+        return ResponseCacheStats(self.hits, self.misses, self.stores, self.evictions, len(self))
+
+class InMemoryResponseCache(BaseResponseCache):
+    """
+    Keeps responses in an in-process LRU bounded both in number of entries and in total size
+    of the encoded responses.
+
+    Args:
+        ttl (float): Number of seconds a response stays cached. Default 60.
+        maxsize (int): Maximum number of cached responses. Default 1000.
+        max_bytes (int, optional): Maximum total size of the cached responses, in bytes.
+            Responses larger than this are not cached. Unbounded by default.
+    """
+
+    def __init__(self, ttl=60, maxsize=1000, max_bytes=None):
+        super().__init__(ttl)
+        assert maxsize > 0, f'Response cache maxsize must be positive, received "{maxsize}".'
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.currbytes = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get_payload(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, payload = entry
+            if expires <= monotonic():
+                del self._data[key]
+                self.currbytes -= len(payload)
+                return None
+            self._data.move_to_end(key)
+            return payload
+
+    def set_payload(self, key, payload, ttl):
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            data = self._data
+            previous = data.pop(key, None)
+            if previous is not None:
+                self.currbytes -= len(previous[1])
+            data[key] = (monotonic() + ttl, payload)
+            self.currbytes += len(payload)
+            while len(data) > self.maxsize or (self.max_bytes is not None and self.currbytes > self.max_bytes):
+                _, (_, evicted) = data.popitem(last=False)
+                self.currbytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.currbytes = 0
+
+    def __len__(self):
+        return len(self._data)
+
+class SQLiteResponseCache(BaseResponseCache):
+    """
+    Keeps responses in a SQLite database file, so they are shared by the workers of a host
+    and survive restarts. Expiration uses the wall clock.
+
+    Args:
+        path (str): Path of the SQLite database file.
+        ttl (float): Number of seconds a response stays cached. Default 60.
+        maxsize (int): Maximum number of cached responses. The least recently used ones are
+            evicted first. Default 10000.
+        table (str): Name of the table holding the responses. Created if missing.
+    """
+
+    def __init__(self, path, ttl=60, maxsize=10000, table='response_cache'):
+        super().__init__(ttl)
+        assert table.isidentifier(), f'Invalid table name "{table}".'
+        self.maxsize = maxsize
+        self.table = table
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires REAL NOT NULL, used REAL NOT NULL)')
+
+    def get_payload(self, key):
+        now = time()
+        with self._lock, self._connection:
+            row = self._connection.execute(f'SELECT payload FROM {self.table} WHERE key = ? AND expires > ?', (key, now)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(f'UPDATE {self.table} SET used = ? WHERE key = ?', (now, key))
+        return row[0]
+
+    def set_payload(self, key, payload, ttl):
+        now = time()
+        with self._lock, self._connection:
+            connection = self._connection
+            connection.execute(f'INSERT OR REPLACE INTO {self.table} (key, payload, expires, used) VALUES (?, ?, ?, ?)', (key, payload, now + ttl, now))
+            connection.execute(f'DELETE FROM {self.table} WHERE expires <= ?', (now,))
+            excess = connection.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0] - self.maxsize
+            if excess > 0:
+                connection.execute(f'DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} ORDER BY used LIMIT ?)', (excess,))
+                self.evictions += excess
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute(f'DELETE FROM {self.table}')
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(f'SELECT COUNT(*) FROM {self.table} WHERE expires > ?', (time(),)).fetchone()[0]
+
+    def close(self):
+        self._connection.close()
@@ -14,6 +14,7 @@ class SubclassWithMeta_Meta(type):
 
 class SubclassWithMeta(metaclass=SubclassWithMeta_Meta):
     """This class improves __init_subclass__ to receive automatically the options from meta"""
+    __slots__ = ()
 
     def __init_subclass__(cls, **meta_options):
         """This method just terminates the super() chain"""
@@ -1,9 +1,18 @@
-from asyncio import gather
+from asyncio import gather, new_event_loop, sleep
 from collections import namedtuple
 from functools import partial
 from unittest.mock import Mock
 
-from graphene.utils.dataloader import DataLoader
+from graphene.utils.dataloader import (
+    BatchingExecutionContext,
+    DataLoader,
+    DataLoaderStats,
+    DelayScheduler,
+    Histogram,
+    KeysOrDeadlineScheduler,
+    LRUCacheMap,
+    SyncDataLoader,
+)
 from pytest import mark, raises
 
 from graphene import ObjectType, String, Schema, Field, List
@@ -450,3 +459,315 @@ async def test_dataloader_clear_with_missing_key_works():
 
     a_loader, a_load_calls = id_loader(resolve=do_resolve)
     assert a_loader.clear("A1") == a_loader
+
+
+@mark.asyncio
+async def test_lru_cache_map_evicts_least_recently_used():
+    cache_map = LRUCacheMap(maxsize=2)
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    assert await identity_loader.load_many([1, 2]) == [1, 2]
+    assert await identity_loader.load(1) == 1
+    assert await identity_loader.load(3) == 3
+    assert await identity_loader.load(2) == 2
+    assert load_calls == [[1, 2], [3], [2]]
+
+    info = cache_map.info()
+    assert (info.hits, info.misses, info.evictions) == (1, 4, 2)
+    assert (info.maxsize, info.currsize, info.pending) == (2, 2, 0)
+
+
+@mark.asyncio
+async def test_lru_cache_map_never_evicts_pending_futures():
+    cache_map = LRUCacheMap(maxsize=1)
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    futures = [identity_loader.load(key) for key in [1, 2, 3]]
+    assert cache_map.info().pending == 3
+    assert identity_loader.load(1) is futures[0]
+    assert await gather(*futures) == [1, 2, 3]
+    assert load_calls == [[1, 2, 3]]
+
+    info = cache_map.info()
+    assert (info.currsize, info.pending, info.evictions) == (1, 0, 2)
+
+
+@mark.asyncio
+async def test_lru_cache_map_expires_values():
+    cache_map = LRUCacheMap(ttl=0)
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    assert await identity_loader.load(1) == 1
+    assert await identity_loader.load(1) == 1
+    assert load_calls == [[1], [1]]
+    assert cache_map.info().expirations == 1
+
+
+@mark.asyncio
+async def test_lru_cache_map_clear_and_prime():
+    cache_map = LRUCacheMap(maxsize=10)
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    identity_loader.prime("A", "Primed").prime("B", "Primed")
+    assert await identity_loader.load_many(["A", "C"]) == ["Primed", "C"]
+    assert len(cache_map) == 3
+
+    identity_loader.clear("A")
+    assert await identity_loader.load("A") == "A"
+    identity_loader.clear_all()
+    assert len(cache_map) == 0
+    assert await identity_loader.load("B") == "B"
+    assert load_calls == [["C"], ["A"], ["B"]]
+
+
+def concurrency_loader(**options):
+    in_flight = []
+    max_in_flight = []
+
+    async def fn(keys):
+        in_flight.append(keys)
+        max_in_flight.append(len(in_flight))
+        await sleep(0.01)
+        in_flight.remove(keys)
+        if "fail" in keys:
+            raise Exception("Batch failed")
+        return keys
+
+    return DataLoader(fn, **options), max_in_flight
+
+
+@mark.asyncio
+async def test_dispatches_split_batches_concurrently():
+    loader, max_in_flight = concurrency_loader(max_batch_size=2)
+    assert await loader.load_many(range(10)) == list(range(10))
+    assert max(max_in_flight) == 5
+
+
+@mark.asyncio
+async def test_limits_concurrent_batches():
+    loader, max_in_flight = concurrency_loader(
+        max_batch_size=2, max_concurrent_batches=2
+    )
+    assert await loader.load_many(range(10)) == list(range(10))
+    assert max(max_in_flight) == 2
+    assert len(max_in_flight) == 5
+
+
+@mark.asyncio
+async def test_failed_batch_only_rejects_its_keys():
+    loader, _ = concurrency_loader(max_batch_size=2)
+    results = await gather(
+        *[loader.load(key) for key in ["a", "b", "c", "fail"]], return_exceptions=True
+    )
+    assert results[:2] == ["a", "b"]
+    assert [str(error) for error in results[2:]] == ["Batch failed", "Batch failed"]
+    assert "c" not in loader._cache
+    assert "a" in loader._cache
+
+
+def test_limits_concurrent_batches_on_each_loop():
+    loader, max_in_flight = concurrency_loader(
+        max_batch_size=2, max_concurrent_batches=2
+    )
+    for _ in range(2):
+        loop = new_event_loop()
+        loader._loop = loop
+        try:
+            results = loop.run_until_complete(loader.load_many(range(8)))
+        finally:
+            loop.close()
+        assert results == list(range(8))
+        loader.clear_all()
+    assert max(max_in_flight) == 2
+    assert len(max_in_flight) == 8
+
+
+@mark.asyncio
+async def test_batch_duration_distribution():
+    stats = DataLoaderStats()
+    loader, _ = concurrency_loader(max_batch_size=2, stats=stats)
+    await loader.load_many(range(6))
+    summary = stats.batch_duration.summary()
+    assert summary["count"] == 3
+    assert 0.01 <= summary["min"] <= summary["p50"] <= summary["max"]
+
+
+async def load_over_ticks(loader, keys):
+    async def load_after(key, ticks):
+        for _ in range(ticks):
+            await sleep(0)
+        return await loader.load(key)
+
+    return await gather(*[load_after(key, ticks) for ticks, key in enumerate(keys)])
+
+
+@mark.asyncio
+async def test_next_tick_scheduler_dispatches_each_tick():
+    stats = DataLoaderStats()
+    loader, load_calls = id_loader(stats=stats)
+    assert await load_over_ticks(loader, [1, 2, 3, 4]) == [1, 2, 3, 4]
+    assert len(load_calls) > 1
+    assert stats.wait.count == len(load_calls)
+
+
+@mark.asyncio
+async def test_delay_scheduler_batches_keys_loaded_over_ticks():
+    stats = DataLoaderStats()
+    loader, load_calls = id_loader(scheduler=DelayScheduler(delay_us=5000), stats=stats)
+    assert await load_over_ticks(loader, [1, 2, 3, 4]) == [1, 2, 3, 4]
+    assert load_calls == [[1, 2, 3, 4]]
+    assert stats.batch_size.max == 4
+    assert stats.wait.min >= 0.005
+
+
+@mark.asyncio
+async def test_keys_or_deadline_scheduler_dispatches_full_queues():
+    stats = DataLoaderStats()
+    scheduler = KeysOrDeadlineScheduler(max_keys=2, deadline_us=5000)
+    loader, load_calls = id_loader(scheduler=scheduler, stats=stats)
+    assert await load_over_ticks(loader, [1, 2, 3, 4, 5]) == [1, 2, 3, 4, 5]
+    assert load_calls == [[1, 2], [3, 4], [5]]
+    assert stats.wait.max >= 0.005
+    assert stats.wait.min < 0.005
+
+
+@mark.asyncio
+async def test_dataloader_stats():
+    async def resolve(keys):
+        return [Exception("Not found") if key == "missing" else key for key in keys]
+
+    stats = DataLoaderStats()
+    loader, _ = id_loader(resolve=resolve, stats=stats)
+    results = await gather(
+        *[loader.load(key) for key in ["a", "b", "a", "missing"]],
+        return_exceptions=True,
+    )
+    assert results[:3] == ["a", "b", "a"]
+    await loader.load("b")
+    assert stats.loads == 5
+    assert stats.cache_hits == 2
+    assert stats.hit_rate == 0.4
+    assert stats.errors == 1
+    summary = stats.summary()
+    assert summary["batches"] == 1
+    assert summary["batch_size"]["max"] == 3
+    assert summary["wait"]["count"] == 1
+    assert summary["batch_duration"]["count"] == 1
+
+
+@mark.asyncio
+async def test_dataloader_stats_failed_batch():
+    async def resolve(keys):
+        raise Exception("Batch failed")
+
+    stats = DataLoaderStats()
+    loader, _ = id_loader(resolve=resolve, stats=stats)
+    results = await gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert [str(error) for error in results] == ["Batch failed", "Batch failed"]
+    assert stats.errors == 2
+
+
+@mark.asyncio
+async def test_dataloader_without_stats_records_nothing(monkeypatch):
+    observed = []
+    monkeypatch.setattr(Histogram, "observe", lambda self, value: observed.append(value))
+
+    for scheduler in (None, DelayScheduler(delay_us=0)):
+        loader, load_calls = id_loader(max_batch_size=1, scheduler=scheduler)
+        assert await loader.load_many([1, 2]) == [1, 2]
+        assert load_calls == [[1], [2]]
+        assert loader._queued_at is None
+    assert observed == []
+
+
+class SyncCharacterType(ObjectType):
+    name = String()
+    sibling = Field(lambda: SyncCharacterType)
+
+    def resolve_sibling(character, info):
+        if character["sibling"]:
+            return info.context.character_loader.load(character["sibling"])
+        return None
+
+
+class SyncQuery(ObjectType):
+    skywalker_family = List(SyncCharacterType)
+
+    def resolve_skywalker_family(_, info):
+        return info.context.character_loader.load_many(["1", "2", "3"])
+
+
+def test_sync_dataloader_batches_each_level():
+    load_calls = []
+
+    def batch_load_fn(character_ids):
+        load_calls.append(character_ids)
+        return [CHARACTERS[character_id] for character_id in character_ids]
+
+    schema = Schema(query=SyncQuery)
+    context = Context(character_loader=SyncDataLoader(batch_load_fn))
+    result = schema.execute(
+        "{ skywalkerFamily { name sibling { name sibling { name } } } }",
+        context=context,
+        execution_context_class=BatchingExecutionContext,
+    )
+
+    assert not result.errors
+    assert result.data["skywalkerFamily"][0] == {
+        "name": "Luke Skywalker",
+        "sibling": {"name": "Leia Organa", "sibling": {"name": "Luke Skywalker"}},
+    }
+    assert load_calls == [["1", "2", "3"]]
+
+
+def test_sync_dataloader_errors():
+    def batch_load_fn(character_ids):
+        return [
+            Exception("Not found") if character_id == "3" else CHARACTERS[character_id]
+            for character_id in character_ids
+        ]
+
+    schema = Schema(query=SyncQuery)
+    context = Context(character_loader=SyncDataLoader(batch_load_fn))
+    result = schema.execute(
+        "{ skywalkerFamily { name } }",
+        context=context,
+        execution_context_class=BatchingExecutionContext,
+    )
+    assert [error.message for error in result.errors] == ["Not found"]
+    assert result.data == {"skywalkerFamily": None}
+
+
+@mark.asyncio
+async def test_sync_dataloader_batches_under_running_loop():
+    load_calls = []
+
+    def batch_load_fn(character_ids):
+        load_calls.append(character_ids)
+        return [CHARACTERS[character_id] for character_id in character_ids]
+
+    schema = Schema(query=SyncQuery)
+    context = Context(character_loader=SyncDataLoader(batch_load_fn))
+    result = schema.execute(
+        "{ skywalkerFamily { name sibling { name } } }",
+        context=context,
+        execution_context_class=BatchingExecutionContext,
+    )
+
+    assert not result.errors
+    assert result.data["skywalkerFamily"][1] == {"name": "Darth Vader", "sibling": None}
+    assert load_calls == [["1", "2", "3"]]
+
+
+@mark.asyncio
+async def test_sync_dataloader_in_event_loop():
+    load_calls = []
+
+    class IdentityLoader(SyncDataLoader):
+        def batch_load_fn(self, keys):
+            load_calls.append(keys)
+            return keys
+
+    loader = IdentityLoader()
+    assert await gather(loader.load(1), loader.load(2)) == [1, 2]
+    assert load_calls == [[1, 2]]
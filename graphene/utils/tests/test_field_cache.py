@@ -0,0 +1,175 @@
+from asyncio import CancelledError, create_task, gather, sleep as async_sleep
+from threading import Thread
+from time import sleep
+from types import SimpleNamespace
+
+from pytest import mark, raises
+
+from ...types import Field, Int, ObjectType, Schema, String
+from ..field_cache import FieldCache, get_parent_key
+
+info = SimpleNamespace(
+    parent_type=SimpleNamespace(name="Query"), field_name="rate", context=None
+)
+
+
+def test_get_parent_key():
+    assert get_parent_key(None) is None
+    assert get_parent_key(SimpleNamespace(id=1)) == ("SimpleNamespace", 1)
+    assert get_parent_key("root") == "root"
+    with raises(TypeError):
+        get_parent_key({"id": 1})
+
+
+def test_field_cache_sync_resolver():
+    calls = []
+
+    def resolve_rate(root, info, currency="EUR"):
+        calls.append(currency)
+        return len(calls)
+
+    resolver = FieldCache(ttl=60).wrap(resolve_rate)
+    assert resolver(None, info) == 1
+    assert resolver(None, info) == 1
+    assert resolver(None, info, currency="USD") == 2
+    assert resolver(None, info, currency="USD") == 2
+    assert calls == ["EUR", "USD"]
+
+
+def test_field_cache_keyed_by_parent():
+    cache = FieldCache(ttl=60)
+    resolver = cache.wrap(lambda root, info: root.id * 10)
+    assert resolver(SimpleNamespace(id=1), info) == 10
+    assert resolver(SimpleNamespace(id=2), info) == 20
+    assert cache.info().currsize == 2
+
+
+def test_field_cache_scope_and_key():
+    calls = []
+
+    def resolve_rate(root, info):
+        calls.append(info.context)
+        return info.context
+
+    cache = FieldCache(
+        ttl=60, scope=lambda info: info.context, key=lambda root, info: 0
+    )
+    resolver = cache.wrap(resolve_rate)
+    for context in ("a", "b", "a"):
+        context_info = SimpleNamespace(**dict(vars(info), context=context))
+        assert resolver({"not": "hashable"}, context_info) == context
+    assert calls == ["a", "b"]
+
+
+def test_field_cache_expires():
+    calls = []
+    resolver = FieldCache(ttl=0.01).wrap(lambda root, info: calls.append(1))
+    resolver(None, info)
+    sleep(0.02)
+    resolver(None, info)
+    assert len(calls) == 2
+
+
+def test_field_cache_does_not_cache_errors():
+    calls = []
+
+    def resolve_rate(root, info):
+        calls.append(1)
+        raise ValueError("Unavailable")
+
+    resolver = FieldCache(ttl=60).wrap(resolve_rate)
+    for _ in range(2):
+        with raises(ValueError):
+            resolver(None, info)
+    assert len(calls) == 2
+
+
+@mark.asyncio
+async def test_field_cache_async_resolver():
+    calls = []
+
+    async def resolve_rate(root, info):
+        calls.append(1)
+        return 1.5
+
+    resolver = FieldCache(ttl=60).wrap(resolve_rate)
+    assert await resolver(None, info) == 1.5
+    assert await resolver(None, info) == 1.5
+    assert len(calls) == 1
+
+
+@mark.asyncio
+async def test_field_cache_async_stampede_protection():
+    calls = []
+
+    async def resolve_rate(root, info):
+        calls.append(1)
+        await async_sleep(0.01)
+        return 1.5
+
+    resolver = FieldCache(ttl=60, lock=True).wrap(resolve_rate)
+    assert await gather(*(resolver(None, info) for _ in range(5))) == [1.5] * 5
+    assert len(calls) == 1
+
+
+@mark.asyncio
+async def test_field_cache_async_stampede_protection_leader_cancelled():
+    calls = []
+
+    async def resolve_rate(root, info):
+        calls.append(1)
+        await async_sleep(0.01)
+        return 1.5
+
+    cache = FieldCache(ttl=60, lock=True)
+    resolver = cache.wrap(resolve_rate)
+    leader = create_task(resolver(None, info))
+    await async_sleep(0)
+    waiters = [create_task(resolver(None, info)) for _ in range(2)]
+    await async_sleep(0)
+    leader.cancel()
+
+    with raises(CancelledError):
+        await leader
+    assert await gather(*waiters) == [1.5, 1.5]
+    assert len(calls) == 2
+    assert not cache._pending
+
+
+def test_field_cache_threaded_stampede_protection():
+    calls = []
+    results = []
+
+    def resolve_rate(root, info):
+        calls.append(1)
+        sleep(0.02)
+        return 1.5
+
+    resolver = FieldCache(ttl=60, lock=True).wrap(resolve_rate)
+    threads = [
+        Thread(target=lambda: results.append(resolver(None, info))) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [1.5] * 5
+    assert len(calls) == 1
+
+
+def test_field_cache_option():
+    calls = []
+
+    class Query(ObjectType):
+        rate = Field(Int, currency=String(), cache=60)
+
+        def resolve_rate(root, info, currency="EUR"):
+            calls.append(currency)
+            return len(calls)
+
+    schema = Schema(query=Query)
+    assert isinstance(Query._meta.fields["rate"].cache, FieldCache)
+    assert schema.execute("{ rate }").data == {"rate": 1}
+    assert schema.execute("{ rate }").data == {"rate": 1}
+    assert schema.execute('{ rate(currency: "USD") }').data == {"rate": 2}
+    assert calls == ["EUR", "USD"]
@@ -0,0 +1,62 @@
+from pytest import raises
+
+from ..lru import CacheInfo, LRUCache
+
+
+def test_lru_get_and_set():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+
+    assert cache.get("a") == 1
+    assert cache["a"] == 1
+    assert cache.get("b") is None
+    assert cache.get("b", 2) == 2
+    assert "a" in cache
+    assert len(cache) == 1
+    assert cache.info() == CacheInfo(
+        hits=2, misses=2, evictions=0, maxsize=2, currsize=1
+    )
+
+
+def test_lru_missing_key_raises():
+    cache = LRUCache()
+    with raises(KeyError):
+        cache["missing"]
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert cache.evictions == 1
+
+
+def test_lru_unbounded():
+    cache = LRUCache(maxsize=None)
+    for i in range(1000):
+        cache[i] = i
+
+    assert len(cache) == 1000
+    assert cache.evictions == 0
+
+
+def test_lru_clear_keeps_counters():
+    cache = LRUCache(maxsize=1)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("b")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.info() == CacheInfo(
+        hits=1, misses=0, evictions=1, maxsize=1, currsize=0
+    )
+
+
+def test_lru_invalid_maxsize():
+    with raises(AssertionError):
+        LRUCache(maxsize=0)
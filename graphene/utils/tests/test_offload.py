@@ -0,0 +1,232 @@
+from asyncio import run
+from contextvars import ContextVar
+from os import getpid
+from threading import Lock, current_thread, main_thread
+from time import sleep
+
+from pytest import mark, raises
+
+from ...types import Field, Float, Int, ObjectType, Schema, String
+from ..offload import (
+    ProcessPoolOffloader,
+    ThreadPoolOffloader,
+    get_default_process_offloader,
+    get_default_thread_offloader,
+    set_default_process_offloader,
+    set_default_thread_offloader,
+)
+
+request_id = ContextVar("request_id", default=None)
+
+
+def resolve_thread(root, info):
+    sleep(0.05)
+    return f"{request_id.get()}:{current_thread() is main_thread()}"
+
+
+@mark.asyncio
+async def test_field_run_in_thread():
+    offloader = ThreadPoolOffloader(max_workers=2)
+
+    class Query(ObjectType):
+        first = Field(String, resolver=resolve_thread, run_in_thread=offloader)
+        second = Field(String, resolver=resolve_thread, run_in_thread=offloader)
+        inline = Field(String, resolver=resolve_thread)
+
+    schema = Schema(Query)
+    request_id.set("request")
+
+    result = await schema.execute_async("{ first second inline }")
+
+    assert not result.errors
+    assert result.data == {
+        "first": "request:False",
+        "second": "request:False",
+        "inline": "request:True",
+    }
+    assert set(offloader.stats) == {"Query.first", "Query.second"}
+    stats = offloader.stats["Query.first"]
+    assert stats.calls == 1
+    assert stats.total_queue_wait >= 0
+    assert stats.total_run_time >= 0.05
+    offloader.shutdown()
+
+
+@mark.asyncio
+async def test_objecttype_run_in_thread():
+    offloader = ThreadPoolOffloader(max_workers=4)
+
+    class Query(ObjectType):
+        class Meta:
+            run_in_thread = offloader
+
+        first = String()
+        second = String()
+        name = String()
+
+        def resolve_first(root, info):
+            return resolve_thread(root, info)
+
+        def resolve_second(root, info):
+            return resolve_thread(root, info)
+
+    schema = Schema(Query)
+
+    result = await schema.execute_async("{ first second name }", root={"name": "a"})
+
+    assert not result.errors
+    assert result.data == {
+        "first": "None:False",
+        "second": "None:False",
+        "name": "a",
+    }
+    assert set(offloader.stats) == {"Query.first", "Query.second"}
+    offloader.shutdown()
+
+
+def test_run_in_thread_inline_under_execute():
+    offloader = ThreadPoolOffloader(max_workers=1)
+
+    class Query(ObjectType):
+        value = Field(String, resolver=resolve_thread, run_in_thread=offloader)
+
+    schema = Schema(Query)
+
+    result = schema.execute("{ value }")
+
+    assert result.data == {"value": "None:True"}
+    assert offloader.stats == {}
+
+
+@mark.asyncio
+async def test_run_in_thread_error():
+    def fail(root, info):
+        raise Exception("Failed in thread")
+
+    class Query(ObjectType):
+        value = Field(String, resolver=fail, run_in_thread=True)
+
+    result = await Schema(Query).execute_async("{ value }")
+
+    assert result.data == {"value": None}
+    assert result.errors[0].message == "Failed in thread"
+
+
+def test_default_thread_offloader():
+    default = get_default_thread_offloader()
+    offloader = ThreadPoolOffloader(max_workers=2)
+    set_default_thread_offloader(offloader)
+    try:
+        assert get_default_thread_offloader() is offloader
+    finally:
+        set_default_thread_offloader(default)
+
+
+def test_wrap_keeps_async_resolvers():
+    async def resolver(root, info):
+        return None
+
+    offloader = ThreadPoolOffloader()
+    wrapped = offloader.wrap(resolve_thread)
+
+    assert offloader.wrap(resolver) is resolver
+    assert offloader.wrap(wrapped) is wrapped
+
+
+def resolve_pid(root, multiplier=1):
+    return getpid() * multiplier
+
+
+def resolve_score(root, n):
+    return float(sum(i * i for i in range(n)))
+
+
+@mark.asyncio
+async def test_field_run_in_process():
+    offloader = ProcessPoolOffloader(max_workers=1)
+
+    class Query(ObjectType):
+        pid = Field(
+            Int, multiplier=Int(), resolver=resolve_pid, run_in_process=offloader
+        )
+
+    result = await Schema(Query).execute_async("{ pid(multiplier: 1) }")
+
+    assert not result.errors
+    assert result.data["pid"] != getpid()
+    assert offloader.stats["Query.pid"].calls == 1
+    offloader.shutdown()
+
+
+def test_run_in_process_inline_under_execute():
+    offloader = ProcessPoolOffloader(max_workers=1)
+
+    class Query(ObjectType):
+        pid = Field(Int, resolver=resolve_pid, run_in_process=offloader)
+
+    result = Schema(Query).execute("{ pid }")
+
+    assert result.data == {"pid": getpid()}
+    assert offloader.stats == {}
+
+
+def test_run_in_process_unpicklable_resolver():
+    class Query(ObjectType):
+        value = Field(Int, resolver=lambda root: 1, run_in_process=True)
+
+    with raises(TypeError) as exc_info:
+        Schema(Query)
+
+    assert "must be picklable to run in a process" in str(exc_info.value)
+
+
+@mark.asyncio
+async def test_run_in_process_unpicklable_parent_value():
+    offloader = ProcessPoolOffloader(max_workers=1)
+
+    class Query(ObjectType):
+        pid = Field(Int, resolver=resolve_pid, run_in_process=offloader)
+
+    result = await Schema(Query).execute_async("{ pid }", root=Lock())
+
+    assert result.data == {"pid": None}
+    assert result.errors[0].message.startswith(
+        "The parent value and arguments of Query.pid must be picklable"
+    )
+    offloader.shutdown()
+
+
+def test_run_in_thread_and_process_exclusive():
+    with raises(AssertionError):
+        Field(Int, resolver=resolve_pid, run_in_thread=True, run_in_process=True)
+
+
+def test_default_process_offloader():
+    default = get_default_process_offloader()
+    offloader = ProcessPoolOffloader(max_workers=2)
+    set_default_process_offloader(offloader)
+    try:
+        assert get_default_process_offloader() is offloader
+    finally:
+        set_default_process_offloader(default)
+
+
+@mark.parametrize("max_workers", [1, 2, 4])
+def test_run_in_process_throughput_benchmark(benchmark, max_workers):
+    offloader = ProcessPoolOffloader(max_workers=max_workers)
+
+    class Query(ObjectType):
+        score = Field(
+            Float, n=Int(required=True), resolver=resolve_score, run_in_process=offloader
+        )
+
+    schema = Schema(Query)
+    query = "{ %s }" % " ".join(f"s{i}: score(n: 200000)" for i in range(8))
+
+    def execute():
+        return run(schema.execute_async(query))
+
+    execute()  # start the worker processes before measuring
+    result = benchmark(execute)
+    assert not result.errors
+    offloader.shutdown()
@@ -0,0 +1,179 @@
+import json
+from hashlib import sha256
+
+from graphql import DocumentNode, Source, parse
+from pytest import fixture, raises
+
+from ...test import Client
+from ...types import ObjectType, Schema, String
+from ..persisted_queries import (
+    InMemoryPersistedQueryStore,
+    ManifestPersistedQueryStore,
+    SQLitePersistedQueryStore,
+    get_query_hash,
+)
+
+
+class Query(ObjectType):
+    hello = String(name=String())
+
+    def resolve_hello(root, info, name="World"):
+        return f"Hello {name}"
+
+
+QUERY = "query Hello($name: String) { hello(name: $name) }"
+QUERY_HASH = get_query_hash(QUERY)
+
+
+@fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryPersistedQueryStore()
+        return
+    store = SQLitePersistedQueryStore(str(tmp_path / "queries.db"))
+    yield store
+    store.close()
+
+
+def test_get_query_hash():
+    assert get_query_hash("{ hello }") == sha256(b"{ hello }").hexdigest()
+    assert get_query_hash(Source("{ hello }")) == get_query_hash("{ hello }")
+    assert get_query_hash(parse("{ hello }")) == get_query_hash("{ hello }")
+    with raises(TypeError):
+        get_query_hash(parse("{ hello }", no_location=True))
+
+
+def test_persisted_query_registered_from_document(store):
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute(parse(QUERY), query_hash=QUERY_HASH)
+    assert result.data == {"hello": "Hello World"}
+    assert store.get(QUERY_HASH).query == QUERY
+
+
+def test_in_memory_store_maxsize():
+    store = InMemoryPersistedQueryStore(["{ a }", "{ b }"], maxsize=2)
+    store.get(get_query_hash("{ a }"))
+    store.set(get_query_hash("{ c }"), "{ c }")
+
+    assert len(store) == 2
+    assert store.get(get_query_hash("{ a }")).query == "{ a }"
+    assert store.get(get_query_hash("{ b }")) is None
+    assert store.get(get_query_hash("{ c }")).query == "{ c }"
+
+
+def test_sqlite_store_maxsize(tmp_path):
+    store = SQLitePersistedQueryStore(
+        str(tmp_path / "queries.db"), document_cache_size=1, maxsize=2
+    )
+    for query in ["{ a }", "{ b }", "{ b }", "{ c }"]:
+        store.set(get_query_hash(query), query)
+
+    assert store.get_query(get_query_hash("{ a }")) is None
+    assert store.get_query(get_query_hash("{ b }")) == "{ b }"
+    assert store.get_query(get_query_hash("{ c }")) == "{ c }"
+    store.close()
+
+
+def test_persisted_query_unknown_hash(store):
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute(query_hash=QUERY_HASH)
+
+    assert result.data is None
+    assert [error.message for error in result.errors] == ["PersistedQueryNotFound"]
+    assert result.errors[0].extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+
+def test_persisted_query_registered_on_first_sight(store):
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute(QUERY, query_hash=QUERY_HASH, variables={"name": "Han"})
+    assert result.data == {"hello": "Hello Han"}
+
+    result = schema.execute(query_hash=QUERY_HASH, variables={"name": "Leia"})
+    assert not result.errors
+    assert result.data == {"hello": "Hello Leia"}
+
+    persisted = store.get(QUERY_HASH)
+    assert persisted.query == QUERY
+    assert isinstance(persisted.document, DocumentNode)
+
+
+def test_persisted_query_hash_mismatch(store):
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute("{ hello }", query_hash=QUERY_HASH)
+
+    assert [error.message for error in result.errors] == [
+        "Provided sha256Hash does not match query"
+    ]
+    assert store.get(QUERY_HASH) is None
+
+
+def test_persisted_query_invalid_query_is_not_registered(store):
+    schema = Schema(Query, persisted_queries=store)
+    query = "{ goodbye }"
+
+    result = schema.execute(query, query_hash=get_query_hash(query))
+
+    assert result.errors
+    assert store.get(get_query_hash(query)) is None
+
+
+def test_persisted_query_not_supported():
+    schema = Schema(Query)
+
+    result = schema.execute(query_hash=QUERY_HASH)
+
+    assert [error.message for error in result.errors] == ["PersistedQueryNotSupported"]
+
+
+def test_sqlite_store_survives_reopening(tmp_path):
+    path = str(tmp_path / "queries.db")
+    store = SQLitePersistedQueryStore(path)
+    store.set(QUERY_HASH, QUERY)
+    store.close()
+
+    store = SQLitePersistedQueryStore(path)
+    assert store.get(QUERY_HASH).query == QUERY
+    store.close()
+
+
+def test_manifest_store(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "format": "apollo-persisted-query-manifest",
+                "version": 1,
+                "operations": [
+                    {"id": QUERY_HASH, "name": "Hello", "type": "query", "body": QUERY}
+                ],
+            }
+        )
+    )
+    store = ManifestPersistedQueryStore(str(manifest))
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute(query_hash=QUERY_HASH)
+    assert result.data == {"hello": "Hello World"}
+
+    query = "{ hello }"
+    result = schema.execute(query, query_hash=get_query_hash(query))
+    assert [error.message for error in result.errors] == ["PersistedQueryNotFound"]
+
+    with raises(AssertionError):
+        store.set(get_query_hash(query), query)
+
+
+def test_manifest_store_from_mapping():
+    store = ManifestPersistedQueryStore({QUERY_HASH: QUERY})
+    assert store.get(QUERY_HASH).query == QUERY
+
+
+def test_client_persisted_query():
+    store = InMemoryPersistedQueryStore([QUERY])
+    client = Client(Schema(Query, persisted_queries=store))
+
+    assert client.execute(query_hash=QUERY_HASH) == {"data": {"hello": "Hello World"}}
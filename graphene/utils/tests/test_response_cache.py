@@ -0,0 +1,154 @@
+from time import sleep
+
+from graphql import parse
+from pytest import fixture, mark
+
+from ...types import Int, ObjectType, Schema, String
+from ..response_cache import InMemoryResponseCache, SQLiteResponseCache
+
+
+@fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryResponseCache(ttl=60, maxsize=2)
+        return
+    cache = SQLiteResponseCache(str(tmp_path / "responses.db"), ttl=60, maxsize=2)
+    yield cache
+    cache.close()
+
+
+def test_response_cache_key_is_normalized():
+    cache = InMemoryResponseCache()
+    key = cache.get_key(parse("{ hello }"))
+    assert cache.get_key(parse("query {\n  hello # comment\n}")) == key
+    assert cache.get_key(parse("{ hello }"), scope="fr") != key
+    assert cache.get_key(parse("{ hello }"), variables={"a": 1}) != key
+    assert cache.get_key(parse("{ goodbye }")) != key
+
+
+def test_response_cache_key_sorts_variables():
+    cache = InMemoryResponseCache()
+    document = parse("{ hello }")
+    assert cache.get_key(document, variables={"a": 1, "b": 2}) == cache.get_key(
+        document, variables={"b": 2, "a": 1}
+    )
+
+
+def test_response_cache_get_set(cache):
+    assert cache.get("key") is None
+    cache.set("key", {"hello": "World"})
+    assert cache.get("key") == {"hello": "World"}
+    info = cache.info()
+    assert (info.hits, info.misses, info.stores, info.currsize) == (1, 1, 1, 1)
+
+
+def test_response_cache_expires(cache):
+    cache.set("key", {"hello": "World"}, ttl=0.01)
+    sleep(0.02)
+    assert cache.get("key") is None
+
+
+def test_response_cache_evicts_least_recently_used(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info().evictions == 1
+
+
+def test_response_cache_clear(cache):
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_in_memory_response_cache_max_bytes():
+    cache = InMemoryResponseCache(maxsize=10, max_bytes=10)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    assert cache.currbytes == 6
+    assert cache.get("a") is None
+    assert cache.get("b") == "bbbb"
+    cache.set("c", "c" * 20)
+    assert cache.get("c") is None
+
+
+def test_response_cache_skips_unserializable_data():
+    cache = InMemoryResponseCache()
+    cache.set("key", {"value": object()})
+    assert cache.get("key") is None
+    assert cache.info().stores == 0
+
+
+calls = []
+
+
+class Query(ObjectType):
+    hello = String(name=String())
+    fail = String()
+    counter = Int()
+
+    def resolve_hello(root, info, name="World"):
+        calls.append(name)
+        return f"Hello {name}"
+
+    def resolve_fail(root, info):
+        calls.append("fail")
+        raise Exception("Failed")
+
+
+class Mutation(ObjectType):
+    hello = String()
+
+    def resolve_hello(root, info):
+        calls.append("mutation")
+        return "Hello"
+
+
+@fixture
+def cached_schema():
+    del calls[:]
+    return Schema(
+        query=Query, mutation=Mutation, response_cache=InMemoryResponseCache()
+    )
+
+
+def test_schema_response_cache(cached_schema):
+    query = "query Hello($name: String) { hello(name: $name) }"
+    result = cached_schema.execute(query, variables={"name": "Ana"})
+    assert result.data == {"hello": "Hello Ana"}
+    result = cached_schema.execute(query, variables={"name": "Ana"})
+    assert result.data == {"hello": "Hello Ana"}
+    assert calls == ["Ana"]
+
+    cached_schema.execute(query, variables={"name": "Bob"})
+    cached_schema.execute(query, variables={"name": "Ana"}, cache_scope="tenant")
+    assert calls == ["Ana", "Bob", "Ana"]
+    assert cached_schema.response_cache.info().hits == 1
+
+
+def test_schema_response_cache_does_not_cache_errors(cached_schema):
+    for _ in range(2):
+        result = cached_schema.execute("{ fail }")
+        assert result.errors
+    assert calls == ["fail", "fail"]
+    assert cached_schema.response_cache.info().stores == 0
+
+
+def test_schema_response_cache_does_not_cache_mutations(cached_schema):
+    cached_schema.execute("mutation { hello }")
+    cached_schema.execute("mutation { hello }")
+    assert calls == ["mutation", "mutation"]
+
+
+@mark.asyncio
+async def test_schema_response_cache_async(cached_schema):
+    result = await cached_schema.execute_async("{ hello }")
+    assert result.data == {"hello": "Hello World"}
+    result = await cached_schema.execute_async("{ hello }")
+    assert result.data == {"hello": "Hello World"}
+    assert calls == ["World"]
@@ -1,5 +1,12 @@
+from .cost import CostAnalysisInstrumentation, cost_analysis_validator, get_operation_costs
 from .depth_limit import depth_limit_validator
 from .disable_introspection import DisableIntrospection
 
 
-__all__ = ["DisableIntrospection", "depth_limit_validator"]
+__all__ = [
+    "CostAnalysisInstrumentation",
+    "DisableIntrospection",
+    "cost_analysis_validator",
+    "depth_limit_validator",
+    "get_operation_costs",
+]
@@ -0,0 +1,219 @@
+from typing import Callable, Dict, Iterable, Mapping, Optional
+from weakref import WeakKeyDictionary
+from graphql import GraphQLError, GraphQLSchema, get_named_type, is_composite_type, is_object_type, is_interface_type
+from graphql.language import FieldNode, FragmentDefinitionNode, FragmentSpreadNode, InlineFragmentNode, IntValueNode, OperationDefinitionNode, VariableNode
+from graphql.validation import ValidationContext, ValidationRule
+from ..types.instrumentation import Instrumentation
+from ..types.utils import get_graphene_field
+
+class QueryCostCalculator:
+    """
+    Computes the static cost of the operations of a document.
+
+    The cost of a field is its own cost plus the cost of its selections, multiplied by the
+    value of its pagination arguments (``first``/``last``) if it has any. The own cost of a
+    field is taken from ``costs`` (keyed by ``"TypeName.fieldName"``), then from the ``cost``
+    of its Graphene ``Field``, then ``default_cost``. Fragment costs are computed once per
+    document. Abstract selections are summed, so the cost is an upper bound.
+
+    Args:
+        schema (GraphQLSchema): Schema the document is validated against.
+        fragments (Dict[str, FragmentDefinitionNode]): Fragments of the document.
+        default_cost (int): Cost of fields without a declared cost.
+        costs (Mapping[str, int], optional): Cost overrides, keyed by ``"TypeName.fieldName"``.
+        multiplier_arguments (Iterable[str]): Arguments multiplying the cost of the selections
+            of a field.
+        default_multiplier (int): Multiplier used for a pagination argument given through a
+            variable without value nor default, when the variables are known.
+        max_multiplier (int): Multiplier used for a pagination argument given through a
+            variable when the variables of the request are not known (during validation),
+            since the client can pass any value.
+        variables (Mapping[str, Any], optional): Variable values of the request, if known.
+    """
+
+    def __init__(self, schema, fragments, default_cost=1, costs=None, multiplier_arguments=('first', 'last'), default_multiplier=1, variables=None, max_multiplier=100):
+        self.schema = schema
+        self.fragments = fragments
+        self.default_cost = default_cost
+        self.costs = costs or {}
+        self.multiplier_arguments = frozenset(multiplier_arguments)
+        self.default_multiplier = default_multiplier
+        self.max_multiplier = max_multiplier
+        self.variables = variables
+        self.variable_defaults = {}
+        self._fragment_costs = {}
+        self._visiting_fragments = set()
+        self._field_costs = {}
+
+    def get_operation_cost(self, operation):
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return 0
+        self.variable_defaults = {definition.variable.name.value: definition.default_value for definition in operation.variable_definitions or () if definition.default_value is not None}
+        return self.get_selection_set_cost(root_type, operation.selection_set)
+
+    def get_selection_set_cost(self, parent_type, selection_set):
+        if selection_set is None:
+            return 0
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self.get_field_node_cost(parent_type, selection)
+            elif isinstance(selection, InlineFragmentNode):
+                type_condition = self.schema.get_type(selection.type_condition.name.value) if selection.type_condition else parent_type
+                cost += self.get_selection_set_cost(type_condition or parent_type, selection.selection_set)
+            elif isinstance(selection, FragmentSpreadNode):
+                cost += self.get_fragment_cost(selection.name.value)
+        return cost
+
+    def get_fragment_cost(self, name):
+        cost = self._fragment_costs.get(name)
+        if cost is not None:
+            return cost
+        fragment = self.fragments.get(name)
+        if fragment is None or name in self._visiting_fragments:
+            return 0
+        self._visiting_fragments.add(name)
+        try:
+            type_condition = self.schema.get_type(fragment.type_condition.name.value)
+            cost = self.get_selection_set_cost(type_condition, fragment.selection_set) if type_condition else 0
+        finally:
+            self._visiting_fragments.discard(name)
+        if self.variables is None or not (self.variables or self.variable_defaults):
+            self._fragment_costs[name] = cost
+        return cost
+
+    def get_field_node_cost(self, parent_type, node):
+        field_name = node.name.value
+        if field_name.startswith('__') or not (is_object_type(parent_type) or is_interface_type(parent_type)):
+            return 0
+        field_def = parent_type.fields.get(field_name)
+        if field_def is None:
+            return 0
+        cost = self.get_field_cost(parent_type, field_name)
+        field_type = get_named_type(field_def.type)
+        if node.selection_set is not None and is_composite_type(field_type):
+            cost += self.get_multiplier(node) * self.get_selection_set_cost(field_type, node.selection_set)
+        return cost
+
+    def get_field_cost(self, parent_type, field_name):
+        key = f'{parent_type.name}.{field_name}'
+        cost = self._field_costs.get(key)
+        if cost is None:
+            cost = self.costs.get(key)
+            if cost is None:
+                field = get_graphene_field(parent_type, field_name)
+                cost = getattr(field, 'cost', None)
+            if cost is None:
+                cost = self.default_cost
+            self._field_costs[key] = cost
+        return cost
+
+    def get_multiplier(self, node):
+        multiplier = None
+        for argument in node.arguments or ():
+            if argument.name.value not in self.multiplier_arguments:
+                continue
+            value = self.get_argument_value(argument.value)
+            if value is not None:
+                multiplier = value if multiplier is None else max(multiplier, value)
+        return 1 if multiplier is None else max(multiplier, 0)
+
+    def get_argument_value(self, value_node):
+        if isinstance(value_node, VariableNode):
+            if self.variables is None:
+                return self.max_multiplier
+            name = value_node.name.value
+            if name in self.variables:
+                value = self.variables[name]
+                return value if isinstance(value, int) else None
+            value_node = self.variable_defaults.get(name)
+            if value_node is None:
+                return self.default_multiplier
+        if isinstance(value_node, IntValueNode):
+            return int(value_node.value)
+        return None
+
+def get_operation_costs(schema, document, variables=None, **options):
+    """
+    Returns the cost of each operation of a document, keyed by operation name, as computed by
+    ``QueryCostCalculator`` with the given ``options``. Useful to charge the cost of a request
+    against a rate limit.
+    """
+    if not isinstance(schema, GraphQLSchema):
+        schema = schema.graphql_schema
+    fragments = {definition.name.value: definition for definition in document.definitions if isinstance(definition, FragmentDefinitionNode)}
+    calculator = QueryCostCalculator(schema, fragments, variables=variables, **options)
+    return {definition.name.value if definition.name else '': calculator.get_operation_cost(definition) for definition in document.definitions if isinstance(definition, OperationDefinitionNode)}
+
+def cost_analysis_validator(max_cost: int, default_cost: int=1, costs: Optional[Mapping[str, int]]=None, multiplier_arguments: Iterable[str]=('first', 'last'), default_multiplier: int=1, variables: Optional[Mapping]=None, callback: Optional[Callable[[Dict[str, int]], None]]=None, max_multiplier: int=100):
+    """
+    Returns a validation rule rejecting the operations costing more than ``max_cost``, as
+    computed by ``QueryCostCalculator``. ``callback`` receives the cost of every operation of
+    the document, keyed by operation name, each time the document is validated: it isn't
+    called for the documents ``Schema.execute`` serves from its cache. Use
+    ``CostAnalysisInstrumentation`` to report the cost of every execution.
+
+    The variables of the request are not known when validating, so the pagination arguments
+    given through variables are charged ``max_multiplier``. The rule is meant to be created
+    once and reused by every request, so ``Schema.execute`` caches the validated documents.
+    """
+
+    class CostAnalysisValidator(ValidationRule):
+
+        def __init__(self, validation_context: ValidationContext):
+            super().__init__(validation_context)
+            document = validation_context.document
+            fragments = {definition.name.value: definition for definition in document.definitions if isinstance(definition, FragmentDefinitionNode)}
+            calculator = QueryCostCalculator(validation_context.schema, fragments, default_cost=default_cost, costs=costs, multiplier_arguments=multiplier_arguments, default_multiplier=default_multiplier, variables=variables, max_multiplier=max_multiplier)
+            operation_costs = {}
+            for definition in document.definitions:
+                if not isinstance(definition, OperationDefinitionNode):
+                    continue
+                name = definition.name.value if definition.name else ''
+                cost = calculator.get_operation_cost(definition)
+                operation_costs[name] = cost
+                if cost > max_cost:
+                    validation_context.report_error(GraphQLError(f"'{name or 'anonymous'}' exceeds maximum operation cost of {max_cost}.", [definition]))
+            if callable(callback):
+                callback(operation_costs)
+    return CostAnalysisValidator
+
+class CostAnalysisInstrumentation(Instrumentation):
+    """
+    Instrumentation reporting the cost of every operation executed by a schema, given as
+    ``Schema(instrumentation=[CostAnalysisInstrumentation(callback)])``, for example to charge
+    it against a rate limit. Unlike the callback of ``cost_analysis_validator``, it is called
+    for the documents served from the document cache too.
+
+    The costs are computed by ``get_operation_costs`` with the variables of the request, so
+    pagination arguments given through variables are charged at their value. The costs of
+    documents without variables are computed once per document.
+
+    Args:
+        callback (Callable[[Dict[str, int], InstrumentedOperation], None]): Called before
+            executing an operation with the cost of every operation of its document, keyed by
+            operation name, and the ``InstrumentedOperation`` (whose ``context_value`` and
+            ``operation_name`` identify the client and the operation executed).
+        **options: Options of ``QueryCostCalculator``: ``default_cost``, ``costs``,
+            ``multiplier_arguments``, ``default_multiplier`` and ``max_multiplier``.
+    """
+
+    def __init__(self, callback, **options):
+        self.callback = callback
+        self.options = options
+        self._costs = WeakKeyDictionary()
+
+    def get_costs(self, operation):
+        """Returns the costs of the operations of the document of an ``InstrumentedOperation``."""
+        document = operation.document
+        costs = self._costs.get(document)
+        if costs is not None:
+            return costs
+        costs = get_operation_costs(operation.schema, document, operation.variable_values or {}, **self.options)
+        if not any((definition.variable_definitions for definition in document.definitions if isinstance(definition, OperationDefinitionNode))):
+            self._costs[document] = costs
+        return costs
+
+    def on_execute_start(self, operation):
+        self.callback(self.get_costs(operation), operation)
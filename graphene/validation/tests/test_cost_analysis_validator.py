@@ -0,0 +1,186 @@
+from graphql import parse, validate
+
+from ...types import Int, List, ObjectType, Schema, String
+from ..cost import (
+    CostAnalysisInstrumentation,
+    cost_analysis_validator,
+    get_operation_costs,
+)
+
+
+class Comment(ObjectType):
+    body = String()
+    author_name = String(cost=3)
+
+
+class Post(ObjectType):
+    title = String()
+    comments = List(Comment, first=Int(), last=Int())
+
+
+class Query(ObjectType):
+    posts = List(Post, first=Int(), cost=10)
+    version = String()
+
+
+schema = Schema(query=Query)
+
+
+def run_query(query: str, max_cost: int, variables=None, **options):
+    result = None
+
+    def callback(query_costs):
+        nonlocal result
+        result = query_costs
+
+    errors = validate(
+        schema=schema.graphql_schema,
+        document_ast=parse(query),
+        rules=(
+            cost_analysis_validator(
+                max_cost=max_cost, variables=variables, callback=callback, **options
+            ),
+        ),
+    )
+
+    return errors, result
+
+
+def test_should_count_default_cost_of_scalar_fields():
+    errors, result = run_query("query Simple { version __typename }", 10)
+    assert not errors
+    assert result == {"Simple": 1}
+
+
+def test_should_use_field_cost_and_multiply_selections_by_first():
+    query = """
+    query Posts {
+      posts(first: 5) {
+        title
+        comments(first: 10) {
+          body
+          authorName
+        }
+      }
+    }
+    """
+    errors, result = run_query(query, 1000)
+    assert not errors
+    # posts: 10 + 5 * (title: 1 + comments: 1 + 10 * (body: 1 + authorName: 3))
+    assert result == {"Posts": 10 + 5 * (1 + 1 + 10 * (1 + 3))}
+
+
+def test_should_count_fragments():
+    query = """
+    query WithFragments {
+      posts(first: 2) {
+        ...PostFields
+        ... on Post {
+          title
+        }
+      }
+    }
+    fragment PostFields on Post {
+      comments(last: 3) {
+        body
+      }
+    }
+    """
+    errors, result = run_query(query, 1000)
+    assert not errors
+    assert result == {"WithFragments": 10 + 2 * (1 + 3 * 1 + 1)}
+
+
+def test_should_use_variables_and_their_defaults():
+    query = """
+    query Paginated($first: Int = 4) {
+      posts(first: $first) {
+        title
+      }
+    }
+    """
+    errors, result = run_query(query, 1000, variables={})
+    assert result == {"Paginated": 10 + 4}
+
+    errors, result = run_query(query, 1000, variables={"first": 20})
+    assert result == {"Paginated": 10 + 20}
+
+
+def test_should_charge_unknown_variables_max_multiplier():
+    query = """
+    query Paginated($first: Int = 4) {
+      posts(first: $first) {
+        comments(first: $first) {
+          body
+        }
+      }
+    }
+    """
+    errors, result = run_query(query, 1000)
+    assert result == {"Paginated": 10 + 100 * (1 + 100 * 1)}
+    assert len(errors) == 1
+
+    errors, result = run_query(query, 1000, max_multiplier=5)
+    assert result == {"Paginated": 10 + 5 * (1 + 5 * 1)}
+    assert not errors
+
+
+def test_should_use_cost_overrides():
+    errors, result = run_query(
+        "query Overridden { version }", 1000, costs={"Query.version": 7}
+    )
+    assert not errors
+    assert result == {"Overridden": 7}
+
+
+def test_should_catch_too_expensive_operation():
+    query = """
+    query Expensive {
+      posts(first: 100) {
+        comments(first: 100) {
+          authorName
+        }
+      }
+    }
+    """
+    errors, result = run_query(query, 1000)
+    assert len(errors) == 1
+    assert errors[0].message == "'Expensive' exceeds maximum operation cost of 1000."
+    assert result["Expensive"] > 1000
+
+
+def test_get_operation_costs():
+    document = parse(
+        """
+        query A { version }
+        query B { posts(first: 3) { title } }
+        """
+    )
+    assert get_operation_costs(schema, document) == {"A": 1, "B": 13}
+
+    document = parse("query C($n: Int) { posts(first: $n) { title } }")
+    assert get_operation_costs(schema, document, {"n": 10000}) == {"C": 10010}
+    assert get_operation_costs(schema, document, {}) == {"C": 11}
+
+
+def test_cost_analysis_instrumentation_reports_every_execution():
+    reported = []
+    instrumentation = CostAnalysisInstrumentation(
+        lambda costs, operation: reported.append((costs, operation.operation_name)),
+        costs={"Query.version": 2},
+    )
+    instrumented_schema = Schema(query=Query, instrumentation=[instrumentation])
+    query = "query Posts($n: Int) { posts(first: $n) { title } }"
+
+    for n in (3, 3, 50):
+        result = instrumented_schema.execute(query, variables={"n": n})
+        assert not result.errors
+    instrumented_schema.execute("{ version }")
+
+    assert instrumented_schema.document_cache.info().hits == 2
+    assert reported == [
+        ({"Posts": 13}, None),
+        ({"Posts": 13}, None),
+        ({"Posts": 60}, None),
+        ({"": 2}, None),
+    ]